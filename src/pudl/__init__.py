@@ -1,26 +1,45 @@
 """The Public Utility Data Liberation (PUDL) Project."""
 
+import importlib
 import importlib.metadata
 
-from . import (
-    analysis,
-    convert,
-    etl,
-    extract,
-    ferc_to_sqlite,
-    glue,
-    helpers,
-    io_managers,
-    logging_helpers,
-    metadata,
-    output,
-    transform,
-    validate,
-    workspace,
+from . import logging_helpers
+
+# Subpackages are imported the first time they're used, so that ``import pudl`` doesn't
+# pull in every optional analysis dependency. See :func:`__getattr__`.
+_SUBPACKAGES = (
+    "analysis",
+    "convert",
+    "etl",
+    "extract",
+    "ferc_to_sqlite",
+    "glue",
+    "helpers",
+    "io_managers",
+    "logging_helpers",
+    "metadata",
+    "output",
+    "transform",
+    "validate",
+    "workspace",
 )
+__all__ = list(_SUBPACKAGES)
 
 logging_helpers.configure_root_logger()
 
+
+def __getattr__(name: str):
+    """Import PUDL subpackages on first access, e.g. ``pudl.etl``."""
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported subpackages."""
+    return sorted(set(globals()) | set(_SUBPACKAGES))
+
+
 __author__ = "Catalyst Cooperative"
 __contact__ = "pudl@catalyst.coop"
 __maintainer__ = "Catalyst Cooperative"
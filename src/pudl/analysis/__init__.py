@@ -6,15 +6,34 @@ rich library of tools that show how the data can be put to use. We may also gene
 post-ETL derived database tables for distribution at some point.
 """
 
-from . import (
-    allocate_gen_fuel,
-    epacamd_eia,
-    fuel_by_plant,
-    mcoe,
-    plant_parts_eia,
-    record_linkage,
-    service_territory,
-    spatial,
-    state_demand,
-    timeseries_cleaning,
+import importlib
+
+# Several analyses depend on heavy optional libraries like scikit-learn, splink and
+# geopandas, so the modules are only imported the first time they're used.
+_MODULES = (
+    "allocate_gen_fuel",
+    "epacamd_eia",
+    "fuel_by_plant",
+    "mcoe",
+    "ml_tools",
+    "plant_parts_eia",
+    "record_linkage",
+    "rolling_window",
+    "service_territory",
+    "spatial",
+    "state_demand",
+    "timeseries_cleaning",
 )
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    """Import analysis modules on first access, e.g. ``pudl.analysis.mcoe``."""
+    if name in _MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported analysis modules."""
+    return sorted(set(globals()) | set(_MODULES))
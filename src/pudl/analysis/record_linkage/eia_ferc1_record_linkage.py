@@ -174,20 +174,16 @@ def get_input_dfs(inputs):
 @op
 def prepare_for_matching(df, transformed_df):
     """Prepare the input dataframes for matching with splink."""
-
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
-
     # replace old cols with transformed cols
     for col in transformed_df.columns:
         orig_col_name = col.split("__")[1]
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    for col in ["plant_name", "utility_name"]:
+        df[f"{col}_mphone"] = name_cleaner.apply_to_unique(
+            df[col], jellyfish.metaphone, key="metaphone"
+        )
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
@@ -1,17 +1,14 @@
 """Define a record linkage model interface and implement common functionality."""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy
 from dagster import Config, graph, op
-from numba import njit
-from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances
 from sklearn.neighbors import NearestNeighbors
+from sklearn.utils import gen_batches
 
 import pudl
 from pudl.analysis.ml_tools import experiment_tracking
@@ -32,90 +29,138 @@ class PenalizeReportYearDistanceConfig(Config):
 
 
 class DistanceMatrix:
-    """Class to wrap a distance matrix saved in a np.memmap."""
+    """Class to compute distances between records as they are needed.
+
+    A dense matrix of the distances between all pairs of records takes memory (or disk)
+    proportional to the square of the number of records. Instead, the feature matrix
+    and report years are kept, and distances are only computed for the pairs of
+    records that each step of the model needs. Neighbors are searched for in blocks of
+    records from each report year, since records from the same year are penalized and
+    are normally too far apart to be neighbors.
+    """
 
     def __init__(
         self,
-        feature_matrix: np.ndarray,
+        feature_matrix: np.ndarray | scipy.sparse.csr_matrix,
         original_df: pd.DataFrame,
         config: PenalizeReportYearDistanceConfig,
     ):
-        """Compute distance matrix from feature_matrix and write to memmap."""
-        self.file_buffer = TemporaryDirectory()
-
-        filename = Path(self.file_buffer.name) / "distance_matrix.dat"
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="w+",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
+        """Store the features and report year of each record."""
+        self.feature_matrix = feature_matrix
+        self.metric = config.metric
+        self.distance_penalty = config.distance_penalty
+        self.report_years = original_df["report_year"].to_numpy()
+        #: Positions of the records from each report year.
+        self.year_inds = original_df.groupby("report_year").indices
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return self.feature_matrix.shape[0]
+
+    def distances(self, rows: np.ndarray, cols: np.ndarray | None = None) -> np.ndarray:
+        """Distances between the records at two sets of positions.
+
+        Args:
+            rows: Positions of records.
+            cols: Positions of other records. Defaults to ``rows``.
+
+        Returns:
+            Dense matrix (rows, cols) of distances, with the penalty applied to records
+            from the same year, and zero distance between a record and itself.
+        """
+        cols = rows if cols is None else cols
+        distances = pairwise_distances(
+            self.feature_matrix[rows], self.feature_matrix[cols], metric=self.metric
+        ).astype("float32")
+        distances[
+            self.report_years[rows][:, None] == self.report_years[cols][None, :]
+        ] = self.distance_penalty
+        distances[rows[:, None] == cols[None, :]] = 0
+        return distances
+
+    def radius_neighbors_graph(self, radius: float) -> scipy.sparse.csr_matrix:
+        """Sparse graph of the distances between records that are within a radius.
+
+        Each report year is searched for neighbors among the records from all other
+        years, so only candidate pairs of records are stored.
+
+        Args:
+            radius: Maximum distance between neighbors.
+
+        Returns:
+            Sparse matrix with the distance between each pair of neighbors. Like
+            :meth:`sklearn.neighbors.NearestNeighbors.radius_neighbors_graph`, records
+            are not their own neighbors.
+        """
+        rows, cols, data = [np.empty(0, dtype=int)], [np.empty(0, dtype=int)], [[]]
+        for year, year_inds in self.year_inds.items():
+            other_inds = np.flatnonzero(self.report_years != year)
+            if len(other_inds) == 0:
+                continue
+            neighbor_computer = NearestNeighbors(radius=radius, metric=self.metric)
+            neighbor_computer.fit(self.feature_matrix[other_inds])
+            year_graph = neighbor_computer.radius_neighbors_graph(
+                self.feature_matrix[year_inds], mode="distance"
+            ).tocoo()
+            rows.append(year_inds[year_graph.row])
+            cols.append(other_inds[year_graph.col])
+            data.append(year_graph.data)
+            if self.distance_penalty <= radius:
+                # Records from the same year are neighbors at the penalty distance
+                same_year = ~np.eye(len(year_inds), dtype=bool)
+                rows.append(np.repeat(year_inds, len(year_inds))[same_year.ravel()])
+                cols.append(np.tile(year_inds, len(year_inds))[same_year.ravel()])
+                data.append(np.full(same_year.sum(), self.distance_penalty))
+        return scipy.sparse.csr_matrix(
+            (
+                np.concatenate(data).astype("float32"),
+                (np.concatenate(rows), np.concatenate(cols)),
+            ),
+            shape=(len(self), len(self)),
         )
 
-        # Compute distances in chunks and write to memmap
-        row_start = 0
-        for chunk in pairwise_distances_chunked(feature_matrix, metric=config.metric):
-            self.distance_matrix[row_start : row_start + len(chunk), :] = chunk[:, :]
-            self.distance_matrix.flush()
-            row_start += len(chunk)
-
-        # Apply distance penalty to records from the same year
-        year_inds = original_df.groupby("report_year").indices
-        for inds in year_inds.values():
-            matching_year_inds = np.array(np.meshgrid(inds, inds)).T.reshape(-1, 2)
-            self.distance_matrix[matching_year_inds[:, 0], matching_year_inds[:, 1]] = (
-                config.distance_penalty
-            )
-
-        np.fill_diagonal(self.distance_matrix, 0)
-        self.distance_matrix.flush()
-
-        # Convert distance matrix to read only memory map
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="r",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
+    def average_cluster_distances(
+        self, cluster_groups: list[np.ndarray], block_size: int = 2**22
+    ) -> np.ndarray:
+        """Compute average distance between clusters of records.
+
+        Distances are computed for blocks of rows at a time, with up to
+        ``block_size`` distances in each block, and summed up for each pair of clusters
+        with a sparse matrix of cluster membership.
+
+        Args:
+            cluster_groups: Positions of the records in each cluster. Each record is in
+                at most one cluster.
+            block_size: Maximum number of distances to compute at once. Small blocks
+                stay in the CPU cache and use less memory.
+
+        Returns:
+            Matrix (n_clusters, n_clusters) with the total distance between the records
+            of each pair of clusters, divided by the number of records in both.
+        """
+        sizes = np.array([len(inds) for inds in cluster_groups])
+        membership = scipy.sparse.csr_matrix(
+            (
+                np.ones(sizes.sum()),
+                (
+                    np.concatenate(cluster_groups),
+                    np.repeat(np.arange(len(sizes)), sizes),
+                ),
+            ),
+            shape=(len(self), len(sizes)),
         )
+        all_inds = np.arange(len(self))
+        total_dist = np.zeros((len(sizes), len(sizes)))
+        for batch in gen_batches(len(self), max(1, block_size // len(self))):
+            distances = self.distances(all_inds[batch], all_inds)
+            total_dist += membership[batch].T @ (membership.T @ distances.T).T
 
+        average_dist = total_dist / (sizes[:, None] + sizes[None, :])
+        np.fill_diagonal(average_dist, 0)
+        return average_dist
 
-def get_cluster_distance_matrix(
-    distance_matrix: np.ndarray, cluster_inds: np.ndarray
-) -> np.ndarray:
-    """Return a distance matrix with only distances within a cluster."""
-    cluster_size = len(cluster_inds)
-    dist_inds = np.array(np.meshgrid(cluster_inds, cluster_inds)).T.reshape(-1, 2)
-    return distance_matrix[dist_inds[:, 0], dist_inds[:, 1]].reshape(
-        (cluster_size, cluster_size)
-    )
-
-
-@njit
-def get_average_distance_matrix(
-    distance_matrix: np.ndarray,
-    cluster_groups: list[list[int]],
-) -> np.ndarray:
-    """Compute average distance between two clusters of records given indices of each cluster."""
-    # Prepare a distance matrix of (n_clusters x n_clusters)
-    # Distance matrix contains average distance between each cluster
-    n_clusters = len(cluster_groups)
-    average_dist_matrix = np.zeros((n_clusters, n_clusters))
-
-    # Heavy nested looping optimized by numba
-    for i, cluster_i in enumerate(cluster_groups):
-        for j, cluster_j in enumerate(cluster_groups[:i]):
-            total_dist = 0
-            for cluster_i_ind in cluster_i:
-                for cluster_j_ind in cluster_j:
-                    total_dist += distance_matrix[cluster_i_ind, cluster_j_ind]
-
-            average_dist = total_dist / (len(cluster_i) + len(cluster_j))
-            average_dist_matrix[i, j] = average_dist
-            average_dist_matrix[j, i] = average_dist
 
-    return average_dist_matrix
-
-
-@op(tags={"memory-use": "high"})
+@op
 def compute_distance_with_year_penalty(
     config: PenalizeReportYearDistanceConfig,
     feature_matrix: FeatureMatrix,
@@ -143,9 +188,7 @@ def cluster_records_dbscan(
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
     # DBSCAN is very efficient when passed a sparse radius neighbor graph
-    neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
-    neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
+    neighbor_graph = distance_matrix.radius_neighbors_graph(config.eps)
 
     # Classify records
     classifier = DBSCAN(metric="precomputed", eps=config.eps, min_samples=2)
@@ -218,9 +261,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = distance_matrix.distances(cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -270,15 +311,12 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
-    )
+    average_dist_matrix = distance_matrix.average_cluster_distances(cluster_groups)
 
     # Assign new labels to all points
     new_labels = classifier.fit_predict(average_dist_matrix)
@@ -1,17 +1,27 @@
 """This module contains the implementation of CompanyNameCleaner class from OS-Climate's financial-entity-cleaner package."""
 
 import enum
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import cached_property
 from importlib.resources import files
-from typing import Literal
+from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+#: Number of sets of unique values whose results are memoized by
+#: :func:`apply_to_unique`.
+UNIQUE_RESULTS_CACHE_SIZE = 32
+_unique_results: OrderedDict[tuple[Hashable, str], np.ndarray] = OrderedDict()
+
 CLEANING_RULES_DICT = {
     "remove_email": [" ", r"\S*@\S*\s?"],
     "remove_url": [" ", r"https*\S+"],
@@ -101,81 +111,42 @@ class CompanyNameCleaner(BaseModel):
     #: Define if the letters with accents are replaced with non-accented ones
     remove_accents: bool = False
 
-    def _apply_regex_rules(
-        self, str_value: str, dict_regex_rules: dict[str, list[str]]
-    ) -> str:
-        r"""Applies several cleaning rules based on a custom dictionary.
-
-        The dictionary must contain cleaning rules written in regex format.
-
-        Arguments:
-            str_value (str): any value as string to be cleaned up.
-            dict_regex_rules (dict): a dictionary of cleaning rules writen in regex with the format
-                [rule name] : ['replacement', 'regex rule']
+    @cached_property
+    def _cleaning_regexes(self) -> list[tuple[re.Pattern, str, bool]]:
+        """Compile the cleaning rules in the order they are applied.
 
         Returns:
-            (str): the modified/cleaned value.
+            The compiled regex of each rule, its replacement, and whether the word
+            "the" should be placed at the beginning of names that match it.
         """
-        clean_value = str_value
-        # Iterate through the dictionary and apply each regex rule
-        for name_rule, cleaning_rule in dict_regex_rules.items():
-            # First element is the replacement
-            replacement = cleaning_rule[0]
-            # Second element is the regex rule
-            regex_rule = cleaning_rule[1]
-
+        cleaning_dict = {
+            rule_name: CLEANING_RULES_DICT[rule_name]
+            for rule_name in self.cleaning_rules_list
+        }
+        regexes = []
+        for name_rule, (replacement, regex_rule) in cleaning_dict.items():
             # Check if the regex rule is actually a reference to another regex rule.
-            # By adding a name of another regex rule in the place of the rule itself allows the execution
-            # of a regex rule twice
-            if regex_rule in dict_regex_rules:
-                replacement = dict_regex_rules[cleaning_rule[1]][0]
-                regex_rule = dict_regex_rules[cleaning_rule[1]][1]
-
-            # Make sure to use raw string
-            regex_rule = rf"{regex_rule}"
-
-            # Treat the special case of the word THE at the end of a text's name
-            found_the_word_the = None
-            if name_rule == "place_word_the_at_the_beginning":
-                found_the_word_the = re.search(regex_rule, clean_value)
-
-            # Apply the regex rule
-            clean_value = re.sub(regex_rule, replacement, clean_value)
-
-            # Adjust the name for the case of rule <place_word_the_at_the_beginning>
-            if found_the_word_the is not None:
-                clean_value = "the " + clean_value
-
-        return clean_value
-
-    def _remove_unicode_chars(self, value: str) -> str:
-        """Removes unicode character that is unreadable when converted to ASCII format.
+            # By adding a name of another regex rule in the place of the rule itself
+            # allows the execution of a regex rule twice
+            if regex_rule in cleaning_dict:
+                replacement, regex_rule = cleaning_dict[regex_rule]
+            regexes.append(
+                (
+                    re.compile(regex_rule),
+                    replacement,
+                    name_rule == "place_word_the_at_the_beginning",
+                )
+            )
+        return regexes
 
-        Arguments:
-            value (str): any string containing unicode characters.
+    @cached_property
+    def _legal_term_regexes(self) -> tuple[re.Pattern, list[tuple[re.Pattern, str]]]:
+        """Compile the regexes used to normalize legal terms.
 
         Returns:
-            (str): the corresponding input string without unicode characters.
+            A regex combining all of the legal terms, and the compiled regex of each
+            legal term with its replacement, in the order they are applied.
         """
-        # Remove all unicode characters if any
-        clean_value = value.encode("ascii", "ignore").decode()
-        return clean_value
-
-    def _apply_cleaning_rules(self, company_name: str) -> str:
-        """Apply the cleaning rules from the dictionary of regex rules."""
-        cleaning_dict = {}
-        for rule_name in self.cleaning_rules_list:
-            cleaning_dict[rule_name] = CLEANING_RULES_DICT[rule_name]
-
-        # Apply all the cleaning rules
-        clean_company_name = self._apply_regex_rules(company_name, cleaning_dict)
-        return clean_company_name
-
-    def _apply_normalization_of_legal_terms(self, company_name: str) -> str:
-        """Apply the normalizattion of legal terms according to dictionary of regex rules."""
-        # Make sure to remove extra spaces, so legal terms can be found in the end (if requested)
-        clean_company_name = company_name.strip()
-
         # The dictionary of legal terms define how to normalize the text's legal form abreviations
         json_source = files("pudl.package_data.settings").joinpath(
             self.__NAME_LEGAL_TERMS_DICT_FILE
@@ -185,13 +156,12 @@ class CompanyNameCleaner(BaseModel):
                 self.__NAME_JSON_ENTRY_LEGAL_TERMS
             ]["en"]
 
-        # Apply normalization for legal terms
         # Iterate through the dictionary of legal terms
+        regexes = []
         for replacement, legal_terms in _dict_legal_terms.items():
             # Each replacement has a list of possible terms to be searched for
             replacement = " " + replacement.lower() + " "
             for legal_term in legal_terms:
-                # Make sure to use raw string
                 legal_term = legal_term.lower()
                 # If the legal term has . (dots), then apply regex directly on the legal term
                 # Otherwise, if it's a legal term with only letters in sequence, make sure
@@ -203,10 +173,46 @@ class CompanyNameCleaner(BaseModel):
                 # Check if the legal term should be found only at the end of the string
                 if self.legal_term_location == LegalTermLocation.AT_THE_END:
                     legal_term = legal_term + "$"
-                # ...and it's a raw string
-                regex_rule = rf"{legal_term}"
-                # Apply the replacement
-                clean_company_name = re.sub(regex_rule, replacement, clean_company_name)
+                regexes.append((re.compile(legal_term), replacement))
+        combined = re.compile("|".join(regex.pattern for regex, _ in regexes))
+        return combined, regexes
+
+    def _remove_unicode_chars(self, value: str) -> str:
+        """Removes unicode character that is unreadable when converted to ASCII format.
+
+        Arguments:
+            value (str): any string containing unicode characters.
+
+        Returns:
+            (str): the corresponding input string without unicode characters.
+        """
+        # Remove all unicode characters if any
+        clean_value = value.encode("ascii", "ignore").decode()
+        return clean_value
+
+    def _apply_cleaning_rules(self, company_name: str) -> str:
+        """Apply the cleaning rules from the dictionary of regex rules."""
+        clean_company_name = company_name
+        for regex, replacement, place_word_the in self._cleaning_regexes:
+            # Treat the special case of the word THE at the end of a text's name
+            found_the_word_the = place_word_the and regex.search(clean_company_name)
+            clean_company_name = regex.sub(replacement, clean_company_name)
+            if found_the_word_the:
+                clean_company_name = "the " + clean_company_name
+        return clean_company_name
+
+    def _apply_normalization_of_legal_terms(self, company_name: str) -> str:
+        """Apply the normalizattion of legal terms according to dictionary of regex rules."""
+        # Make sure to remove extra spaces, so legal terms can be found in the end (if requested)
+        clean_company_name = company_name.strip()
+
+        # Most names don't contain any legal terms. If none of them match the name,
+        # none of the replacements below would change it.
+        combined, regexes = self._legal_term_regexes
+        if not combined.search(clean_company_name):
+            return clean_company_name
+        for regex, replacement in regexes:
+            clean_company_name = regex.sub(replacement, clean_company_name)
         return clean_company_name
 
     def get_clean_data(self, company_name: str) -> str:
@@ -272,13 +278,53 @@ class CompanyNameCleaner(BaseModel):
             df (dataframe): the clean version of the input dataframe
         """
         if isinstance(df, pd.DataFrame) and len(df.columns) > 1:
-            clean_df = pd.DataFrame()
-            for col in df.columns:
-                clean_df = pd.concat(
-                    [clean_df, df[col].apply(self.get_clean_data)], axis=1
-                )
-            return clean_df
-        out = df.squeeze().apply(self.get_clean_data)
+            return pd.concat(
+                [self._clean_series(df[col]) for col in df.columns], axis=1
+            )
+        out = self._clean_series(df.iloc[:, 0] if isinstance(df, pd.DataFrame) else df)
         if return_as_dframe:
             return out.to_frame()
         return out
+
+    def _clean_series(self, ser: pd.Series) -> pd.Series:
+        """Clean each unique name in a series."""
+        return apply_to_unique(
+            ser, self.get_clean_data, key=self.model_dump_json(), na_value=pd.NA
+        )
+
+
+def apply_to_unique(
+    ser: pd.Series, func: Callable[[Any], Any], key: Hashable, na_value: Any = None
+) -> pd.Series:
+    """Apply a function to each unique non-null value in a series.
+
+    Names and other strings used in record linkage are repeated many times, so they are
+    only cleaned or encoded once. The results for the unique values are also memoized,
+    keyed on ``key`` and a hash of the unique values, so that running a model again on
+    the same data in the same process doesn't repeat the work.
+
+    Args:
+        ser: Values to apply the function to.
+        func: Function of a single value.
+        key: Identifies the function and any configuration that changes its results.
+        na_value: Result for null values, which aren't passed to the function.
+
+    Returns:
+        Result of the function for each value, with the index and name of ``ser``.
+    """
+    codes, uniques = pd.factorize(ser)
+    uniques = np.asarray(uniques, dtype=object)
+    digest = hashlib.sha256(pd.util.hash_array(uniques).tobytes()).hexdigest()
+    cache_key = (key, digest)
+    if cache_key in _unique_results:
+        _unique_results.move_to_end(cache_key)
+        results = _unique_results[cache_key]
+    else:
+        # The last result is for null values, which have a code of -1
+        results = np.array(
+            [func(value) for value in uniques] + [na_value], dtype=object
+        )
+        _unique_results[cache_key] = results
+        if len(_unique_results) > UNIQUE_RESULTS_CACHE_SIZE:
+            _unique_results.popitem(last=False)
+    return pd.Series(results[codes], index=ser.index, name=ser.name)
@@ -0,0 +1,230 @@
+"""Rolling window statistics of multivariate timeseries, compiled with numba.
+
+The rolling medians and interquartile ranges used to screen timeseries for anomalies
+(see :mod:`pudl.analysis.timeseries_cleaning`) are computed here without building
+intermediate :class:`pandas.DataFrame` objects. The compiled kernels release the GIL,
+so groups of columns are processed in parallel threads.
+
+Order statistics of each window are found with a Fenwick (binary indexed) tree of the
+counts of the values in the window, indexed by the rank of each value in its column.
+Adding or removing a value and finding the k-th smallest value in the window each take
+O(log n) time, so a column of n values is processed in O(n log n) time regardless of
+the width of the window.
+
+Windows are centered and ignore null values, like
+``pd.DataFrame.rolling(window, min_periods=1, center=True)``: the window at position
+``i`` covers positions ``i - window // 2`` through ``i + (window - 1) // 2``.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from numba import njit
+
+
+@njit(nogil=True, cache=True)
+def _fenwick_add(tree: np.ndarray, index: int, delta: int) -> None:
+    """Add `delta` to the count of the value with rank `index`."""
+    index += 1
+    while index < len(tree):
+        tree[index] += delta
+        index += index & -index
+
+
+@njit(nogil=True, cache=True)
+def _fenwick_kth(tree: np.ndarray, k: int, step: int) -> int:
+    """Rank of the k-th (0-based) smallest value counted in the tree.
+
+    `step` is the largest power of two that is not larger than the number of ranks.
+    """
+    index = 0
+    remaining = k + 1
+    while step:
+        next_index = index + step
+        if next_index < len(tree) and tree[next_index] < remaining:
+            index = next_index
+            remaining -= tree[next_index]
+        step >>= 1
+    return index
+
+
+@njit(nogil=True, cache=True)
+def _window_quantile(
+    tree: np.ndarray, sorted_values: np.ndarray, count: int, quantile: float, step: int
+) -> float:
+    """Quantile of the `count` values in a window, interpolated linearly."""
+    position = quantile * (count - 1)
+    k = int(position)
+    fraction = position - k
+    low = sorted_values[_fenwick_kth(tree, k, step)]
+    if fraction == 0:
+        return low
+    high = sorted_values[_fenwick_kth(tree, k + 1, step)]
+    if quantile == 0.5:
+        # Average the middle values exactly, like a rolling median
+        return (low + high) / 2
+    return low + (high - low) * fraction
+
+
+@njit(nogil=True, cache=True)
+def _rolling_quantiles(x: np.ndarray, window: int, quantiles: np.ndarray) -> np.ndarray:
+    """Rolling quantiles of each column of `x`, with shape (quantiles, rows, columns)."""
+    n, m = x.shape
+    out = np.full((len(quantiles), n, m), np.nan)
+    before = window // 2
+    after = (window - 1) // 2
+    step = 1
+    while step * 2 <= n:
+        step *= 2
+    for col in range(m):
+        values = np.ascontiguousarray(x[:, col])
+        is_null = np.isnan(values)
+        order = np.argsort(np.where(is_null, np.inf, values), kind="mergesort")
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(n)
+        sorted_values = values[order]
+        tree = np.zeros(n + 1, dtype=np.int64)
+        count = 0
+        start = 0
+        end = -1
+        for i in range(n):
+            while end < min(n - 1, i + after):
+                end += 1
+                if not is_null[end]:
+                    _fenwick_add(tree, rank[end], 1)
+                    count += 1
+            while start < i - before:
+                if not is_null[start]:
+                    _fenwick_add(tree, rank[start], -1)
+                    count -= 1
+                start += 1
+            if count == 0:
+                continue
+            for q in range(len(quantiles)):
+                out[q, i, col] = _window_quantile(
+                    tree, sorted_values, count, quantiles[q], step
+                )
+    return out
+
+
+def _map_columns(kernel: Callable, x: np.ndarray, *args) -> np.ndarray:
+    """Apply a compiled kernel to groups of columns of `x` in parallel threads.
+
+    Threads only live for the duration of the call, so that processes can be forked
+    safely afterwards.
+    """
+    x = np.asarray(x, dtype=float)
+    workers = min(os.cpu_count() or 1, x.shape[1])
+    if workers <= 1:
+        return kernel(x, *args)
+    columns = np.array_split(np.arange(x.shape[1]), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda cols: kernel(x[:, cols], *args), columns)
+        return np.concatenate(list(results), axis=-1)
+
+
+def rolling_quantiles(
+    x: np.ndarray, window: int, quantiles: Sequence[float]
+) -> np.ndarray:
+    """Rolling quantiles of the columns of a matrix.
+
+    Quantiles are linearly interpolated between the non-null values in each window,
+    as in :meth:`pandas.core.window.rolling.Rolling.quantile`.
+
+    Args:
+        x: Matrix (rows, columns) with null values to ignore.
+        window: Number of values in the centered moving window.
+        quantiles: Quantiles to compute, between 0 and 1.
+
+    Returns:
+        Rolling quantiles with shape (len(quantiles), rows, columns).
+        Null where the window has no values.
+
+    Examples:
+        >>> x = np.array([[1.0], [3.0], [np.nan], [2.0], [10.0]])
+        >>> rolling_quantiles(x, window=3, quantiles=[0.5])[0, :, 0]
+        array([2. , 2. , 2.5, 6. , 6. ])
+    """
+    return _map_columns(
+        _rolling_quantiles, x, window, np.asarray(quantiles, dtype=float)
+    )
+
+
+def rolling_median(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling median of the columns of a matrix.
+
+    Equivalent to ``pd.DataFrame(x).rolling(window, min_periods=1, center=True)
+    .median()``.
+
+    Args:
+        x: Matrix (rows, columns) with null values to ignore.
+        window: Number of values in the centered moving window.
+    """
+    return rolling_quantiles(x, window, [0.5])[0]
+
+
+def rolling_iqr(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling interquartile range (IQR) of the columns of a matrix.
+
+    Both quartiles are found in a single pass over each column.
+
+    Args:
+        x: Matrix (rows, columns) with null values to ignore.
+        window: Number of values in the centered moving window.
+    """
+    q25, q75 = rolling_quantiles(x, window, [0.25, 0.75])
+    return q75 - q25
+
+
+@njit(nogil=True, cache=True)
+def _shifted_nanmedian(x: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    """Median of the non-null values of `x` shifted by each of `shifts` rows."""
+    n, m = x.shape
+    out = np.full((n, m), np.nan)
+    for col in range(m):
+        values = np.ascontiguousarray(x[:, col])
+        buffer = np.empty(len(shifts))
+        for i in range(n):
+            # Insertion sort of the few shifted values into the buffer
+            count = 0
+            for shift in shifts:
+                j = i - shift
+                if 0 <= j < n and not np.isnan(values[j]):
+                    k = count
+                    while k > 0 and buffer[k - 1] > values[j]:
+                        buffer[k] = buffer[k - 1]
+                        k -= 1
+                    buffer[k] = values[j]
+                    count += 1
+            if count == 0:
+                continue
+            middle = count // 2
+            if count % 2:
+                out[i, col] = buffer[middle]
+            else:
+                out[i, col] = (buffer[middle - 1] + buffer[middle]) / 2
+    return out
+
+
+def shifted_nanmedian(x: np.ndarray, shifts: Sequence[int]) -> np.ndarray:
+    """Median of copies of a matrix shifted by different numbers of rows.
+
+    Equivalent to shifting `x` by each of `shifts` rows (positive shifts move values
+    down, like :meth:`pandas.DataFrame.shift`) and taking :func:`numpy.nanmedian` of
+    the stacked copies, but without the copies.
+
+    Args:
+        x: Matrix (rows, columns) with null values to ignore.
+        shifts: Number of rows to shift `x` by.
+
+    Returns:
+        Median of the shifted values at each position. Null if all are null.
+
+    Examples:
+        >>> x = np.array([[1.0], [2.0], [4.0], [8.0]])
+        >>> shifted_nanmedian(x, shifts=[-1, 0, 1])[:, 0]
+        array([1.5, 2. , 4. , 6. ])
+    """
+    return _map_columns(_shifted_nanmedian, x, np.asarray(shifts, dtype=np.int64))
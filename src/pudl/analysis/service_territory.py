@@ -6,18 +6,22 @@ the historical spatial extent of utility and balancing area territories. Output
 resulting geometries for use in other applications.
 """
 
+import hashlib
 import math
 import pathlib
 import sys
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
 
 import click
 import geopandas as gpd
 import pandas as pd
+import shapely
 import sqlalchemy as sa
 from dagster import AssetsDefinition, Field, asset
 from matplotlib import pyplot as plt
+from shapely.geometry.base import BaseGeometry
 
 import pudl
 from pudl.workspace.setup import PudlPaths
@@ -122,11 +126,138 @@ def get_territory_fips(
     )
 
 
+class CountyGeometryCache:
+    """Memoized unions of county geometries, keyed on sets of county FIPS IDs.
+
+    Most utilities and balancing authorities serve the same set of counties year after
+    year, and many of them serve the same counties as each other, so each distinct set
+    of counties only needs to be dissolved once. Unions can be saved to a GeoParquet
+    file so that they're reused the next time service territories are compiled.
+
+    Unions are also keyed on a hash of the county geometries they were made from, so
+    that stale geometries are never reused if the census geometries change. Only the
+    unions of the most recently used county geometries are kept, so the cache never
+    holds more than one union for each distinct set of counties.
+    """
+
+    def __init__(self, path: pathlib.Path | None = None):
+        """Create an empty cache, or load one saved to a file.
+
+        Args:
+            path: GeoParquet file to load unions from and save new unions to. If None,
+                unions are only kept in memory.
+        """
+        self.path = path
+        self._unions: dict[tuple[str, frozenset[str]], BaseGeometry] = {}
+        if path is not None and path.exists():
+            saved = gpd.read_parquet(path)
+            county_sets = saved.county_id_fips.map(frozenset)
+            self._unions = dict(
+                zip(
+                    zip(saved.source, county_sets, strict=True),
+                    saved.geometry,
+                    strict=True,
+                )
+            )
+
+    def __len__(self) -> int:
+        """Number of cached unions."""
+        return len(self._unions)
+
+    def union(
+        self, county_sets: pd.Series, county_geoms: gpd.GeoSeries, workers: int = 1
+    ) -> gpd.GeoSeries:
+        """Union the geometries of each set of counties.
+
+        Cached unions of any other county geometries are dropped.
+
+        Args:
+            county_sets: Frozen sets of county FIPS IDs.
+            county_geoms: Geometry of each county, indexed by county FIPS ID.
+            workers: Number of worker processes to compute new unions with. If 1,
+                unions are computed one after another in this process.
+
+        Returns:
+            The union of the geometries of each set of counties, with the index of
+            ``county_sets``. Counties without geometries are left out.
+        """
+        source = hashlib.sha256(
+            b"".join(shapely.to_wkb(county_geoms.to_numpy()))
+            + ",".join(county_geoms.index).encode()
+        ).hexdigest()
+        stale = [key for key in self._unions if key[0] != source]
+        if stale:
+            logger.info(
+                f"Dropping {len(stale)} cached unions of other county geometries."
+            )
+            for key in stale:
+                del self._unions[key]
+        new_sets = [
+            county_set
+            for county_set in county_sets.unique()
+            if (source, county_set) not in self._unions
+        ]
+        logger.info(
+            f"Dissolving {len(new_sets)} sets of counties, and reusing "
+            f"{county_sets.nunique() - len(new_sets)} cached geometries."
+        )
+        if new_sets:
+            all_geoms = county_geoms.to_numpy()
+            geoms = []
+            for county_set in new_sets:
+                inds = county_geoms.index.get_indexer(sorted(county_set))
+                geoms.append(all_geoms[inds[inds >= 0]])
+            if workers > 1 and len(new_sets) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    unions = list(
+                        executor.map(
+                            shapely.union_all,
+                            geoms,
+                            chunksize=math.ceil(len(geoms) / (4 * workers)),
+                        )
+                    )
+            else:
+                unions = [shapely.union_all(geom) for geom in geoms]
+            self._unions |= {
+                (source, county_set): union
+                for county_set, union in zip(new_sets, unions, strict=True)
+            }
+        if stale or new_sets:
+            self.save()
+        return gpd.GeoSeries(
+            [self._unions[(source, county_set)] for county_set in county_sets],
+            index=county_sets.index,
+            crs=county_geoms.crs,
+        )
+
+    def save(self) -> None:
+        """Save all of the cached unions to ``path``, if the cache has one."""
+        if self.path is None:
+            return
+        if not self._unions:
+            self.path.unlink(missing_ok=True)
+            return
+        sources, county_sets = zip(*self._unions, strict=True)
+        gpd.GeoDataFrame(
+            {
+                "source": sources,
+                "county_id_fips": [sorted(ids) for ids in county_sets],
+            },
+            geometry=list(self._unions.values()),
+        ).to_parquet(self.path, index=False)
+
+
+#: Unions shared by all of the service territories compiled in a process.
+COUNTY_GEOMETRY_CACHE = CountyGeometryCache()
+
+
 def add_geometries(
     df: pd.DataFrame,
     census_gdf: gpd.GeoDataFrame,
     dissolve: bool = False,
     dissolve_by: list[str] = None,
+    geometry_cache: CountyGeometryCache | None = None,
+    workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Merge census geometries into dataframe on county_id_fips, optionally dissolving.
 
@@ -146,22 +277,25 @@ def add_geometries(
             dissolve_by=["report_date", "utility_id_eia"] might provide annual utility
             service territories, while ["report_date", "balancing_authority_id_eia"]
             would provide annual balancing authority territories.
+        geometry_cache: Unions of sets of counties that have already been dissolved.
+            Defaults to :data:`COUNTY_GEOMETRY_CACHE`.
+        workers: Number of worker processes used to dissolve new sets of counties.
 
     Returns:
         geopandas.GeoDataFrame
     """
+    counties = census_gdf[["geoid10", "namelsad10", "dp0010001", "geometry"]].rename(
+        columns={
+            "geoid10": "county_id_fips",
+            "namelsad10": "county_name_census",
+            "dp0010001": "population",
+        }
+    )
     out_gdf = (
-        census_gdf[["geoid10", "namelsad10", "dp0010001", "geometry"]]
-        .rename(
-            columns={
-                "geoid10": "county_id_fips",
-                "namelsad10": "county_name_census",
-                "dp0010001": "population",
-            }
-        )
         # Calculate county areas using cylindrical equal area projection:
-        .assign(area_km2=lambda x: x.geometry.to_crs(epsg=6933).area / 1e6)
-        .merge(df, how="right")
+        counties.assign(
+            area_km2=lambda x: x.geometry.to_crs(epsg=6933).area / 1e6
+        ).merge(df, how="right")
     )
     if dissolve is True:
         # Don't double-count duplicated counties, if any.
@@ -175,19 +309,40 @@ def add_geometries(
         summed = (
             out_gdf.groupby(dissolve_by)[["population", "area_km2"]].sum().reset_index()
         )
+        county_cols = [
+            "county_id_fips",
+            "county",
+            "county_name_census",
+            "state",
+            "state_id_fips",
+            "population",
+            "area_km2",
+        ]
+        grouped = out_gdf.groupby(dissolve_by)
+        # Each distinct set of counties is only dissolved once
+        county_sets = (
+            out_gdf.dropna(subset="county_id_fips")
+            .groupby(dissolve_by)["county_id_fips"]
+            .agg(frozenset)
+            .reindex(grouped.size().index)
+        )
+        county_sets = county_sets.where(county_sets.notna(), frozenset())
+        if geometry_cache is None:
+            geometry_cache = COUNTY_GEOMETRY_CACHE
+        geometry = geometry_cache.union(
+            county_sets,
+            counties.set_index("county_id_fips").geometry,
+            workers=workers,
+        )
         out_gdf = (
-            out_gdf.dissolve(by=dissolve_by)
-            .drop(
-                [
-                    "county_id_fips",
-                    "county",
-                    "county_name_census",
-                    "state",
-                    "state_id_fips",
-                    "population",
-                    "area_km2",
-                ],
-                axis="columns",
+            gpd.GeoDataFrame(
+                geometry.rename("geometry").to_frame(),
+                crs=census_gdf.crs,
+            )
+            .join(
+                grouped[
+                    out_gdf.columns.drop(dissolve_by + county_cols + ["geometry"])
+                ].first()
             )
             .reset_index()
             .merge(summed)
@@ -203,6 +358,8 @@ def get_territory_geometries(
     census_gdf: gpd.GeoDataFrame,
     limit_by_state: bool = True,
     dissolve: bool = False,
+    geometry_cache: CountyGeometryCache | None = None,
+    workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Compile service territory geometries based on county_id_fips.
 
@@ -214,10 +371,12 @@ def get_territory_geometries(
     each combination of entity and year.
 
     Note:
-        Dissolving geometires is a costly operation, and may take half an hour or more
-        if you are processing all entities for all years. Dissolving also means that all
-        the per-county information will be lost, rendering the output inappropriate for
-        use in many analyses. Dissolving is mostly useful for generating visualizations.
+        Dissolving geometires is a costly operation. Each distinct set of counties is
+        only dissolved once, and the results are kept in ``geometry_cache``, but
+        dissolving all entities for all years for the first time can still take several
+        minutes. Dissolving also means that all the per-county information will be
+        lost, rendering the output inappropriate for use in many analyses. Dissolving is
+        mostly useful for generating visualizations.
 
     Args:
         ids: A collection of EIA balancing authority IDs.
@@ -240,6 +399,9 @@ def get_territory_geometries(
             county-level geometries for each utility in each year will be merged
             together ("dissolved") resulting in a single geometry and record for each
             balancing_authority-year.
+        geometry_cache: Unions of sets of counties that have already been dissolved.
+            Defaults to :data:`COUNTY_GEOMETRY_CACHE`.
+        workers: Number of worker processes used to dissolve new sets of counties.
 
     Returns:
         A GeoDataFrame with service territory geometries for each entity.
@@ -255,6 +417,8 @@ def get_territory_geometries(
         census_gdf,
         dissolve=dissolve,
         dissolve_by=["report_date", assn_col],
+        geometry_cache=geometry_cache,
+        workers=workers,
     )
 
 
@@ -307,6 +471,8 @@ def compile_geoms(
     dissolve: bool = False,
     limit_by_state: bool = True,
     years: list[int] = [],
+    geometry_cache: CountyGeometryCache | None = None,
+    workers: int = 1,
 ) -> pd.DataFrame:
     """Compile all available utility or balancing authority geometries.
 
@@ -314,6 +480,11 @@ def compile_geoms(
     geometry column removed depending on the value of the save_format parameter. By
     default, this returns only counties with observed EIA 861 data for a utility or
     balancing authority, with geometries available at the county level.
+
+    Dissolved geometries are kept in ``geometry_cache``, which defaults to
+    :data:`COUNTY_GEOMETRY_CACHE`, so compiling utility and balancing authority
+    territories in the same process only dissolves each set of counties once. New sets
+    of counties are dissolved by ``workers`` worker processes.
     """
     logger.info(
         f"Compiling {entity_type} geometries with {dissolve=}, {limit_by_state=}, "
@@ -367,6 +538,8 @@ def compile_geoms(
         census_gdf=census_counties,
         limit_by_state=limit_by_state,
         dissolve=dissolve,
+        geometry_cache=geometry_cache,
+        workers=workers,
     )
     if save_format == "geoparquet":
         # TODO[dagster]: update to use IO Manager.
@@ -414,6 +587,11 @@ def service_territory_asset_factory(
                     "Format of output in PUDL. One of: geoparquet, geodataframe, dataframe."
                 ),
             ),
+            "workers": Field(
+                int,
+                default_value=1,
+                description="Number of worker processes used to dissolve geometries.",
+            ),
         },
         compute_kind="Python",
     )
@@ -435,6 +613,7 @@ def service_territory_asset_factory(
         dissolve = context.op_config["dissolve"]
         limit_by_state = context.op_config["limit_by_state"]
         save_format = context.op_config["save_format"]
+        workers = context.op_config["workers"]
 
         return compile_geoms(
             core_eia861__yearly_balancing_authority=core_eia861__yearly_balancing_authority,
@@ -447,6 +626,7 @@ def service_territory_asset_factory(
             dissolve=dissolve,
             limit_by_state=limit_by_state,
             save_format=save_format,
+            workers=workers,
         )
 
     return _service_territory
@@ -644,6 +824,27 @@ def plot_all_territories(
         "the other flags provided."
     ),
 )
+@click.option(
+    "--geometry-cache",
+    type=click.Path(
+        dir_okay=False,
+        resolve_path=True,
+        path_type=pathlib.Path,
+    ),
+    default=None,
+    help=(
+        "GeoParquet file in which to keep dissolved county geometries, so that they "
+        "can be reused for other entity types or in later runs. It's created if it "
+        "doesn't exist yet."
+    ),
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to dissolve county geometries.",
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -667,6 +868,8 @@ def pudl_service_territories(
     output_dir: pathlib.Path,
     limit_by_state: bool,
     years: list[int],
+    geometry_cache: pathlib.Path | None,
+    workers: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -682,6 +885,7 @@ def pudl_service_territories(
 
     pudl_service_territories --entity-type balancing_authority --dissolve --limit-by-state
     pudl_service_territories --entity-type utility
+    pudl_service_territories --entity-type utility --geometry-cache counties.parquet
     """
     # Display logged output from the PUDL package:
     pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
@@ -726,6 +930,8 @@ FROM
         entity_type=entity_type,
         limit_by_state=limit_by_state,
         years=years,
+        geometry_cache=CountyGeometryCache(path=geometry_cache),
+        workers=workers,
     )
 
 
@@ -18,13 +18,15 @@ electricity demand estimates (e.g. at the county level).
 """
 
 import datetime
+import functools
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
-from dagster import AssetOut, Field, asset, multi_asset
+from dagster import AssetOut, Field, Noneable, asset, multi_asset
 
 import pudl.analysis.timeseries_cleaning
 import pudl.logging_helpers
@@ -378,30 +380,42 @@ def filter_ferc714_hourly_demand_matrix(
     return df
 
 
-def impute_ferc714_hourly_demand_matrix(df: pd.DataFrame) -> pd.DataFrame:
+def _impute_ferc714_year(df: pd.DataFrame, min_delta: float | None) -> pd.DataFrame:
+    """Impute null values in one year of the FERC 714 hourly demand matrix."""
+    keep = df.columns[~df.isnull().all()]
+    tsi = pudl.analysis.timeseries_cleaning.Timeseries(df[keep])
+    return tsi.to_dataframe(tsi.impute(method="tnn", min_delta=min_delta), copy=False)
+
+
+def impute_ferc714_hourly_demand_matrix(
+    df: pd.DataFrame, workers: int = 1, min_delta: float | None = None
+) -> pd.DataFrame:
     """Impute null values in FERC 714 hourly demand matrix.
 
     Imputation is performed separately for each year,
     with only the respondents reporting data in that year.
 
-    .. note::
-        Takes about 15 minutes.
-
     Args:
         df: FERC 714 hourly demand matrix,
           as described in :func:`load_ferc714_hourly_demand_matrix`.
+        workers: Number of worker processes used to impute the years. If 1, years
+            are imputed one after another in this process.
+        min_delta: If given, stop imputing a year once the relative change in its
+            imputed values has stopped exceeding this threshold (see `min_delta` in
+            :func:`pudl.analysis.timeseries_cleaning.impute_latc_tnn`). This is faster,
+            but changes the imputed values slightly. By default, each year is imputed
+            until the LATC convergence criterion is met.
 
     Returns:
         Copy of `df` with imputed values.
     """
-    results = []
-    for year, gdf in df.groupby(df.index.year):
-        logger.info(f"Imputing year {year}")
-        keep = df.columns[~gdf.isnull().all()]
-        tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
-        result = tsi.to_dataframe(tsi.impute(method="tnn"), copy=False)
-        results.append(result)
-    return pd.concat(results)
+    years = [gdf for _, gdf in df.groupby(df.index.year)]
+    logger.info(f"Imputing {len(years)} years with {workers} workers")
+    impute_year = functools.partial(_impute_ferc714_year, min_delta=min_delta)
+    if workers == 1:
+        return pd.concat(map(impute_year, years))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return pd.concat(executor.map(impute_year, years))
 
 
 def melt_ferc714_hourly_demand_matrix(
@@ -474,8 +488,27 @@ def _out_ferc714__hourly_demand_matrix(
     return df
 
 
-@asset(compute_kind="NumPy")
+@asset(
+    compute_kind="NumPy",
+    config_schema={
+        "workers": Field(
+            int,
+            default_value=1,
+            description="Number of worker processes used to impute the years.",
+        ),
+        "min_delta": Field(
+            Noneable(float),
+            default_value=None,
+            description=(
+                "If set, stop imputing a year once the relative change in its imputed "
+                "values stays below this threshold, e.g. 1e-3. This is faster, but "
+                "changes the imputed values slightly."
+            ),
+        ),
+    },
+)
 def _out_ferc714__hourly_imputed_demand(
+    context,
     _out_ferc714__hourly_demand_matrix: pd.DataFrame,
     _out_ferc714__utc_offset: pd.DataFrame,
 ) -> pd.DataFrame:
@@ -492,7 +525,11 @@ def _out_ferc714__hourly_imputed_demand(
     Returns:
         df: DataFrame with imputed FERC714 hourly demand.
     """
-    df = impute_ferc714_hourly_demand_matrix(_out_ferc714__hourly_demand_matrix)
+    df = impute_ferc714_hourly_demand_matrix(
+        _out_ferc714__hourly_demand_matrix,
+        workers=context.op_config["workers"],
+        min_delta=context.op_config["min_delta"],
+    )
     df = melt_ferc714_hourly_demand_matrix(df, _out_ferc714__utc_offset)
     return df
 
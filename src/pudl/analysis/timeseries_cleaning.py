@@ -30,8 +30,9 @@ And described at:
 """
 
 import functools
-import warnings
-from collections.abc import Iterable, Sequence
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -39,6 +40,11 @@ import numpy as np
 import pandas as pd
 import scipy.stats
 
+import pudl.logging_helpers
+from pudl.analysis import rolling_window
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
 # ---- Helpers ---- #
 
 
@@ -304,24 +310,157 @@ def _ten2mat(tensor: np.ndarray, mode: int) -> np.ndarray:
     )
 
 
-def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
-    """Singular value thresholding (SVT) truncated nuclear norm (TNN) minimization."""
-    [m, n] = matrix.shape
+def _left_singular(
+    matrix: np.ndarray,
+    tau: float,
+    basis: np.ndarray = None,
+    rng: np.random.Generator = None,
+    oversample: int = 8,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Left singular vectors and values of a matrix, down to at least `tau`.
+
+    If a `basis` for the dominant left singular subspace is provided (usually the
+    result of the previous iteration), it is refined with one step of subspace
+    iteration. This yields the leading singular values and vectors at a fraction of
+    the cost of a full SVD. If more than ``k - oversample`` of the ``k`` values found
+    exceed `tau`, the basis is grown with random directions and refined again.
+    When the basis grows to half the size of the matrix, a full decomposition is used
+    instead.
+
+    Args:
+        matrix: Matrix to decompose.
+        tau: Threshold above which all singular values are needed.
+        basis: Orthonormal basis (m, k) approximating the dominant left singular
+            subspace of `matrix`.
+        rng: Random number generator used to grow the basis.
+        oversample: Minimum number of computed singular values below `tau`.
+
+    Returns:
+        Left singular vectors (m, k) and singular values (k,) in descending order.
+    """
+    m, n = matrix.shape
+    while basis is not None and 2 * basis.shape[1] < min(m, n):
+        q, _ = np.linalg.qr(matrix @ (matrix.T @ basis))
+        b = q.T @ matrix
+        s2, w = np.linalg.eigh(b @ b.T)
+        s = np.sqrt(np.clip(s2[::-1], 0, None))
+        u = q @ np.ascontiguousarray(w[:, ::-1])
+        k = u.shape[1]
+        if np.sum(s > tau) + oversample <= k:
+            return u, s
+        rng = rng or np.random.default_rng(0)
+        basis = np.hstack([u, rng.standard_normal((m, k))])
     if 2 * m < n:
-        u, s, v = np.linalg.svd(matrix @ matrix.T, full_matrices=0)
-        s = np.sqrt(s)
-        idx = np.sum(s > tau)
-        mid = np.zeros(idx)
-        mid[:theta] = 1
-        mid[theta:idx] = (s[theta:idx] - tau) / s[theta:idx]
-        return (u[:, :idx] @ np.diag(mid)) @ (u[:, :idx].T @ matrix)
+        # Eigendecomposition of the (much smaller) symmetric Gram matrix
+        s2, u = np.linalg.eigh(matrix @ matrix.T)
+        # Reversed views have negative strides, which are much slower to multiply
+        return np.ascontiguousarray(u[:, ::-1]), np.sqrt(np.clip(s2[::-1], 0, None))
+    u, s, _ = np.linalg.svd(matrix, full_matrices=False)
+    return u, s
+
+
+def _next_basis(
+    matrix: np.ndarray, u: np.ndarray, s: np.ndarray, tau: float, oversample: int = 8
+) -> np.ndarray | None:
+    """Warm start basis for the next :func:`_left_singular`, if it would be used."""
+    k = np.sum(s > tau) + oversample
+    return u[:, :k] if 2 * k < min(matrix.shape) else None
+
+
+def _svt_tnn(
+    matrix: np.ndarray,
+    tau: float,
+    theta: int,
+    basis: np.ndarray = None,
+    rng: np.random.Generator = None,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Singular value thresholding (SVT) truncated nuclear norm (TNN) minimization.
+
+    Returns the thresholded matrix and a warm start `basis` for the next call
+    (see :func:`_left_singular`).
+    """
+    [m, n] = matrix.shape
     if m > 2 * n:
-        return _svt_tnn(matrix.T, tau, theta).T
-    u, s, v = np.linalg.svd(matrix, full_matrices=0)
+        x, basis = _svt_tnn(matrix.T, tau, theta, basis=basis, rng=rng)
+        return x.T, basis
+    u, s = _left_singular(matrix, tau, basis=basis, rng=rng)
     idx = np.sum(s > tau)
-    vec = s[:idx].copy()
-    vec[theta:idx] = s[theta:idx] - tau
-    return u[:, :idx] @ np.diag(vec) @ v[:idx, :]
+    mid = np.ones(idx)
+    mid[theta:idx] = (s[theta:idx] - tau) / s[theta:idx]
+    x = (u[:, :idx] * mid) @ (u[:, :idx].T @ matrix)
+    return x, _next_basis(matrix, u, s, tau)
+
+
+def _fit_autoregressive(
+    mat: np.ndarray,
+    z: np.ndarray,
+    ind: np.ndarray,
+    sample: np.ndarray = None,
+) -> np.ndarray:
+    """Fit and predict an autoregressive model for each series, all at once.
+
+    Args:
+        mat: Current estimate of the series (series, time).
+        z: Series (series, time) to fit against, after the maximum lag.
+        ind: Time indices (lags, time - max lag) of the lagged values.
+        sample: Time indices (series, samples) of the values used to fit each series.
+            Uses all values by default.
+
+    Returns:
+        Predicted values (series, time - max lag).
+    """
+    q = mat[:, ind].transpose(0, 2, 1)
+    if sample is None:
+        a = np.einsum("mdt, mt -> md", np.linalg.pinv(q), z)
+    else:
+        qs = np.take_along_axis(q, sample[..., None], axis=1)
+        zs = np.take_along_axis(z, sample, axis=1)
+        a = np.einsum("mdt, mt -> md", np.linalg.pinv(qs), zs)
+    return np.einsum("mtd, md -> mt", q, a)
+
+
+def _log_progress(
+    method: str,
+    it: int,
+    tol: float,
+    delta: float,
+    rho: float,
+    ranks: list,
+    start: float,
+) -> None:
+    """Log the progress of an imputation iteration."""
+    logger.debug(
+        f"{method} iteration {it}: tol={tol:.3g}, delta={delta:.3g}, rho={rho:.3g}, "
+        f"ranks={ranks}, elapsed={time.perf_counter() - start:.1f}s"
+    )
+
+
+def _log_result(
+    method: str, it: int, status: str, tol: float, shape: tuple, start: float
+) -> None:
+    """Log a summary of a completed imputation."""
+    logger.info(
+        f"{method} imputation of tensor {shape} {status} after {it} iterations "
+        f"(tol={tol:.3g}) in {time.perf_counter() - start:.1f}s"
+    )
+
+
+def _stop_status(
+    it: int,
+    tol: float,
+    stalled: int,
+    epsilon: float,
+    maxiter: int,
+    patience: int,
+) -> str | None:
+    """Reason to stop iterating an imputation, if any."""
+    if tol < epsilon:
+        return "converged"
+    if stalled >= patience:
+        return "stalled"
+    if it >= maxiter:
+        return "reached maxiter"
+    return None
 
 
 def impute_latc_tnn(
@@ -333,6 +472,9 @@ def impute_latc_tnn(
     theta: int = 20,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    min_delta: float = None,
+    patience: int = 10,
+    seed: int = 0,
 ) -> np.ndarray:
     """Impute tensor values with LATC-TNN method by Chen and Sun (2020).
 
@@ -342,6 +484,10 @@ def impute_latc_tnn(
     * description: https://arxiv.org/abs/2006.10436
     * code: https://github.com/xinychen/tensor-learning/blob/master/mats
 
+    While the thresholded rank of an unfolding is small, its singular values are
+    computed by warm-started subspace iteration rather than a full SVD
+    (see :func:`_left_singular`). Progress is logged at the ``DEBUG`` level.
+
     Args:
         tensor: Observational series in the form (series, groups, periods).
             Null values are replaced with zeros, so any zeros will be treated as null.
@@ -352,11 +498,19 @@ def impute_latc_tnn(
         theta:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        min_delta: Stop early once the relative change in the imputed values has been
+            below this threshold for `patience` consecutive iterations. The imputed
+            values often settle long before `epsilon` is reached.
+            By default, only `epsilon` and `maxiter` are used.
+        patience: Number of consecutive iterations used with `min_delta`.
+        seed: Seed for the random numbers used while imputing, so that the same
+            inputs always give the same imputed values.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -368,34 +522,33 @@ def impute_latc_tnn(
     t = np.zeros(np.insert(dim, 0, len(dim)))
     z = mat.copy()
     z[pos_missing] = np.mean(mat[mat != 0])
-    a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=int)
     for i in range(d):
         ind[i, :] = np.arange(max_lag - lags[i], dim_time - lags[i])
     last_mat = mat.copy()
     snorm = np.linalg.norm(mat, "fro")
+    last_imputed = z[pos_missing]
+    stalled = 0
     rho = rho0
+    bases = [None] * len(dim)
     while True:
         rho = min(rho * 1.05, 1e5)
+        ranks = []
         for k in range(len(dim)):
-            x[k] = _mat2ten(
-                _svt_tnn(
-                    _ten2mat(_mat2ten(z, shape=dim, mode=0) - t[k] / rho, mode=k),
-                    tau=alpha[k] / rho,
-                    theta=theta,
-                ),
-                shape=dim,
-                mode=k,
+            xk, bases[k] = _svt_tnn(
+                _ten2mat(_mat2ten(z, shape=dim, mode=0) - t[k] / rho, mode=k),
+                tau=alpha[k] / rho,
+                theta=theta,
+                basis=bases[k],
+                rng=rng,
             )
+            x[k] = _mat2ten(xk, shape=dim, mode=k)
+            ranks.append(None if bases[k] is None else bases[k].shape[1])
         tensor_hat = np.einsum("k, kmnt -> mnt", alpha, x)
         mat_hat = _ten2mat(tensor_hat, 0)
-        mat0 = np.zeros((dim[0], dim_time - max_lag))
         if lambda0 > 0:
-            for m in range(dim[0]):
-                qm = mat_hat[m, ind].T
-                a[m, :] = np.linalg.pinv(qm) @ z[m, max_lag:]
-                mat0[m, :] = qm @ a[m, :]
+            mat0 = _fit_autoregressive(mat_hat, z[:, max_lag:], ind)
             mat1 = _ten2mat(np.mean(rho * x + t, axis=0), 0)
             z[pos_missing] = np.append(
                 (mat1[:, :max_lag] / rho),
@@ -408,37 +561,61 @@ def impute_latc_tnn(
             x - np.broadcast_to(_mat2ten(z, dim, 0), np.insert(dim, 0, len(dim)))
         )
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
-        last_mat = mat_hat.copy()
+        last_mat = mat_hat
+        imputed = z[pos_missing]
+        delta = np.linalg.norm(imputed - last_imputed) / (np.linalg.norm(imputed) or 1)
+        last_imputed = imputed
+        stalled = stalled + 1 if min_delta and delta < min_delta else 0
         it += 1
-        print(f"Iteration: {it}", end="\r")
-        if tol < epsilon or it >= maxiter:
+        _log_progress("LATC-TNN", it, tol, delta, rho, ranks, start)
+        status = _stop_status(it, tol, stalled, epsilon, maxiter, patience)
+        if status:
             break
-    print(f"Iteration: {it}")
+    _log_result("LATC-TNN", it, status, tol, tensor.shape, start)
     return tensor_hat
 
 
-def _tsvt(tensor: np.ndarray, phi: np.ndarray, tau: float) -> np.ndarray:
-    """Tensor singular value thresholding (TSVT)."""
-    dim = tensor.shape
-    x = np.zeros(dim)
-    tensor = np.einsum("kt, ijk -> ijt", phi, tensor)
-    for t in range(dim[2]):
-        u, s, v = np.linalg.svd(tensor[:, :, t], full_matrices=False)
-        r = len(np.where(s > tau)[0])
+def _tsvt(
+    tensor: np.ndarray,
+    phi: np.ndarray,
+    tau: float,
+    bases: list[np.ndarray | None] = None,
+    rng: np.random.Generator = None,
+) -> tuple[np.ndarray, list[np.ndarray | None]]:
+    """Tensor singular value thresholding (TSVT).
+
+    Returns the thresholded tensor and warm start `bases` for each frontal slice
+    in the next call (see :func:`_left_singular`).
+    """
+    # Frontal slices first, so that each slice is contiguous for matrix products
+    tensor = np.einsum("kt, ijk -> tij", phi, tensor)
+    x = np.zeros(tensor.shape)
+    bases = bases or [None] * len(tensor)
+    for t, matrix in enumerate(tensor):
+        u, s = _left_singular(matrix, tau, basis=bases[t], rng=rng)
+        r = np.sum(s > tau)
         if r >= 1:
-            s = s[:r]
-            s[:r] = s[:r] - tau
-            x[:, :, t] = u[:, :r] @ np.diag(s) @ v[:r, :]
-    return np.einsum("kt, ijt -> ijk", phi, x)
+            x[t] = (u[:, :r] * ((s[:r] - tau) / s[:r])) @ (u[:, :r].T @ matrix)
+        bases[t] = _next_basis(matrix, u, s, tau)
+    return np.einsum("kt, tij -> ijk", phi, x), bases
+
 
+def _tubal_transform(tensor: np.ndarray) -> np.ndarray:
+    """Orthogonal transform along the periods of a tensor for :func:`_tsvt`."""
+    matrix = _ten2mat(tensor, 2)
+    return np.linalg.eigh(matrix @ matrix.T)[1]
 
-def impute_latc_tubal(  # noqa: C901
+
+def impute_latc_tubal(
     tensor: np.ndarray,
     lags: Sequence[int] = [1],
     rho0: float = 1e-7,
     lambda0: float = 2e-7,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    min_delta: float = None,
+    patience: int = 10,
+    seed: int = 0,
 ) -> np.ndarray:
     """Impute tensor values with LATC-Tubal method by Chen, Chen and Sun (2020).
 
@@ -449,6 +626,8 @@ def impute_latc_tubal(  # noqa: C901
     * description: https://arxiv.org/abs/2008.03194
     * code: https://github.com/xinychen/tensor-learning/blob/master/mats
 
+    Progress is logged at the ``DEBUG`` level.
+
     Args:
         tensor: Observational series in the form (series, groups, periods).
             Null values are replaced with zeros, so any zeros will be treated as null.
@@ -457,11 +636,19 @@ def impute_latc_tubal(  # noqa: C901
         lambda0:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        min_delta: Stop early once the relative change in the imputed values has been
+            below this threshold for `patience` consecutive iterations. The imputed
+            values often settle long before `epsilon` is reached.
+            By default, only `epsilon` and `maxiter` are used.
+        patience: Number of consecutive iterations used with `min_delta`.
+        seed: Seed for the random numbers used while imputing, so that the same
+            inputs always give the same imputed values.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -472,41 +659,34 @@ def impute_latc_tubal(  # noqa: C901
     t = np.zeros(dim)
     z = mat.copy()
     z[pos_missing] = np.mean(mat[mat != 0])
-    a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=np.int_)
     for i in range(d):
         ind[i, :] = np.arange(max_lag - lags[i], dim_time - lags[i])
     last_mat = mat.copy()
     snorm = np.linalg.norm(mat, "fro")
+    last_imputed = z[pos_missing]
+    stalled = 0
     rho = rho0
-    temp1 = _ten2mat(_mat2ten(z, dim, 0), 2)
-    _, phi = np.linalg.eig(temp1 @ temp1.T)
-    del temp1
-    if dim_time > 5e3 and dim_time <= 1e4:
-        sample_rate = 0.2
-    elif dim_time > 1e4:
-        sample_rate = 0.1
+    phi = _tubal_transform(_mat2ten(z, dim, 0))
+    bases = None
+    sample_size = None
+    if dim_time > 5e3:
+        sample_rate = 0.2 if dim_time <= 1e4 else 0.1
+        sample_size = int(sample_rate * (dim_time - max_lag))
     while True:
         rho = min(rho * 1.05, 1e5)
-        x = _tsvt(_mat2ten(z, dim, 0) - t / rho, phi, 1 / rho)
+        x, bases = _tsvt(_mat2ten(z, dim, 0) - t / rho, phi, 1 / rho, bases, rng)
         mat_hat = _ten2mat(x, 0)
-        mat0 = np.zeros((dim[0], dim_time - max_lag))
         temp2 = _ten2mat(rho * x + t, 0)
         if lambda0 > 0:
-            if dim_time <= 5e3:
-                for m in range(dim[0]):
-                    qm = mat_hat[m, ind].T
-                    a[m, :] = np.linalg.pinv(qm) @ z[m, max_lag:]
-                    mat0[m, :] = qm @ a[m, :]
-            elif dim_time > 5e3:
-                for m in range(dim[0]):
-                    idx = np.arange(0, dim_time - max_lag)
-                    rng.shuffle(idx)
-                    idx = idx[: int(sample_rate * (dim_time - max_lag))]
-                    qm = mat_hat[m, ind].T
-                    a[m, :] = np.linalg.pinv(qm[idx[:], :]) @ z[m, max_lag:][idx[:]]
-                    mat0[m, :] = qm @ a[m, :]
+            sample = None
+            if sample_size:
+                # Fit each series to a different random sample of its values
+                sample = rng.permuted(
+                    np.tile(np.arange(dim_time - max_lag), (dim[0], 1)), axis=1
+                )[:, :sample_size]
+            mat0 = _fit_autoregressive(mat_hat, z[:, max_lag:], ind, sample)
             z[pos_missing] = np.append(
                 (temp2[:, :max_lag] / rho),
                 (temp2[:, max_lag:] + lambda0 * mat0) / (rho + lambda0),
@@ -516,22 +696,50 @@ def impute_latc_tubal(  # noqa: C901
             z[pos_missing] = temp2[pos_missing] / rho
         t = t + rho * (x - _mat2ten(z, dim, 0))
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
-        last_mat = mat_hat.copy()
+        last_mat = mat_hat
+        imputed = z[pos_missing]
+        delta = np.linalg.norm(imputed - last_imputed) / (np.linalg.norm(imputed) or 1)
+        last_imputed = imputed
+        stalled = stalled + 1 if min_delta and delta < min_delta else 0
         it += 1
         if not np.mod(it, 10):
-            temp1 = _ten2mat(_mat2ten(z, dim, 0) - t / rho, 2)
-            _, phi = np.linalg.eig(temp1 @ temp1.T)
-            del temp1
-        print(f"Iteration: {it}", end="\r")
-        if tol < epsilon or it >= maxiter:
+            phi = _tubal_transform(_mat2ten(z, dim, 0) - t / rho)
+            # The slices change with the transform, so the old bases no longer apply
+            bases = None
+        ranks = [None if b is None else b.shape[1] for b in bases or []]
+        _log_progress("LATC-Tubal", it, tol, delta, rho, ranks, start)
+        status = _stop_status(it, tol, stalled, epsilon, maxiter, patience)
+        if status:
             break
-    print(f"Iteration: {it}")
+    _log_result("LATC-Tubal", it, status, tol, tensor.shape, start)
     return x
 
 
 # ---- Anomaly detection ---- #
 
 
+def _cached(method: Callable) -> Callable:
+    """Cache the result of a :class:`Timeseries` method until its values change.
+
+    Results are stored on the instance, keyed by the method name and its arguments,
+    and are cleared whenever values are flagged or unflagged. Calls with unhashable
+    arguments (like a list of `shifts`) are not cached.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "Timeseries", *args: Any, **kwargs: Any) -> np.ndarray:
+        key = method.__name__, args, tuple(sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+
+    return wrapper
+
+
 class Timeseries:
     """Multivariate timeseries for anomalies detection and imputation.
 
@@ -569,6 +777,7 @@ class Timeseries:
         self.x: np.ndarray = self.xi.copy()
         self.flags: np.ndarray = np.empty(self.x.shape, dtype=object)
         self.flagged: list[str] = []
+        self._cache: dict[tuple, np.ndarray] = {}
 
     def to_dataframe(self, array: np.ndarray = None, copy: bool = True) -> pd.DataFrame:
         """Return multivariate timeseries as a :class:`pandas.DataFrame`.
@@ -596,10 +805,7 @@ class Timeseries:
         # Null flagged values
         self.x[mask] = np.nan
         # Clear cached metrics
-        for name in dir(self):
-            attr = getattr(self, name)
-            if hasattr(attr, "cache_clear"):
-                attr.cache_clear()
+        self._cache.clear()
 
     def unflag(self, flags: Iterable[str] = None) -> None:
         """Unflag values.
@@ -613,6 +819,7 @@ class Timeseries:
         self.flags[mask] = None
         self.x[mask] = self.xi[mask]
         self.flagged = [f for f in self.flagged if flags is not None and f not in flags]
+        self._cache.clear()
 
     def flag_negative_or_zero(self) -> None:
         """Flag negative or zero values (NEGATIVE_OR_ZERO)."""
@@ -667,7 +874,7 @@ class Timeseries:
             mask[shift:][outliers[:-shift]] = True
         self.flag(mask, "GLOBAL_OUTLIER_NEIGHBOR")
 
-    @functools.lru_cache(maxsize=2)  # noqa: B019
+    @_cached
     def rolling_median(self, window: int = 48) -> np.ndarray:
         """Rolling median of values.
 
@@ -675,8 +882,7 @@ class Timeseries:
             window: Number of values in the moving window.
         """
         # RUGGLES: rollingDem, rollingDemLong (window=480)
-        df = pd.DataFrame(self.x, copy=False)
-        return df.rolling(window, min_periods=1, center=True).median().to_numpy()
+        return rolling_window.rolling_median(self.x, window)
 
     def rolling_median_offset(self, window: int = 48) -> np.ndarray:
         """Values minus the rolling median.
@@ -704,23 +910,7 @@ class Timeseries:
         """
         # RUGGLES: vals_dem_minus_rolling
         offset = self.rolling_median_offset(window=window)
-        # Fast numpy implementation of pd.DataFrame.shift
-        shifted = np.empty([len(shifts), *offset.shape], dtype=float)
-        for i, shift in enumerate(shifts):
-            if shift > 0:
-                shifted[i, :shift] = np.nan
-                shifted[i, shift:] = offset[:-shift]
-            elif shift < 0:
-                shifted[i, shift:] = np.nan
-                shifted[i, :shift] = offset[-shift:]
-            else:
-                shifted[i, :] = offset
-        # Ignore warning for rows with all null values
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore", category=RuntimeWarning, message="All-NaN slice encountered"
-            )
-            return np.nanmedian(shifted, axis=0)
+        return rolling_window.shifted_nanmedian(offset, shifts)
 
     def rolling_iqr_of_rolling_median_offset(
         self, window: int = 48, iqr_window: int = 240
@@ -735,10 +925,9 @@ class Timeseries:
         """
         # RUGGLES: dem_minus_rolling_IQR
         offset = self.rolling_median_offset(window=window)
-        df = pd.DataFrame(offset, copy=False)
-        rolling = df.rolling(iqr_window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        return rolling_window.rolling_iqr(offset, iqr_window)
 
+    @_cached
     def median_prediction(
         self,
         window: int = 48,
@@ -820,10 +1009,7 @@ class Timeseries:
             window: Number of values in the moving window for the rolling IQR.
         """
         # RUGGLES: delta_rolling_iqr
-        diff = self.diff(shift=shift)
-        df = pd.DataFrame(diff, copy=False)
-        rolling = df.rolling(window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        return rolling_window.rolling_iqr(self.diff(shift=shift), window)
 
     def flag_double_delta(self, iqr_window: int = 240, multiplier: float = 2) -> None:
         """Flag values very different from neighbors on either side (DOUBLE_DELTA).
@@ -844,7 +1030,7 @@ class Timeseries:
         mask = (np.minimum(before, after) > iqr) | (np.maximum(before, after) < -iqr)
         self.flag(mask, "DOUBLE_DELTA")
 
-    @functools.lru_cache(maxsize=2)  # noqa: B019
+    @_cached
     def relative_median_prediction(self, **kwargs: Any) -> np.ndarray:
         """Values divided by their value predicted from medians.
 
@@ -1220,6 +1406,7 @@ class Timeseries:
         periods: int = 24,
         blocks: int = 1,
         method: str = "tubal",
+        workers: int = 1,
         **kwargs: Any,
     ) -> np.ndarray:
         """Impute null values.
@@ -1237,6 +1424,8 @@ class Timeseries:
                 This has been found to reduce processing time for `method='tnn'`.
             method: Imputation method to use
                 ('tubal': :func:`impute_latc_tubal`, 'tnn': :func:`impute_latc_tnn`).
+            workers: Number of worker processes used to impute the blocks.
+                If 1, blocks are imputed one after another in this process.
             kwargs: Optional arguments to `method`.
 
         Returns:
@@ -1250,14 +1439,22 @@ class Timeseries:
         x = self.x.copy() if mask is None else np.where(mask, np.nan, self.x)
         if (x == 0).any():
             raise ValueError("Zero values present. Replace with very small value.")
+        imputer = functools.partial(imputer, **kwargs)
         tensor = self.fold_tensor(x, periods=periods)
         n = tensor.shape[1]
         ends = [*range(0, n, int(np.ceil(n / blocks))), n]
-        for i in range(blocks):
-            if blocks > 1:
-                print(f"Block: {i}")
-            idx = slice(None), slice(ends[i], ends[i + 1]), slice(None)
-            tensor[idx] = imputer(tensor[idx], **kwargs)
+        idxs = [
+            (slice(None), slice(start, end), slice(None))
+            for start, end in zip(ends[:-1], ends[1:], strict=True)
+        ]
+        if workers > 1 and len(idxs) > 1:
+            logger.info(f"Imputing {len(idxs)} blocks with {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(imputer, [tensor[idx] for idx in idxs]))
+        else:
+            results = map(imputer, (tensor[idx] for idx in idxs))
+        for idx, result in zip(idxs, results, strict=True):
+            tensor[idx] = result
         return self.unfold_tensor(tensor)
 
     def summarize_imputed(self, imputed: np.ndarray, mask: np.ndarray) -> pd.DataFrame:
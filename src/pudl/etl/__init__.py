@@ -28,7 +28,8 @@ from pudl.io_managers import (
     parquet_io_manager,
     pudl_mixed_format_io_manager,
 )
-from pudl.metadata import PUDL_PACKAGE
+from pudl.metadata.classes import Resource
+from pudl.metadata.resources import RESOURCE_METADATA
 from pudl.resources import dataset_settings, datastore, ferc_to_sqlite_settings
 from pudl.settings import EtlSettings
 
@@ -125,20 +126,19 @@ default_asset_checks = list(
 )
 
 
-def asset_check_from_schema(
-    asset_key: AssetKey,
-    package: pudl.metadata.classes.Package,
-) -> AssetChecksDefinition | None:
-    """Create a dagster asset check based on the resource schema, if defined."""
+def asset_check_from_schema(asset_key: AssetKey) -> AssetChecksDefinition | None:
+    """Create a dagster asset check based on the resource schema, if defined.
+
+    The resource and its pandera schema are only built when the check is run, so
+    that defining the checks doesn't require building every resource up front.
+    """
     resource_id = asset_key.to_user_string()
-    try:
-        resource = package.get_resource(resource_id)
-    except ValueError:
+    if resource_id not in RESOURCE_METADATA:
         return None
-    pandera_schema = resource.schema.to_pandera()
 
     @asset_check(asset=asset_key)
     def pandera_schema_check(asset_value) -> AssetCheckResult:
+        pandera_schema = Resource.from_id(resource_id).schema.to_pandera()
         try:
             pandera_schema.validate(asset_value, lazy=True)
         except pr.errors.SchemaErrors as schema_errors:
@@ -182,14 +182,13 @@ def _get_keys_from_assets(
     return []
 
 
-_package = PUDL_PACKAGE
 _asset_keys = itertools.chain.from_iterable(
     _get_keys_from_assets(asset_def) for asset_def in default_assets
 )
 default_asset_checks += [
     check
     for check in (
-        asset_check_from_schema(asset_key, _package)
+        asset_check_from_schema(asset_key)
         for asset_key in _asset_keys
         if asset_key.to_user_string() != "core_epacems__hourly_emissions"
     )
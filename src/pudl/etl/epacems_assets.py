@@ -9,17 +9,21 @@ for processing each year of EPA CEMS data and execute these ops in parallel. For
 see: https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs and https://docs.dagster.io/concepts/assets/graph-backed-assets.
 """
 
-from collections import namedtuple
+import tempfile
+from collections import defaultdict, namedtuple
+from collections.abc import Iterator
 from pathlib import Path
 
 import dask.dataframe as dd
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dagster import (
     AssetIn,
     DynamicOut,
     DynamicOutput,
+    Field,
     asset,
     graph_asset,
     op,
@@ -29,6 +33,7 @@ import pudl
 from pudl.extract.epacems import EpaCemsPartition
 from pudl.metadata.classes import Resource
 from pudl.metadata.enums import EPACEMS_STATES
+from pudl.transform.epacems import EpaCemsLookups
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -36,6 +41,13 @@ logger = pudl.logging_helpers.get_logger(__name__)
 
 YearPartitions = namedtuple("YearPartitions", ["year_quarters"])
 
+CONSOLIDATION_BUFFER_BYTES = 2 * 2**30
+"""Default bytes of state batches to hold in memory before spilling them to disk.
+
+Can be overridden with the ``max_buffer_bytes`` config of
+:func:`consolidate_partitions`.
+"""
+
 
 def _partitioned_path() -> Path:
     partitioned_path = (
@@ -63,6 +75,25 @@ def get_years_from_settings(context):
         yield DynamicOutput(year, mapping_key=str(year))
 
 
+@op
+def build_epacems_lookups(
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> EpaCemsLookups:
+    """Build the plant ID and UTC offset lookups used to transform EPA CEMS data.
+
+    This runs once, and its output is shared by all of the ops processing each year.
+
+    Args:
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing the
+            ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+    """
+    return pudl.transform.epacems.build_lookups(
+        core_epa__assn_eia_epacamd, core_eia__entity_plants
+    )
+
+
 @op(
     required_resource_keys={"datastore", "dataset_settings"},
     tags={"memory-use": "high"},
@@ -70,17 +101,15 @@ def get_years_from_settings(context):
 def process_single_year(
     context,
     year,
-    core_epa__assn_eia_epacamd: pd.DataFrame,
-    core_eia__entity_plants: pd.DataFrame,
+    epacems_lookups: EpaCemsLookups,
 ) -> YearPartitions:
     """Process a single year of EPA CEMS data.
 
     Args:
         context: dagster keyword that provides access to resources and config.
         year: Year of data to process.
-        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing the
-            ORISPL code with EIA.
-        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+        epacems_lookups: The crosswalk and UTC offset lookups used to transform the
+            data.
     """
     ds = context.resources.datastore
     epacems_settings = context.resources.dataset_settings.epacems
@@ -96,29 +125,139 @@ def process_single_year(
 
     for year_quarter in year_quarters_in_year:
         logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
-            )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-
-        # Write to a directory of partitioned parquet files
+        # Write to a directory of partitioned parquet files, one batch at a time so
+        # that only a slice of the quarter is ever held in memory.
         with pq.ParquetWriter(
             where=partitioned_path / f"epacems-{year_quarter}.parquet",
             schema=schema,
             compression="snappy",
             version="2.6",
         ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+            for df in pudl.extract.epacems.extract_batches(
+                year_quarter=year_quarter, ds=ds
+            ):
+                df = pudl.transform.epacems.transform(df, epacems_lookups)
+                partitioned_writer.write_table(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
 
     return YearPartitions(year_quarters_in_year)
 
 
-@op
+def _split_by_state(table: pa.Table) -> Iterator[tuple[str, pa.Table]]:
+    """Split a table of EPA CEMS records into one table per state.
+
+    The table is stably sorted by state once, and each state's records are a slice of
+    the sorted table, so records keep their original order within each state.
+    """
+    states = pc.cast(table["state"], pa.string())
+    order = pc.sort_indices(states)
+    table = table.take(order)
+    offset = 0
+    for state_count in pc.value_counts(states.take(order)).to_pylist():
+        state, count = state_count["values"], state_count["counts"]
+        if state is not None:
+            yield state, table.slice(offset, count)
+        offset += count
+
+
+def _spill_state_buffers(
+    buffers: dict[str, list[pa.Table]],
+    spill_writers: dict[str, pa.ipc.RecordBatchStreamWriter],
+    spill_dir: Path,
+    schema: pa.Schema,
+) -> None:
+    """Append buffered state tables to per-state Arrow IPC files and empty buffers."""
+    for state, tables in buffers.items():
+        if state not in spill_writers:
+            spill_writers[state] = pa.ipc.new_stream(
+                spill_dir / f"{state}.arrow", schema
+            )
+        for table in tables:
+            spill_writers[state].write_table(table)
+    buffers.clear()
+
+
+def write_year_state_row_groups(
+    writer: pq.ParquetWriter,
+    partition_paths: list[Path],
+    schema: pa.Schema,
+    max_buffer_bytes: int = CONSOLIDATION_BUFFER_BYTES,
+    spill_dir: Path | None = None,
+) -> None:
+    """Write one year of partitioned EPA CEMS data as year-state row groups.
+
+    Each quarterly partition is scanned exactly once. Its record batches are split by
+    state and buffered in memory until all of the year's partitions have been read,
+    at which point each state's data is written out as a contiguous set of row
+    groups. If the buffered data grows beyond ``max_buffer_bytes`` it is spilled to
+    per-state Arrow IPC files, which are memory mapped back in when that state is
+    written.
+
+    Args:
+        writer: open writer for the monolithic EPA CEMS parquet file.
+        partition_paths: the quarterly parquet files that make up a single year.
+        schema: the EPA CEMS pyarrow schema.
+        max_buffer_bytes: how much data to buffer in memory before spilling to disk.
+        spill_dir: where to create the temporary spill directory. Defaults to the
+            system temporary directory.
+    """
+    buffers: dict[str, list[pa.Table]] = defaultdict(list)
+    buffered_bytes = 0
+    with tempfile.TemporaryDirectory(dir=spill_dir) as tmp_dir:
+        spill_writers: dict[str, pa.ipc.RecordBatchStreamWriter] = {}
+        try:
+            for path in partition_paths:
+                for batch in pq.ParquetFile(path).iter_batches():
+                    for state, state_table in _split_by_state(
+                        pa.Table.from_batches([batch])
+                    ):
+                        buffers[state].append(state_table)
+                        buffered_bytes += state_table.nbytes
+                    if buffered_bytes > max_buffer_bytes:
+                        logger.debug(
+                            f"Spilling {buffered_bytes} bytes of EPA CEMS data to disk"
+                        )
+                        _spill_state_buffers(
+                            buffers, spill_writers, Path(tmp_dir), schema
+                        )
+                        buffered_bytes = 0
+        finally:
+            for spill_writer in spill_writers.values():
+                spill_writer.close()
+
+        for state in sorted(s.upper() for s in EPACEMS_STATES):
+            tables = buffers.pop(state, [])
+            if state in spill_writers:
+                with pa.memory_map(str(Path(tmp_dir) / f"{state}.arrow")) as source:
+                    tables = [pa.ipc.open_stream(source).read_all()] + tables
+                    writer.write_table(pa.concat_tables(tables))
+            else:
+                writer.write_table(
+                    pa.concat_tables(tables) if tables else schema.empty_table()
+                )
+
+
+@op(
+    config_schema={
+        "max_buffer_bytes": Field(
+            int,
+            default_value=CONSOLIDATION_BUFFER_BYTES,
+            description=(
+                "Bytes of each year's data to buffer in memory before spilling it to "
+                "temporary files on disk."
+            ),
+        ),
+    },
+)
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    Each quarterly partition is read once, and the monolithic output contains one
+    row group (or more, for very large states) per year and state, with the states
+    in alphabetical order. Up to the configured ``max_buffer_bytes`` of each year's
+    data is held in memory while it is reorganized by state.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
@@ -133,22 +272,16 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
         where=monolithic_path, schema=schema, compression="snappy", version="2.6"
     ) as monolithic_writer:
         for year_partition in partitions:
-            for state in EPACEMS_STATES:
-                monolithic_writer.write_table(
-                    # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
-                    pa.concat_tables(
-                        [
-                            pq.read_table(
-                                source=partitioned_path
-                                / f"epacems-{year_quarter}.parquet",
-                                filters=[[("state", "=", state.upper())]],
-                                schema=schema,
-                            )
-                            for year_quarter in year_partition.year_quarters
-                        ]
-                    )
-                )
+            write_year_state_row_groups(
+                monolithic_writer,
+                partition_paths=[
+                    partitioned_path / f"epacems-{year_quarter}.parquet"
+                    for year_quarter in sorted(year_partition.year_quarters)
+                ],
+                schema=schema,
+                max_buffer_bytes=context.op_config["max_buffer_bytes"],
+                spill_dir=partitioned_path,
+            )
 
 
 @graph_asset
@@ -164,13 +297,10 @@ def core_epacems__hourly_emissions(
     https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs.
     """
     years = get_years_from_settings()
-    partitions = years.map(
-        lambda year: process_single_year(
-            year,
-            _core_epa__assn_eia_epacamd_unique,
-            core_eia__entity_plants,
-        )
+    epacems_lookups = build_epacems_lookups(
+        _core_epa__assn_eia_epacamd_unique, core_eia__entity_plants
     )
+    partitions = years.map(lambda year: process_single_year(year, epacems_lookups))
     return consolidate_partitions(partitions.collect())
 
 
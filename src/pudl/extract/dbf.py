@@ -3,14 +3,20 @@
 import contextlib
 import csv
 import importlib.resources
+import multiprocessing
+import os
+import queue
+import threading
 import warnings
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import IO, Any, Protocol, Self
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 from dagster import op
@@ -81,6 +87,129 @@ class DbfTableSchema:
         return table
 
 
+DBF_RECORD_ACTIVE = 0x20
+"""First byte of each DBF record that has not been deleted (an ASCII space)."""
+DBF_END_OF_FILE = 0x1A
+"""Marker that ends the record block of a DBF file."""
+DBF_NULLABLE_FIELD_FLAG = 0x02
+"""Bit in the Visual FoxPro field flags that marks a field as nullable."""
+
+
+def _get_null_flag_bits(dbf: DBF) -> dict[str, int] | None:
+    """Map the nullable fields of a Visual FoxPro table to their ``_NullFlags`` bits.
+
+    Each nullable field is assigned the next bit of the ``_NullFlags`` field, in field
+    order, starting with the least significant bit of the first byte. The field flags
+    are stored in the low byte of what dbfread calls ``reserved1``.
+
+    Returns:
+        Dictionary mapping field names to their bit index, or None if the table has
+        variable length fields, which also use ``_NullFlags`` bits.
+    """
+    bits = {}
+    for field in dbf.fields:
+        if field.type in "VQ":
+            return None
+        if field.type != "0" and field.reserved1 & DBF_NULLABLE_FIELD_FLAG:
+            bits[field.name] = len(bits)
+    return bits
+
+
+def _decode_dbf_column(
+    column: np.ndarray, field: Any, field_parser: FieldParser
+) -> np.ndarray:
+    """Parse the raw bytes of a DBF column into an array of Python values.
+
+    The field parser is only invoked once for each distinct raw value in the column,
+    and the results are broadcast back to every record, so values are identical to
+    those parsed by dbfread one record at a time.
+    """
+    if field.type == "I":
+        return column.view("<i4").astype(object)
+    uniques, inverse = np.unique(column, return_inverse=True)
+    values = np.empty(len(uniques), dtype=object)
+    values[:] = [field_parser.parse(field, u.tobytes()) for u in uniques]
+    return values[inverse]
+
+
+def dbf_to_dataframe(dbf: DBF) -> pd.DataFrame:
+    """Decode all of the records in a DBF table column by column.
+
+    Iterating over a :class:`dbfread.DBF` creates a dictionary per record and parses
+    every field of every record separately. Instead, this reads the whole fixed-width
+    record block into a NumPy structured array with one raw bytes column per field,
+    and parses each column in bulk with the table's field parser. Fields which are
+    marked as null in the Visual FoxPro ``_NullFlags`` field are set to None.
+
+    Tables with a layout that can't be decoded this way (e.g. with a memo file or
+    variable length fields) fall back to iterating over the records with dbfread.
+
+    Args:
+        dbf: the DBF table to read.
+
+    Returns:
+        Dataframe with one column per DBF field, including ``_NullFlags`` as raw bytes
+        if present, and one row per non-deleted record.
+    """
+    header = dbf.header
+    field_lengths = [field.length for field in dbf.fields]
+    null_flag_bits = _get_null_flag_bits(dbf)
+    data = dbf.dbf_bytes().read()
+    num_records, remainder = divmod(len(data) - header.headerlen, header.recordlen)
+    if (
+        null_flag_bits is None
+        or dbf.raw
+        or getattr(dbf, "memofilename", None)
+        or getattr(dbf, "_memofile", None) is not None
+        or sum(field_lengths) + 1 != header.recordlen
+        or (remainder and data[-remainder] == DBF_RECORD_ACTIVE)
+    ):
+        return pd.DataFrame(iter(dbf))
+
+    record_dtype = np.dtype(
+        {
+            "names": ["_record_flag"] + [f"f{i}" for i in range(len(dbf.fields))],
+            "formats": ["u1"] + [f"V{length}" for length in field_lengths],
+            "offsets": [0] + list(np.cumsum([1] + field_lengths[:-1])),
+            "itemsize": header.recordlen,
+        }
+    )
+    records = np.frombuffer(
+        data, dtype=record_dtype, count=num_records, offset=header.headerlen
+    )
+    # Like dbfread, stop at the end of file marker, and skip all records that are
+    # marked as deleted or otherwise not active.
+    end_of_file = np.flatnonzero(records["_record_flag"] == DBF_END_OF_FILE)
+    if end_of_file.size:
+        records = records[: end_of_file[0]]
+    records = records[records["_record_flag"] == DBF_RECORD_ACTIVE]
+    if len(records) == 0:
+        return pd.DataFrame()
+
+    field_parser = dbf.parserclass(dbf)
+    columns = {}
+    null_flags = None
+    for i, field in enumerate(dbf.fields):
+        raw = np.ascontiguousarray(records[f"f{i}"])
+        if field.type == "0" and field.name == "_NullFlags":
+            null_flags = np.frombuffer(raw.tobytes(), dtype=np.uint8).reshape(
+                len(raw), field.length
+            )
+        columns[field.name] = _decode_dbf_column(raw, field, field_parser)
+
+    if null_flags is not None:
+        for name, bit in null_flag_bits.items():
+            is_null = (null_flags[:, bit // 8] >> (bit % 8)) & 1 == 1
+            columns[name][is_null] = None
+
+    # Building each column from a list infers the same dtypes that pandas does when
+    # constructing a dataframe from dbfread's records.
+    return pd.DataFrame(
+        {name: pd.Series(values.tolist()) for name, values in columns.items()},
+        columns=list(columns),
+    )
+
+
 class FercDbfArchive:
     """Represents API for accessing files within a single DBF archive.
 
@@ -185,7 +314,7 @@ class FercDbfArchive:
             table_name: name of the table.
         """
         sch = self.get_table_schema(table_name)
-        df = pd.DataFrame(iter(self.get_table_dbf(table_name)))
+        df = dbf_to_dataframe(self.get_table_dbf(table_name))
         df = df.drop("_NullFlags", axis=1, errors="ignore").rename(
             sch.get_column_rename_map(), axis=1
         )
@@ -343,6 +472,8 @@ class FercDbfReader:
         nfilters = self._normalize(filters)
         # Not using a context manager for the zipfile here because it would
         # close the file after this method returns the FercDbfArchive instance.
+        # When the archive is in the local cache, the zipfile only holds an open file
+        # handle, and members are read from disk as needed.
         return FercDbfArchive(
             self.datastore.get_zipfile_resource(self.dataset, year=year, **nfilters),
             dbc_path=self._dbc_path[year],
@@ -396,6 +527,92 @@ class FercDbfReader:
         return dfs
 
 
+_worker_dbf_reader: AbstractFercDbfReader | None = None
+"""The DBF reader used by each worker process of :class:`FercDbfExtractor`."""
+
+
+def _init_dbf_worker(dbf_reader: AbstractFercDbfReader) -> None:
+    """Store the DBF reader that the worker process will load partitions with."""
+    global _worker_dbf_reader
+    _worker_dbf_reader = dbf_reader
+
+
+def _load_table_partition(
+    table_name: str, partition: dict[str, Any]
+) -> list[PartitionedDataFrame]:
+    """Load one table from a single partition in a worker process."""
+    return _worker_dbf_reader.load_table_dfs(table_name, [partition])
+
+
+class SQLiteTableWriter:
+    """Appends dataframes to SQLite tables from a single background thread.
+
+    The thread owns the only connection to the database, so the tables can be decoded
+    and transformed concurrently while earlier tables are being written. At most
+    ``max_queued`` tables wait to be written at any time, which limits how much data
+    is held in memory if writing falls behind.
+    """
+
+    _DONE = object()
+
+    def __init__(self, engine: sa.Engine, max_queued: int = 2):
+        """Create a new writer, which starts writing when it is entered.
+
+        Args:
+            engine: engine for the SQLite database to write to.
+            max_queued: how many tables can be waiting to be written.
+        """
+        self.engine = engine
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer")
+        self._error: Exception | None = None
+
+    def __enter__(self) -> Self:
+        """Start the writer thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Wait for all queued tables to be written, and re-raise any write errors."""
+        self._queue.put(self._DONE)
+        self._thread.join()
+        if self._error is not None and exc_info[0] is None:
+            raise self._error
+
+    def write(self, table_name: str, df: pd.DataFrame, dtype: dict[str, Any]) -> None:
+        """Queue a dataframe to be appended to the given table.
+
+        Raises:
+            Exception: if writing a previously queued table failed.
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put((table_name, df, dtype))
+
+    def _run(self) -> None:
+        with self.engine.connect() as conn:
+            while (item := self._queue.get()) is not self._DONE:
+                # Once a write has failed, keep emptying the queue so that the
+                # producer is never blocked, but don't write anything else.
+                if self._error is not None:
+                    continue
+                table_name, df, dtype = item
+                logger.info(f"SQLite: loading {len(df)} rows into {table_name}.")
+                try:
+                    df.to_sql(
+                        table_name,
+                        conn,
+                        if_exists="append",
+                        chunksize=100000,
+                        dtype=dtype,
+                        index=False,
+                    )
+                    conn.commit()
+                except Exception as err:
+                    conn.rollback()
+                    self._error = err
+
+
 class FercDbfExtractor:
     """Generalized class for loading data from foxpro databases into SQLAlchemy.
 
@@ -422,6 +639,10 @@ class FercDbfExtractor:
     respondent_ids).
 
     The extraction logic is invoked by calling execute() method of this class.
+
+    Each table is loaded from every partition in parallel worker processes, and is
+    written to sqlite by a single writer thread while the following tables are being
+    loaded. The dbf reader is pickled and sent to each of the worker processes.
     """
 
     DATABASE_NAME = None
@@ -432,6 +653,7 @@ class FercDbfExtractor:
         datastore: Datastore,
         settings: FercToSqliteSettings,
         output_path: Path,
+        workers: int | None = None,
     ):
         """Constructs new instance of FercDbfExtractor.
 
@@ -439,10 +661,13 @@ class FercDbfExtractor:
             datastore: top-level datastore instance for accessing raw data files.
             settings: generic settings object for this extrctor.
             output_path: directory where the output databases should be stored.
+            workers: number of worker processes used to load the dbf tables. Defaults
+                to the number of CPUs. If 1, tables are loaded in this process.
         """
         self.settings: GenericDatasetSettings = self.get_settings(settings)
         self.output_path = output_path
         self.datastore = datastore
+        self.workers = workers or os.cpu_count() or 1
         self.dbf_reader = self.get_dbf_reader(datastore)
         self.sqlite_engine = sa.create_engine(self.get_db_path())
         self.sqlite_meta = sa.MetaData()
@@ -484,6 +709,7 @@ class FercDbfExtractor:
                 datastore=context.resources.datastore,
                 settings=context.resources.ferc_to_sqlite_settings,
                 output_path=PudlPaths().output_dir,
+                workers=context.resources.runtime_settings.dbf_num_workers,
             )
             dbf_extractor.execute()
 
@@ -563,6 +789,70 @@ class FercDbfExtractor:
             aggregated_df = pd.concat([df.df for df in dfs])
         return aggregated_df
 
+    def _iter_table_dfs_in_parallel(
+        self, partitions: list[dict[str, Any]], executor: ProcessPoolExecutor
+    ) -> Iterator[tuple[str, list[PartitionedDataFrame]]]:
+        """Load tables with a pool of worker processes, one (table, partition) at a time.
+
+        Tables are yielded in order. Partitions of the following tables are submitted
+        to the pool until there are enough of them to keep all of the workers busy,
+        so that decoded tables don't pile up in memory while earlier ones are
+        aggregated and written.
+        """
+        max_pending = 2 * self.workers
+        pending: deque[tuple[str, list[Future]]] = deque()
+        for table in self.dbf_reader.get_table_names():
+            pending.append(
+                (
+                    table,
+                    [
+                        executor.submit(_load_table_partition, table, p)
+                        for p in partitions
+                    ],
+                )
+            )
+            while sum(len(futures) for _, futures in pending) > max_pending:
+                table, futures = pending.popleft()
+                yield table, [pdf for future in futures for pdf in future.result()]
+        while pending:
+            table, futures = pending.popleft()
+            yield table, [pdf for future in futures for pdf in future.result()]
+
+    def _fetch_archives(self, partitions: list[dict[str, Any]]) -> None:
+        """Make sure the archive of each partition is cached before loading tables.
+
+        Partitions of several tables are loaded at once, so without this, the workers
+        could request the same uncached archive concurrently, and download it more
+        than once. The archives are only fetched into the datastore's cache, and not
+        opened, so no open archives are held by the reader.
+        """
+        for p in partitions:
+            self.datastore.prefetch(
+                [self.dbf_reader.get_dataset()], **FercDbfReader._normalize(p)
+            )
+
+    def _iter_table_dfs(
+        self, partitions: list[dict[str, Any]]
+    ) -> Iterator[tuple[str, list[PartitionedDataFrame]]]:
+        """Load each table from all of the partitions, in order."""
+        if self.workers == 1:
+            for table in self.dbf_reader.get_table_names():
+                yield table, self.dbf_reader.load_table_dfs(table, partitions)
+            return
+        self._fetch_archives(partitions)
+        # Workers are spawned rather than forked, so they don't inherit the archives
+        # opened by this process, or the running SQLite writer thread.
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_dbf_worker,
+            initargs=(self.dbf_reader,),
+        ) as executor:
+            try:
+                yield from self._iter_table_dfs_in_parallel(partitions, executor)
+            finally:
+                executor.shutdown(cancel_futures=True)
+
     def load_table_data(self):
         """Loads all tables from fox pro database and writes them to sqlite."""
         partitions = [
@@ -573,32 +863,29 @@ class FercDbfExtractor:
             if self.is_valid_partition(p) and p.get("year", None) in self.settings.years
         ]
         logger.info(
-            f"Loading {self.DATASET} table data from {len(partitions)} partitions."
+            f"Loading {self.DATASET} table data from {len(partitions)} partitions "
+            f"with {self.workers} workers."
         )
-        for table in self.dbf_reader.get_table_names():
-            logger.info(f"Pandas: reading {table} into a DataFrame.")
-            new_df = self.aggregate_table_frames(
-                table, self.dbf_reader.load_table_dfs(table, partitions)
-            )
-            if new_df is None or len(new_df) <= 0:
-                logger.warning(f"Table {table} contains no data, skipping.")
-                continue
-            new_df = self.transform_table(table, new_df)
-
-            logger.debug(f"    {table}: N = {len(new_df)}")
-            if len(new_df) <= 0:
-                continue
-
-            coltypes = {col.name: col.type for col in self.sqlite_meta.tables[table].c}
-            logger.info(f"SQLite: loading {len(new_df)} rows into {table}.")
-            new_df.to_sql(
-                table,
-                self.sqlite_engine,
-                if_exists="append",
-                chunksize=100000,
-                dtype=coltypes,
-                index=False,
-            )
+        with (
+            SQLiteTableWriter(self.sqlite_engine) as writer,
+            contextlib.closing(self._iter_table_dfs(partitions)) as table_dfs,
+        ):
+            for table, dfs in table_dfs:
+                logger.info(f"Pandas: aggregating {table} into a DataFrame.")
+                new_df = self.aggregate_table_frames(table, dfs)
+                if new_df is None or len(new_df) <= 0:
+                    logger.warning(f"Table {table} contains no data, skipping.")
+                    continue
+                new_df = self.transform_table(table, new_df)
+
+                logger.debug(f"    {table}: N = {len(new_df)}")
+                if len(new_df) <= 0:
+                    continue
+
+                coltypes = {
+                    col.name: col.type for col in self.sqlite_meta.tables[table].c
+                }
+                writer.write(table, new_df, dtype=coltypes)
 
     def finalize_schema(self, meta: sa.MetaData) -> sa.MetaData:
         """This method is called just before the schema is written to sqlite.
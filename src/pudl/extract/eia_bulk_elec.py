@@ -12,10 +12,14 @@ tables: one of metadata and one of timeseries. That is the format delivered by t
 module.
 """
 
-import warnings
+import itertools
+import json
 from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
+from zipfile import ZipFile
 
+import numpy as np
 import pandas as pd
 
 from pudl.workspace.datastore import Datastore
@@ -42,65 +46,104 @@ def _filter_for_fuel_receipts_costs_series(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()  # empty
 
 
-def _filter_and_read_to_dataframe(raw_zipfile: Path) -> pd.DataFrame:
+SERIES_PREFIXES: tuple[bytes, ...] = (b"ELEC.RECEIPTS_BTU", b"ELEC.COST_BTU")
+"""Bytes that every line with a fuel receipts or costs series must contain."""
+
+
+def _filter_and_read_to_dataframe(raw_zipfile: Path | BinaryIO) -> pd.DataFrame:
     """Decompress and filter the 1100 MB file down to the 16 MB we actually want.
 
-    This produces a dataframe with all text fields. The timeseries data is left as JSON
-    strings in the 'data' column. The other columns are metadata.
+    The decompressed file is streamed one line at a time, and only the lines that
+    contain one of the :data:`SERIES_PREFIXES` are parsed as JSON, since that's about
+    1% of them. :func:`_filter_for_fuel_receipts_costs_series` then drops any of those
+    lines that only mention the series somewhere other than their ``series_id``.
+
+    This produces a dataframe with all text fields. The timeseries data is left as
+    lists of date/value pairs in the 'data' column. The other columns are metadata.
     """
-    filtered = []
-    # Use chunksize arg to reduce peak memory usage when reading in 1.1 GB file
-    # For reference, the file has ~680k lines and we want around 8.5k
-    with pd.read_json(
-        raw_zipfile, compression="zip", lines=True, chunksize=10_000
-    ) as reader:
-        for chunk in reader:
-            filtered.append(_filter_for_fuel_receipts_costs_series(chunk))
-    out = pd.concat(filtered, ignore_index=True)
-    return out
+    with ZipFile(raw_zipfile) as archive:
+        [member] = archive.namelist()
+        with archive.open(member) as lines:
+            records = [
+                json.loads(line)
+                for line in lines
+                if any(prefix in line for prefix in SERIES_PREFIXES)
+            ]
+    out = _filter_for_fuel_receipts_costs_series(pd.DataFrame.from_records(records))
+    return out.reset_index(drop=True)
 
 
-def _parse_data_column(elec_df: pd.DataFrame) -> pd.DataFrame:
-    out = []
-    for idx in elec_df.index:
-        data_df = pd.DataFrame(elec_df.loc[idx, "data"], columns=["date", "value"])
-        # three possible date formats, only annual/quarterly handled by pd.to_datetime() automatically
-        #   annual data as "YYYY" eg "2020"
-        #   quarterly data as "YYYYQQ" eg "2020Q2"
-        #   monthly data as "YYYYMM" eg "202004"
-        is_monthly = (
-            data_df.iloc[0:5, data_df.columns.get_loc("date")].str.match(r"\d{6}").all()
+def _parse_dates(dates: pd.Series, series_codes: np.ndarray) -> pd.Series:
+    """Parse the dates of the timeseries.
+
+    There are three possible date formats:
+
+    * annual data as "YYYY" eg "2020"
+    * quarterly data as "YYYYQQ" eg "2020Q2"
+    * monthly data as "YYYYMM" eg "202004"
+
+    A series is monthly if its first five dates look like "YYYYMM". The formats are
+    parsed for all of the series at once. Any other dates fall back on dateutil.
+
+    Args:
+        dates: the date strings of every series, one after another.
+        series_codes: which series each date belongs to.
+
+    Returns:
+        The parsed dates.
+    """
+    series_starts = np.flatnonzero(np.r_[True, series_codes[1:] != series_codes[:-1]])
+    position = np.arange(len(dates)) - np.repeat(
+        series_starts, np.diff(np.r_[series_starts, len(dates)])
+    )
+    not_monthly_head = (position < 5) & ~dates.str.match(r"\d{6}").to_numpy(bool)
+    is_monthly = ~np.isin(series_codes, series_codes[not_monthly_head])
+    is_annual = ~is_monthly & dates.str.fullmatch(r"\d{4}").to_numpy(bool)
+    is_quarterly = ~is_monthly & dates.str.fullmatch(r"\d{4}Q[1-4]").to_numpy(bool)
+    is_other = ~(is_monthly | is_annual | is_quarterly)
+
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+    parsed[is_monthly] = pd.to_datetime(dates[is_monthly], format="%Y%m")
+    parsed[is_annual] = pd.to_datetime(dates[is_annual], format="%Y")
+    quarters = dates[is_quarterly]
+    parsed[is_quarterly] = pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": quarters.str[:4].astype(int),
+                "month": 3 * quarters.str[5].astype(int) - 2,
+                "day": 1,
+            }
         )
-        # Unfortunately, the date formats in the EIA bulk electricity data are not
-        # uniform, and so for now we need to fall back on dateutil. Currently this
-        # warning is emitted thousands of times, clogging up the logs.
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                action="ignore",
-                message="Could not infer format, so each element will be parsed individually",
-                category=UserWarning,
-            )
-            if is_monthly:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], format="%Y%m", errors="raise"
-                )
-            else:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], errors="raise"
-                )
-        data_df["series_id"] = elec_df.loc[idx, "series_id"]
-        out.append(data_df)
-    out = pd.concat(out, ignore_index=True, axis=0)
+    )
+    parsed[is_other] = pd.to_datetime(dates[is_other], format="mixed")
+    return parsed
+
+
+def _parse_data_column(elec_df: pd.DataFrame) -> pd.DataFrame:
+    """Flatten the date/value pairs of every series into one timeseries table."""
+    data = elec_df.loc[:, "data"].tolist()
+    lengths = np.array([len(pairs) for pairs in data], dtype=int)
+    pairs = np.array(list(itertools.chain.from_iterable(data)), dtype=object).reshape(
+        -1, 2
+    )
+    series_codes = np.repeat(np.arange(len(data)), lengths)
+    out = pd.DataFrame(
+        {
+            "series_id": elec_df.loc[:, "series_id"].to_numpy()[series_codes],
+            "date": _parse_dates(pd.Series(pairs[:, 0], dtype=str), series_codes),
+            "value": pd.to_numeric(pairs[:, 1]),
+        }
+    )
     out = out.convert_dtypes()
     out.loc[:, "series_id"] = out.loc[:, "series_id"].astype("category", copy=False)
-    return out.loc[:, ["series_id", "date", "value"]]  # reorder cols
+    return out
 
 
 def _extract(raw_zipfile) -> dict[str, pd.DataFrame]:
     """Extract metadata and timeseries from raw EIA bulk electricity data.
 
     Args:
-        raw_zipfile: Path or other file-like object that can be read by pd.read_json()
+        raw_zipfile: Path or file-like object of a zip archive containing the data.
 
     Returns:
         Dictionary of dataframes with keys 'metadata' and 'timeseries'
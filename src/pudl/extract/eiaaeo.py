@@ -2,10 +2,13 @@
 
 import io
 import itertools
+import pickle
 import re
+from collections import defaultdict
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
 import networkx as nx
 import pandas as pd
@@ -17,10 +20,12 @@ from dagster import (
     asset_check,
     multi_asset,
 )
+from dagster import Field as DagsterField
 from pandera import DataFrameModel, Field
 from pydantic import BaseModel
 
 import pudl.logging_helpers
+from pudl.workspace.datastore import Datastore
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -53,6 +58,12 @@ class AEOSeries(BaseModel):
     data: list[tuple[str, str | float]]  # time, value
 
 
+class AEOSeriesId(BaseModel):
+    """Just the ID of an AEO series, so the rest of it can be parsed when needed."""
+
+    series_id: str
+
+
 class AEOTable(DataFrameModel):
     """Data schema for a raw AEO table."""
 
@@ -72,6 +83,100 @@ class AEOTable(DataFrameModel):
     model_case_eiaaeo: str = Field(coerce=True)
 
 
+@dataclass
+class AEOTaxonomyIndex:
+    """The parts of an :class:`AEOTaxonomy` that we need to get its tables.
+
+    This only holds plain data, so that :func:`load_taxonomy` can cache it between
+    runs without depending on how :class:`AEOTaxonomy` is implemented.
+    """
+
+    series_json: dict[str, str]
+    """The JSON of each data series, parsed when the series ends up in a table."""
+    series_cases: dict[str, list[str]]
+    """The names of the cases each data series belongs to."""
+    series_categories: dict[str, list[int]]
+    """The leaf categories that each data series belongs to."""
+    category_names: dict[int, str]
+    """The name of each leaf category."""
+    category_series: dict[int, list[str]]
+    """The data series in each leaf category."""
+    table_categories: dict[str, list[int]]
+    """The categories with the name of each table number."""
+
+    def _series_to_records(
+        self, series_id: str, potential_parents: set[int]
+    ) -> Iterable[dict]:
+        """Turn a data series into records we can feed into a DataFrame.
+
+        This uses the cases indexed when the taxonomy was loaded to figure out
+        what case this series belongs to.
+
+        This series may be associated with multiple different tables in the
+        graph. In that case, we'll need to filter down only to the leaf
+        categories that are relevant to the table we're creating a DataFrame
+        for. We do that by passing in ``potential_parents`` as a parameter.
+        """
+        # we don't expect multiple case nodes to overlap in name. If we make
+        # this a list, then we will raise an error if we do see the wrong size.
+        case_names = self.series_cases[series_id]
+        if len(case_names) != 1:
+            raise ValueError(
+                f"Found multiple AEO cases for series {series_id}: {case_names}"
+            )
+        case_name = case_names[0]
+
+        # We do expect the many leaf categories to share a name, so we use a
+        # set to automatically deduplicate.
+        parent_names = {
+            self.category_names[p_id]
+            for p_id in self.series_categories[series_id]
+            if p_id in potential_parents
+        }
+        if len(parent_names) != 1:
+            raise ValueError(
+                f"Found multiple parents for series {series_id}: {parent_names}"
+            )
+        parent_name = parent_names.pop()
+
+        # in addition to case_name and parent_name, we get some information
+        # from the actual series itself.
+        series = AEOSeries.model_validate_json(self.series_json[series_id])
+
+        # 2024-04-20: we don't sanitize the series/category names here because
+        # we want to preserve all sorts of weird information for the
+        # transformation step.
+        records = (
+            {
+                "projection_year": d[0],
+                "value": d[1],
+                "units": series.units,
+                "series_name": series.name,
+                "category_name": parent_name,
+                "model_case_eiaaeo": case_name,
+            }
+            for d in series.data
+        )
+        return records
+
+    def get_table(self, table_number: int) -> pd.DataFrame:
+        """Get a specific table number as a DataFrame."""
+        matching_category_ids = set(self.table_categories.get(str(table_number), []))
+
+        # many series belong to more than one category, hence turning this into a set
+        matching_series = set(
+            itertools.chain.from_iterable(
+                self.category_series.get(c_id, []) for c_id in matching_category_ids
+            )
+        )
+
+        series_records = itertools.chain.from_iterable(
+            self._series_to_records(series_id, potential_parents=matching_category_ids)
+            for series_id in matching_series
+        )
+        return AEOTable(pd.DataFrame.from_records(series_records))
+
+
 class AEOTaxonomy:
     """Container for *all* the information in one AEO report.
 
@@ -146,35 +251,52 @@ class AEOTaxonomy:
             records: the strings that contain an AEO report to parse.
 
         """
-        categories, series = self.__load_records(records)
-        self.graph = self.__generate_graph(categories, series)
-        generations = self.__generation_invariants()
-        self.__cases = generations[1]
+        categories, series_json = self.__load_records(records)
+        graph = self.__generate_graph(categories, series_json)
+        generations = self.__generation_invariants(graph)
         self.__sanitize_re = re.compile(r"\W+")
+        self.index = AEOTaxonomyIndex(
+            series_json=series_json,
+            series_cases=self.__index_cases(graph, generations),
+            series_categories={
+                series_id: list(graph.predecessors(series_id))
+                for series_id in generations[4]
+            },
+            category_names={c_id: graph.nodes[c_id]["name"] for c_id in generations[3]},
+            category_series={
+                c_id: graph.nodes[c_id].get("childseries", [])
+                for c_id in generations[3]
+            },
+            table_categories=self.__index_tables(graph, generations),
+        )
 
     def __load_records(
         self, records: Iterable[str]
-    ) -> tuple[dict[int, AEOCategory], dict[str, AEOSeries]]:
+    ) -> tuple[dict[int, AEOCategory], dict[str, str]]:
         """Read AEO JSON blob into memory.
 
         A single JSON object can represent either a category or a series, so we
         parse those into two separate mappings.
+
+        Most of the report is the data of the series, and only a few of the series
+        end up in the tables we extract. So we only read the ID of each series here,
+        and keep its JSON to parse into an :class:`AEOSeries` when it's needed.
         """
         all_categories: dict[int, AEOCategory] = {}
-        all_series: dict[str, AEOSeries] = {}
+        all_series: dict[str, str] = {}
         for record in records:
             if "category_id" in record:
                 category = AEOCategory.model_validate_json(record)
                 all_categories[category.category_id] = category
             elif "series_id" in record:
-                series = AEOSeries.model_validate_json(record)
-                all_series[series.series_id] = series
+                series_id = AEOSeriesId.model_validate_json(record).series_id
+                all_series[series_id] = record
             else:
                 raise ValueError(f"Line had neither series nor category ID: {record}")
         return all_categories, all_series
 
     def __generate_graph(
-        self, categories: dict[int, AEOCategory], series: dict[str, AEOSeries]
+        self, categories: dict[int, AEOCategory], series: dict[str, str]
     ) -> nx.DiGraph:
         """Stitch categories and series together into a DAG."""
 
@@ -196,10 +318,13 @@ class AEOTaxonomy:
         )
         graph = nx.DiGraph(incoming_graph_data=edges)
 
-        nx.set_node_attributes(graph, categories | series)
+        nx.set_node_attributes(
+            graph,
+            categories | {series_id: {"series_id": series_id} for series_id in series},
+        )
         return graph
 
-    def __generation_invariants(self) -> list:  # noqa: C901
+    def __generation_invariants(self, graph: nx.DiGraph) -> list:  # noqa: C901
         """Check that the graph behaves the way we expect.
 
         We have a few generic checks for *all* generations - node type,
@@ -211,8 +336,8 @@ class AEOTaxonomy:
         """
 
         def _typecheck(node_id: int | str) -> AEOTaxonomy.EntityType:
-            category_id = self.graph.nodes[node_id].get("category_id")
-            series_id = self.graph.nodes[node_id].get("series_id")
+            category_id = graph.nodes[node_id].get("category_id")
+            series_id = graph.nodes[node_id].get("series_id")
             if category_id is None and series_id is None:
                 return AEOTaxonomy.EntityType.ROOT
             if series_id is None and category_id is not None:
@@ -232,7 +357,7 @@ class AEOTaxonomy:
         def is_series(c):
             return _typecheck(c) == AEOTaxonomy.EntityType.SERIES
 
-        generations = list(nx.topological_generations(self.graph))
+        generations = list(nx.topological_generations(graph))
 
         specs: list[AEOTaxonomy.CheckSpec] = [
             AEOTaxonomy.CheckSpec(
@@ -278,14 +403,14 @@ class AEOTaxonomy:
             ("wrong_in_degree", spec.generation, node_id)
             for spec, generation in zip(specs, generations, strict=True)
             for node_id in generation
-            if not spec.in_degree(self.graph.in_degree(node_id))
+            if not spec.in_degree(graph.in_degree(node_id))
         ]
 
         out_degree_errors = [
             ("wrong_out_degree", spec.generation, node_id)
             for spec, generation in zip(specs, generations, strict=True)
             for node_id in generation
-            if not spec.out_degree(self.graph.out_degree(node_id))
+            if not spec.out_degree(graph.out_degree(node_id))
         ]
 
         errors = type_errors + in_degree_errors + out_degree_errors
@@ -297,7 +422,7 @@ class AEOTaxonomy:
         leaf_cats_no_table_name = [
             c
             for c in generations[3]
-            if not self.graph.nodes[c].get("name", "").lower().startswith("table")
+            if not graph.nodes[c].get("name", "").lower().startswith("table")
         ]
         if len(leaf_cats_no_table_name) != 0:
             errors.append(("no_table_name", "leaf_category", leaf_cats_no_table_name))
@@ -307,91 +432,98 @@ class AEOTaxonomy:
 
         return generations
 
-    def __sanitize(self, s: str) -> str:
-        return re.sub(self.__sanitize_re, "_", s.lower().strip().replace(" : ", "__"))
-
-    def __series_to_records(
-        self, series_id: str, potential_parents: set[int]
-    ) -> pd.DataFrame:
-        """Turn a data series into records we can feed into a DataFrame.
-
-        This uses graph ancestor data to figure out what case this series
-        belongs to.
+    def __index_cases(
+        self, graph: nx.DiGraph, generations: list
+    ) -> dict[str, list[str]]:
+        """Find the names of the cases that each data series belongs to.
 
-        This series may be associated with multiple different tables in the
-        graph. In that case, we'll need to filter down only to the leaf
-        categories that are relevant to the table we're creating a DataFrame
-        for. We do that by passing in ``potential_parents`` as a parameter.
+        Every node inherits the cases of its parents, one generation at a time, so
+        the graph only has to be walked once for all of the series.
         """
-        # we don't expect multiple case nodes to overlap in name. If we make
-        # this a list, then we will raise an error if we do see the wrong size.
-        case_names = [
-            self.graph.nodes[a_id]["name"]
-            for a_id in nx.ancestors(self.graph, series_id)
-            if a_id in self.__cases
-        ]
-        if len(case_names) != 1:
-            raise ValueError(
-                f"Found multiple AEO cases for series {series_id}: {case_names}"
-            )
-        case_name = case_names[0]
-
-        # We do expect the many leaf categories to share a name, so we use a
-        # set to automatically deduplicate.
-        parent_names = {
-            self.graph.nodes[p_id]["name"]
-            for p_id in self.graph.predecessors(series_id)
-            if p_id in potential_parents
+        cases: dict[int | str, frozenset[int]] = {
+            case_id: frozenset([case_id]) for case_id in generations[1]
         }
-        if len(parent_names) != 1:
-            raise ValueError(
-                f"Found multiple parents for series {series_id}: {parent_names}"
+        for node_id in itertools.chain.from_iterable(generations[2:]):
+            cases[node_id] = frozenset().union(
+                *(cases[p_id] for p_id in graph.predecessors(node_id))
             )
-        parent_name = parent_names.pop()
-
-        # in addition to case_name and parent_name, we get some information
-        # from the actual series itself.
-        series = self.graph.nodes[series_id]
+        # Most series belong to the same few sets of cases
+        case_names = {
+            case_ids: [graph.nodes[c_id]["name"] for c_id in case_ids]
+            for case_ids in set(cases.values())
+        }
+        return {series_id: case_names[cases[series_id]] for series_id in generations[4]}
+
+    def __index_tables(
+        self, graph: nx.DiGraph, generations: list
+    ) -> dict[str, list[int]]:
+        """Find the categories with the name of each table number."""
+        tables = defaultdict(list)
+        for c_id in itertools.chain.from_iterable(generations[:4]):
+            name = graph.nodes[c_id].get("name", "")
+            if match := re.match(r"table_(\d+)_", self.__sanitize(name)):
+                tables[match.group(1)].append(c_id)
+        return dict(tables)
 
-        # 2024-04-20: we don't sanitize the series/category names here because
-        # we want to preserve all sorts of weird information for the
-        # transformation step.
-        records = (
-            {
-                "projection_year": d[0],
-                "value": d[1],
-                "units": series["units"],
-                "series_name": series["name"],
-                "category_name": parent_name,
-                "model_case_eiaaeo": case_name,
-            }
-            for d in series["data"]
-        )
-        return records
+    def __sanitize(self, s: str) -> str:
+        return re.sub(self.__sanitize_re, "_", s.lower().strip().replace(" : ", "__"))
 
     def get_table(self, table_number: int) -> pd.DataFrame:
         """Get a specific table number as a DataFrame."""
-        matching_category_ids = {
-            n_id
-            for n_id in self.graph
-            if self.__sanitize(self.graph.nodes.get(n_id).get("name", "")).startswith(
-                f"table_{table_number}_"
-            )
-        }
+        return self.index.get_table(table_number)
 
-        # many series belong to more than one category, hence turning this into a set
-        matching_series = set(
-            itertools.chain.from_iterable(
-                self.graph.nodes[n_id].get("childseries", [])
-                for n_id in matching_category_ids
-            )
-        )
 
-        series_records = itertools.chain.from_iterable(
-            self.__series_to_records(series_id, potential_parents=matching_category_ids)
-            for series_id in matching_series
+AEO_TAXONOMY_CACHE_VERSION = 1
+"""Bump this whenever :class:`AEOTaxonomyIndex` changes, to ignore older caches."""
+
+
+def load_taxonomy(
+    ds: Datastore, year: int, cache_dir: Path | None = None
+) -> AEOTaxonomyIndex:
+    """Load the taxonomy of one AEO report, reusing a previously parsed copy if we can.
+
+    Args:
+        ds: the datastore to get the AEO archive from.
+        year: the year of the AEO report.
+        cache_dir: if given, the index of the parsed taxonomy is pickled to this
+            directory as plain data, under a name that includes the checksum of the
+            AEO archive and :data:`AEO_TAXONOMY_CACHE_VERSION`. Later calls with the
+            same archive load it from there instead of parsing the report again.
+            Cached indexes that can't be loaded are parsed again and overwritten.
+
+    Returns:
+        The index of the parsed AEO taxonomy, which we get the tables from.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        checksum = ds.get_unique_resource_checksum("eiaaeo", year=year)
+        cache_path = (
+            cache_dir
+            / f"aeo{year}_taxonomy_v{AEO_TAXONOMY_CACHE_VERSION}_{checksum}.pkl"
         )
-        return AEOTable(pd.DataFrame.from_records(series_records))
+        if cache_path.exists():
+            logger.info(f"Loading parsed AEO {year} taxonomy from {cache_path}")
+            try:
+                with cache_path.open("rb") as f:
+                    return AEOTaxonomyIndex(**pickle.load(f))  # noqa: S301
+            except Exception as e:
+                logger.warning(
+                    f"Couldn't load parsed AEO {year} taxonomy from {cache_path}, "
+                    f"parsing it again: {e!r}"
+                )
+                cache_path.unlink()
+
+    with ds.get_zipfile_resource("eiaaeo", year=year).open(
+        f"AEO{year}.txt", mode="r"
+    ) as aeo_raw:
+        index = AEOTaxonomy(io.TextIOWrapper(aeo_raw)).index
+
+    if cache_path is not None:
+        logger.info(f"Saving parsed AEO {year} taxonomy to {cache_path}")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump(vars(index), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return index
 
 
 @multi_asset(
@@ -405,6 +537,14 @@ class AEOTaxonomy:
     },
     can_subset=True,
     required_resource_keys={"datastore", "dataset_settings"},
+    config_schema={
+        "taxonomy_cache_dir": DagsterField(
+            str,
+            description="""If set, the parsed AEO taxonomy is saved to this
+                directory, and reused by later runs with the same AEO archive.""",
+            default_value="",
+        ),
+    },
 )
 def raw_eiaaeo(context: AssetExecutionContext):
     """Extract tables from EIA's Annual Energy Outlook.
@@ -425,6 +565,9 @@ def raw_eiaaeo(context: AssetExecutionContext):
     such as a series name and units. Many different dimensions can be inferred
     from the series names, but the data is somewhat heterogeneous so we do not
     try to infer those here and leave that to the transformation step.
+
+    Parsing the taxonomy takes most of the time, so it can be saved to the
+    ``taxonomy_cache_dir`` in the asset config and reused by later runs.
     """
     name_to_number = {
         "raw_eiaaeo__natural_gas_supply_disposition_and_prices": 13,
@@ -437,12 +580,8 @@ def raw_eiaaeo(context: AssetExecutionContext):
     # TODO (daz 2024-04-15): one day, we might want the AEO for more than one
     # year. But for now we only take the first year from the settings.
     year = context.resources.dataset_settings.eia.eiaaeo.years[0]
-    filename = f"AEO{year}.txt"
-
-    with ds.get_zipfile_resource("eiaaeo", year=year).open(
-        filename, mode="r"
-    ) as aeo_raw:
-        taxonomy = AEOTaxonomy(io.TextIOWrapper(aeo_raw))
+    cache_dir = context.op_config["taxonomy_cache_dir"]
+    taxonomy = load_taxonomy(ds, year, cache_dir=Path(cache_dir) if cache_dir else None)
 
     selected = context.op_execution_context.selected_output_names
     for asset_name in selected:
@@ -20,10 +20,14 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -137,6 +141,30 @@ API_DTYPE_DICT = {
 }
 
 
+API_CSV_BLOCK_SIZE = 64 * 2**20
+"""int: Bytes of CSV parsed into each record batch when streaming a quarterly file.
+
+At roughly 100 bytes per hourly record this is about 650,000 rows per batch.
+"""
+
+
+def _pandas_to_arrow_dtype(dtype: pd.api.extensions.ExtensionDtype) -> pa.DataType:
+    """Get the Arrow type used to parse a CSV column with the given pandas dtype."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype.numpy_dtype)
+
+
+ARROW_TO_PANDAS_DTYPES = {
+    _pandas_to_arrow_dtype(dtype): dtype
+    for dtype in API_DTYPE_DICT.values()
+    if not isinstance(dtype, pd.CategoricalDtype)
+}
+"""Dict: Nullable pandas dtypes to use when converting parsed CEMS batches to pandas."""
+
+
 class EpaCemsPartition(BaseModel):
     """Represents EpaCems partition identifying unique resource file."""
 
@@ -160,12 +188,28 @@ class EpaCemsPartition(BaseModel):
         )
 
 
+def _concat_batches(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate batches of CEMS data, combining the categories of each column.
+
+    Each batch only has the categories that appear in it, and concatenating
+    categoricals with different categories would give object columns instead.
+    """
+    for col in dfs[0].columns:
+        if isinstance(dfs[0][col].dtype, pd.CategoricalDtype):
+            categories = pd.Index(
+                sorted(set().union(*(df[col].cat.categories for df in dfs)))
+            )
+            for df in dfs:
+                df[col] = df[col].cat.set_categories(categories)
+    return pd.concat(dfs, ignore_index=True)
+
+
 class EpaCemsDatastore:
     """Helper class to extract EpaCems resources from datastore.
 
     EpaCems resources are identified by a year and a quarter. Each of these zip files
-    contains one csv file. This class implements get_data_frame method that will
-    rename columns for a quarterly CSV file.
+    contains one csv file. This class streams the quarterly CSV directly out of the zip
+    archive, and can either yield it in batches, or return it as a single dataframe.
     """
 
     def __init__(self, datastore: Datastore):
@@ -174,48 +218,84 @@ class EpaCemsDatastore:
 
     def get_data_frame(self, partition: EpaCemsPartition) -> pd.DataFrame:
         """Constructs dataframe from a zipfile for a given (year_quarter) partition."""
-        with (
-            self.datastore.get_zipfile_resource(
-                "epacems", **partition.get_filters()
-            ) as zf,
-            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
-        ):
-            df = self._csv_to_dataframe(
+        return _concat_batches(list(self.get_batches(partition)))
+
+    def get_batches(
+        self, partition: EpaCemsPartition, block_size: int = API_CSV_BLOCK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Stream dataframes from a zipfile for a given (year_quarter) partition.
+
+        The CSV is decompressed straight out of the zip archive, so only one batch of
+        the quarter is ever held in memory. The archive is looked up when this is
+        called, rather than when the first batch is read.
+
+        Args:
+            partition: the year_quarter to read.
+            block_size: bytes of CSV to parse into each batch.
+
+        Returns:
+            Renamed and dtyped dataframes, each containing a block of the CSV.
+
+        Raises:
+            KeyError: if there is no archive for the partition.
+        """
+        zf = self.datastore.get_zipfile_resource("epacems", **partition.get_filters())
+        return self._iter_batches(zf, partition, block_size)
+
+    def _iter_batches(
+        self, zf: zipfile.ZipFile, partition: EpaCemsPartition, block_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Stream dataframes out of an opened archive, closing it when they're done."""
+        with zf, zf.open(str(partition.get_quarterly_file()), "r") as csv_file:
+            yield from self._csv_to_dataframes(
                 csv_file,
                 ignore_cols=API_IGNORE_COLS,
                 rename_dict=API_RENAME_DICT,
                 dtype_dict=API_DTYPE_DICT,
+                block_size=block_size,
             )
-        return df
 
-    def _csv_to_dataframe(
+    def _csv_to_dataframes(
         self,
-        csv_path: Path,
-        ignore_cols: dict[str, str],
+        csv_file: IO[bytes],
+        ignore_cols: set[str],
         rename_dict: dict[str, str],
-        dtype_dict: dict[str, type],
-        chunksize: int = 100_000,
-    ) -> pd.DataFrame:
-        """Convert a CEMS csv file into a :class:`pandas.DataFrame`.
+        dtype_dict: dict[str, pd.api.extensions.ExtensionDtype],
+        block_size: int = API_CSV_BLOCK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a CEMS csv file into a series of :class:`pandas.DataFrame` batches.
+
+        Column types are applied by the Arrow CSV parser as the file is read, rather
+        than by re-casting a dataframe afterwards, and ignored columns are dropped from
+        each batch before it is converted to pandas.
 
         Args:
-            csv_path: Path to CSV file containing data to read.
+            csv_file: binary file-like object containing the CSV data to read.
+            ignore_cols: names of columns in the CSV which should not be read.
+            rename_dict: mapping of CSV column names to PUDL column names.
+            dtype_dict: mapping of CSV column names to pandas dtypes.
+            block_size: bytes of CSV to parse into each batch.
 
-        Returns:
-            A DataFrame containing the filtered and dtyped contents of the CSV file.
+        Yields:
+            DataFrames containing the filtered and dtyped contents of each CSV block.
         """
-        chunk_iter = pd.read_csv(
-            csv_path,
-            index_col=False,
-            usecols=lambda col: col not in ignore_cols,
-            dtype=dtype_dict,
-            chunksize=chunksize,
-            low_memory=True,
-            parse_dates=["Date"],
+        reader = csv.open_csv(
+            csv_file,
+            read_options=csv.ReadOptions(block_size=block_size),
+            convert_options=csv.ConvertOptions(
+                column_types={
+                    col: _pandas_to_arrow_dtype(dtype)
+                    for col, dtype in dtype_dict.items()
+                },
+                strings_can_be_null=True,
+            ),
         )
-        df = pd.concat(chunk_iter)
-        dtypes = {k: v for k, v in dtype_dict.items() if k in df.columns}
-        return df.astype(dtypes).rename(columns=rename_dict)
+        keep_cols = [col for col in reader.schema.names if col not in ignore_cols]
+        new_names = [rename_dict.get(col, col) for col in keep_cols]
+        for batch in reader:
+            yield pa.RecordBatch.from_arrays(
+                [batch.column(col) for col in keep_cols], names=new_names
+            ).to_pandas(types_mapper=ARROW_TO_PANDAS_DTYPES.get)
 
 
 def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
@@ -230,13 +310,41 @@ def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
     ds = EpaCemsDatastore(ds)
     partition = EpaCemsPartition(year_quarter=year_quarter)
     year = partition.year
-    # We have to assign the reporting year for partitioning purposes
+    logger.info(f"Extracting data frame for {year_quarter}")
     try:
-        logger.info(f"Extracting data frame for {year_quarter}")
-        df = ds.get_data_frame(partition).assign(year=year)
+        batches = ds.get_batches(partition)
     # If the requested quarter is not found, return an empty df with expected columns:
     except KeyError:
         logger.warning(f"No data found for {year_quarter}. Returning empty dataframe.")
         res = Resource.from_id("core_epacems__hourly_emissions")
-        df = res.format_df(pd.DataFrame())
-    return df
+        return res.format_df(pd.DataFrame())
+    # We have to assign the reporting year for partitioning purposes
+    return _concat_batches(list(batches)).assign(year=year)
+
+
+def extract_batches(year_quarter: str, ds: Datastore) -> Iterator[pd.DataFrame]:
+    """Stream the extraction of EPA CEMS hourly DataFrames in batches.
+
+    Unlike :func:`extract`, which materializes a whole quarter at once, this yields
+    the quarter a block of rows at a time so it can be transformed and written out
+    incrementally.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+    Yields:
+        Batches of one quarter of EPA CEMS hourly emissions data. If the requested
+        quarter is not found, nothing is yielded.
+    """
+    ds = EpaCemsDatastore(ds)
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    year = partition.year
+    logger.info(f"Extracting data frame batches for {year_quarter}")
+    try:
+        batches = ds.get_batches(partition)
+    except KeyError:
+        logger.warning(f"No data found for {year_quarter}.")
+        return
+    # We have to assign the reporting year for partitioning purposes
+    for df in batches:
+        yield df.assign(year=year)
@@ -83,6 +83,15 @@ def ferc_to_sqlite_job_factory(
         "Defaults to using the number of CPUs."
     ),
 )
+@click.option(
+    "--dbf-workers",
+    type=int,
+    default=None,
+    help=(
+        "Number of worker processes to use when loading FERC DBF tables. "
+        "Defaults to using the number of CPUs."
+    ),
+)
 @click.option(
     "--dagster-workers",
     type=int,
@@ -138,6 +147,7 @@ def main(
     etl_settings_yml: pathlib.Path,
     batch_size: int,
     workers: int | None,
+    dbf_workers: int | None,
     dagster_workers: int,
     gcs_cache_path: str,
     logfile: pathlib.Path,
@@ -178,6 +188,7 @@ def main(
                 "config": {
                     "xbrl_num_workers": workers,
                     "xbrl_batch_size": batch_size,
+                    "dbf_num_workers": dbf_workers,
                 },
             },
         },
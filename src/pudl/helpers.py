@@ -446,18 +446,141 @@ def full_timeseries_date_merge(
     return out
 
 
-def _add_suffix_to_date_on(date_on):
-    """Check date_on list is valid and add _temp_for_merge suffix."""
-    if date_on is None:
-        date_on = ["year"]
-    date_on_suffix = []
+def _period_codes(dates: pd.Series, date_on: list[str]) -> np.ndarray:
+    """Encode the ``date_on`` parts of each date as a single integer period code.
+
+    Two dates get the same code if and only if they share all of the ``date_on`` parts,
+    and codes sort in the same order as the parts, so merging on the codes is the same
+    as merging on each of the parts. The parts that aren't in ``date_on`` are left out
+    of the code, and all missing dates share a code.
+
+    The parts are always encoded from the largest to the smallest (year, quarter,
+    month, day), whatever order they're listed in ``date_on``. So the rows of an outer
+    merge on the codes are sorted by date, even if ``date_on`` isn't in that order.
+
+    Args:
+        dates: Datetimes to encode.
+        date_on: The parts of the dates to encode. Values in this list must be
+            [``year``, ``quarter``, ``month``, ``day``].
+
+    Returns:
+        The period code of each date.
+
+    Raises:
+        AssertionError: if any of the values in ``date_on`` isn't a date part.
+    """
+    date_parts = {"year": None, "quarter": 5, "month": 13, "day": 32}
     for col in date_on:
-        if col not in ["year", "month", "quarter", "day"]:
+        if col not in date_parts:
             raise AssertionError(
                 logger.error(f"{col} is not a valid string in date_on column list.")
             )
-        date_on_suffix.append(col + "_temp_for_merge")
-    return date_on_suffix
+    codes = np.zeros(len(dates), dtype="int64")
+    for part, radix in date_parts.items():
+        if radix is not None:
+            codes *= radix
+        if part in date_on:
+            codes += getattr(dates.dt, part).fillna(0).to_numpy("int64")
+    # Like missing dates, this sorts after all the other codes in outer merges
+    codes[dates.isna().to_numpy()] = np.iinfo("int64").max
+    return codes
+
+
+def take_rows(
+    col: pd.Series, rows: np.ndarray, allow_fill: bool
+) -> np.ndarray | pd.api.extensions.ExtensionArray:
+    """Select the values of a column at the given positions, where -1 means null.
+
+    Extension arrays are taken as they are, but numpy-backed columns are passed to
+    :func:`pandas.api.extensions.take` as plain arrays.
+
+    Args:
+        col: The column to take values from.
+        rows: The position of each value to take.
+        allow_fill: Whether -1 in ``rows`` gives a null value. Only set this if some
+            of the ``rows`` are -1, as filling may change the dtype.
+
+    Returns:
+        The values of ``col`` at ``rows``.
+    """
+    values = (
+        col.array
+        if pd.api.types.is_extension_array_dtype(col.dtype)
+        else col.to_numpy()
+    )
+    return pd.api.extensions.take(values, rows, allow_fill=allow_fill)
+
+
+def _period_merge(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    on: list[str],
+    left_periods: np.ndarray,
+    right_periods: np.ndarray,
+    how: Literal["inner", "outer", "left", "right", "cross"] = "inner",
+    suffixes: tuple[str, str] = ("_x", "_y"),
+    **kwargs,
+) -> pd.DataFrame:
+    """Merge two dataframes on shared columns and integer period codes.
+
+    The output is the same as that of :func:`pandas.merge` on the ``on`` columns and
+    the period codes, without the codes. Only the key columns are merged, to find the
+    rows of ``left`` and ``right`` that end up in each row of the output. Then each of
+    the other columns is taken from those rows directly, so neither input is copied
+    and the output is only assembled once.
+
+    Args:
+        left: The left dataframe in the merge.
+        right: The right dataframe in the merge.
+        on: The columns to merge on that are shared between both dataframes.
+        left_periods: The period code of each row in ``left``.
+        right_periods: The period code of each row in ``right``.
+        how: How the dataframes should be merged. See :func:`pandas.merge`.
+        suffixes: Added to the names of columns that are in both dataframes, but
+            aren't merged on.
+        kwargs: Additional arguments to pass to :func:`pandas.merge`.
+
+    Returns:
+        Merged contents of left and right input dataframes.
+    """
+    rows = pd.merge(
+        pd.DataFrame(
+            {"_period_code": left_periods}
+            | {col: left[col].array for col in on}
+            | {"_left_row": np.arange(len(left))}
+        ),
+        pd.DataFrame(
+            {"_period_code": right_periods}
+            | {col: right[col].array for col in on}
+            | {"_right_row": np.arange(len(right))}
+        ),
+        on=["_period_code", *on],
+        how=how,
+        **kwargs,
+    )
+    del rows["_period_code"]
+    # Rows that are only in one of the dataframes have no row in the other one
+    left_rows = rows.pop("_left_row").fillna(-1).to_numpy("int64")
+    right_rows = rows.pop("_right_row").fillna(-1).to_numpy("int64")
+    left_fill = bool((left_rows == -1).any())
+    right_fill = bool((right_rows == -1).any())
+
+    both = left.columns.intersection(right.columns).difference(on)
+    columns = {}
+    for col in left.columns:
+        if col in on:
+            columns[col] = rows.pop(col).array
+        else:
+            columns[col + suffixes[0] if col in both else col] = take_rows(
+                left[col], left_rows, allow_fill=left_fill
+            )
+    for col in right.columns.difference(on, sort=False):
+        columns[col + suffixes[1] if col in both else col] = take_rows(
+            right[col], right_rows, allow_fill=right_fill
+        )
+    # Anything else added by the merge, like an indicator column, goes at the end
+    columns |= {col: rows[col].array for col in rows.columns}
+    return pd.DataFrame(columns, copy=False)
 
 
 def date_merge(
@@ -477,10 +600,10 @@ def date_merge(
     We often need to bring together data that is reported at different
     temporal granularities e.g. monthly basis versus annual basis. This function
     acts as a wrapper on a pandas merge to allow merging at different temporal
-    granularities. The date columns of both dataframes are separated into
-    year, quarter, month, and day columns. Then, the dataframes are merged according
-    to ``how`` on the columns specified by the ``on`` and ``date_on`` argument,
-    which list the new temporal columns to merge on as well any additional shared columns.
+    granularities. The year, quarter, month, and day parts of the dates in both
+    dataframes that are listed in ``date_on`` are encoded as integer period codes.
+    Then, the dataframes are merged according to ``how`` on the period codes and the
+    shared columns listed in ``on``, without copying either dataframe.
     Finally, the datetime column is reconstructed in the output dataframe and
     named according to the ``new_date_col`` parameter.
 
@@ -507,9 +630,10 @@ def date_merge(
             E.g. if a monthly reported dataframe is being merged onto a daily reported
             dataframe, then the merge would be performed on ``["year", "month"]``.
             If one of these temporal columns already exists in the dataframe it will not
-            be clobbered by the merge, as the suffix "_temp_for_merge" is added when
-            expanding the datetime column into year, quarter, month, and day. By default,
-            `date_on` will just include year.
+            be clobbered by the merge, as they are only used to compute the period
+            codes. The order of the list doesn't matter: the rows of outer merges are
+            always sorted by year, then quarter, month and day. By default, `date_on`
+            will just include year.
         how: How the dataframes should be merged. See :func:`pandas.DataFrame.merge`.
         report_at_start: Whether the data in the dataframe whose report date is not being
             kept in the merged output (in most cases the less frequently reported dataframe)
@@ -527,42 +651,36 @@ def date_merge(
         ValueError: if any of the labels referenced in ``on`` are missing from either
             the left or right dataframes.
     """
-
-    def separate_date_cols(df, date_col_name, date_on):
-        out_df = df.copy()
-        out_df.loc[:, date_col_name] = pd.to_datetime(out_df[date_col_name])
-        if "year_temp_for_merge" in date_on:
-            out_df.loc[:, "year_temp_for_merge"] = out_df[date_col_name].dt.year
-        if "quarter_temp_for_merge" in date_on:
-            out_df.loc[:, "quarter_temp_for_merge"] = out_df[date_col_name].dt.quarter
-        if "month_temp_for_merge" in date_on:
-            out_df.loc[:, "month_temp_for_merge"] = out_df[date_col_name].dt.month
-        if "day_temp_for_merge" in date_on:
-            out_df.loc[:, "day_temp_for_merge"] = out_df[date_col_name].dt.day
-        return out_df
-
     right = convert_col_to_datetime(right, right_date_col)
     left = convert_col_to_datetime(left, left_date_col)
-    date_on = _add_suffix_to_date_on(date_on)
-    right = separate_date_cols(right, right_date_col, date_on)
-    left = separate_date_cols(left, left_date_col, date_on)
-    merge_cols = date_on + on
-    out = pd.merge(left, right, on=merge_cols, how=how, **kwargs)
+    if date_on is None:
+        date_on = ["year"]
+    out = _period_merge(
+        left,
+        right,
+        on=on,
+        left_periods=_period_codes(left[left_date_col], date_on),
+        right_periods=_period_codes(right[right_date_col], date_on),
+        how=how,
+        **kwargs,
+    )
 
     suffixes = ["", ""]
     if left_date_col == right_date_col:
         suffixes = kwargs.get("suffixes", ["_x", "_y"])
     # reconstruct the new report date column and clean up columns
-    left_right_date_col = [left_date_col + suffixes[0], right_date_col + suffixes[1]]
+    left_dates = out.pop(left_date_col + suffixes[0])
+    right_dates = out.pop(right_date_col + suffixes[1])
     if report_at_start:
         # keep the later of the two report dates when determining
         # the new report date for each row
-        reconstructed_date = out[left_right_date_col].max(axis=1)
+        keep_left = (left_dates >= right_dates) | right_dates.isna()
     else:
         # keep the earlier of the two report dates
-        reconstructed_date = out[left_right_date_col].min(axis=1)
-    out = out.drop(left_right_date_col + date_on, axis=1)
-    out.insert(loc=0, column=new_date_col, value=reconstructed_date)
+        keep_left = (left_dates <= right_dates) | right_dates.isna()
+    out.insert(
+        loc=0, column=new_date_col, value=left_dates.where(keep_left, right_dates)
+    )
     return out
 
 
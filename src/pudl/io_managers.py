@@ -1,14 +1,21 @@
 """Dagster IO Managers."""
 
+import datetime
 import json
 import re
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from sqlite3 import Connection as SQLiteConnection
+from sqlite3 import OperationalError as SQLiteOperationalError
 from sqlite3 import sqlite_version
 from typing import Any
 
 import dask.dataframe as dd
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import sqlalchemy as sa
 from alembic.autogenerate.api import compare_metadata
@@ -26,7 +33,6 @@ from packaging import version
 from upath import UPath
 
 import pudl
-from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.classes import Package, Resource
 from pudl.workspace.setup import PudlPaths
 
@@ -34,6 +40,336 @@ logger = pudl.logging_helpers.get_logger(__name__)
 
 MINIMUM_SQLITE_VERSION = "3.32.0"
 
+SQLITE_BULK_LOAD_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -1_048_576,
+    "temp_store": "MEMORY",
+}
+"""SQLite PRAGMA settings applied for the duration of a bulk load.
+
+These trade durability for speed: the rollback journal is kept in memory and writes
+are not fsynced. If the process dies mid-load the database may need to be rebuilt,
+which is why bulk loading is opt-in. A negative ``cache_size`` is in KiB (1 GiB here).
+"""
+
+SQLITE_BULK_LOAD_BATCH_SIZE: int = 100_000
+"""Number of rows per Arrow record batch passed to ``executemany`` in a bulk load."""
+
+SQLITE_READ_BATCH_SIZE: int = 100_000
+"""Number of rows fetched from SQLite into each Arrow record batch when reading."""
+
+FRESHEST_XBRL_CACHE_SIZE: int = 8
+"""Number of deduplicated FERC XBRL tables kept in memory between loads.
+
+The least recently loaded tables are dropped first. The cached tables are whole raw
+FERC XBRL tables, and they stay in memory for the life of the process, so this should
+be kept small.
+"""
+
+_freshest_xbrl_tables: OrderedDict[tuple[str, str, int, int, int], pd.DataFrame] = (
+    OrderedDict()
+)
+
+PARQUET_ROW_GROUP_TARGET_BYTES: int = 64 * 2**20
+"""Approximate in-memory size of each row group in PUDL Parquet outputs.
+
+Smaller row groups let date and column filters skip more data when reading, at the
+cost of more per-row-group overhead.
+"""
+
+PARQUET_MAX_ROW_GROUP_ROWS: int = 2**20
+"""Upper bound on the number of rows in a single Parquet row group."""
+
+PARQUET_SORT_PREFIX_COLUMNS: list[str] = ["report_date", "report_year"]
+"""Columns that Parquet outputs are sorted on ahead of their primary keys.
+
+Input filters are typically on the report date or year, which are rarely the leading
+primary key column. Sorting on them first keeps the row group statistics for those
+columns narrow, so filtered reads can skip most row groups.
+"""
+
+ARROW_TO_PANDAS_DTYPES: dict[pa.DataType, pd.api.extensions.ExtensionDtype] = {
+    pa.bool_(): pd.BooleanDtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.string(): pd.StringDtype(),
+}
+"""Nullable pandas dtypes to use when converting Arrow columns read from SQLite."""
+
+
+@contextmanager
+def sqlite_bulk_load_pragmas(
+    dbapi_con: SQLiteConnection,
+    pragmas: dict[str, str | int] = SQLITE_BULK_LOAD_PRAGMAS,
+) -> Iterator[None]:
+    """Temporarily apply bulk load PRAGMAs to a SQLite connection.
+
+    The original values are read before the new ones are applied, and restored on
+    exit even if the load fails, so pooled connections get their durability settings
+    back. PRAGMAs like ``journal_mode`` can't be changed inside a transaction, so this
+    must be entered before the load transaction begins.
+
+    Args:
+        dbapi_con: raw :mod:`sqlite3` connection with no open transaction.
+        pragmas: mapping of PRAGMA name to the value to use during the load.
+    """
+    original = {
+        name: dbapi_con.execute(f"PRAGMA {name}").fetchone()[0] for name in pragmas
+    }
+    try:
+        for name, value in pragmas.items():
+            dbapi_con.execute(f"PRAGMA {name} = {value}")
+        yield
+    finally:
+        for name, value in original.items():
+            dbapi_con.execute(f"PRAGMA {name} = {value}")
+
+
+SQLITE_STORAGE_FORMAT_DIRECTIVES: dict[str, str] = {
+    "%(year)04d": "%Y",
+    "%(month)02d": "%m",
+    "%(day)02d": "%d",
+    "%(hour)02d": "%H",
+    "%(minute)02d": "%M",
+    "%(second)02d": "%S",
+}
+"""Map SQLAlchemy SQLite date/time storage format tokens to strftime directives."""
+
+
+def _prepare_arrow_for_sqlite(
+    arrow_table: pa.Table, sa_table: sa.Table, dialect: sa.Dialect
+) -> tuple[pa.Table, list[Any | None]]:
+    """Pre-format temporal columns and look up bind processors for a bulk load.
+
+    SQLAlchemy stores SQLite dates and datetimes as strings, formatted one value at a
+    time by the column type's bind processor. When the storage format only uses whole
+    date and time components we can produce identical strings for a whole column at
+    once with :func:`pyarrow.compute.strftime` and skip the bind processor entirely.
+    All other columns keep their SQLAlchemy bind processor (if any).
+
+    Args:
+        arrow_table: the data to be loaded.
+        sa_table: SQLAlchemy table the data will be inserted into.
+        dialect: SQLAlchemy dialect of the connection doing the load.
+
+    Returns:
+        The table with temporal columns converted to strings, and a list of bind
+        processors (or ``None``) in column order.
+    """
+    processors = []
+    for i, name in enumerate(arrow_table.column_names):
+        if name not in sa_table.columns:
+            processors.append(None)
+            continue
+        type_impl = sa_table.columns[name].type.dialect_impl(dialect)
+        column = arrow_table.column(i)
+        # SQLite DATE and DATETIME types expose the format they are stored with.
+        strftime_format = getattr(type_impl, "_storage_format", None)
+        if strftime_format is not None:
+            for token, directive in SQLITE_STORAGE_FORMAT_DIRECTIVES.items():
+                strftime_format = strftime_format.replace(token, directive)
+        is_naive_timestamp = (
+            pa.types.is_timestamp(column.type) and column.type.tz is None
+        )
+        if (
+            strftime_format is not None
+            and "%(" not in strftime_format
+            and (is_naive_timestamp or pa.types.is_date(column.type))
+        ):
+            if is_naive_timestamp:
+                # Storage formats truncate to whole seconds, like SQLAlchemy does.
+                column = pc.floor_temporal(column, unit="second")
+            column = pc.strftime(column.cast(pa.timestamp("s")), format=strftime_format)
+            arrow_table = arrow_table.set_column(i, name, column)
+            processors.append(None)
+        else:
+            processors.append(type_impl.bind_processor(dialect))
+    return arrow_table, processors
+
+
+def _arrow_batch_to_rows(
+    batch: pa.RecordBatch, processors: list[Any | None]
+) -> list[tuple]:
+    """Convert an Arrow record batch into row tuples ready for ``executemany``.
+
+    Columns are converted to Python lists in bulk and then zipped into rows, which is
+    much cheaper than building a dict per record. Arrow nulls become ``None``.
+
+    Args:
+        batch: record batch with columns in the same order as the INSERT statement.
+        processors: SQLAlchemy bind processors for each column, or ``None`` if the
+            column's values can be passed to the driver as-is.
+    """
+    columns = []
+    for column, processor in zip(batch.columns, processors, strict=True):
+        values = column.to_pylist()
+        if processor is not None:
+            values = [processor(value) for value in values]
+        columns.append(values)
+    return list(zip(*columns, strict=True))
+
+
+def _sqlite_read_schema(schema: pa.Schema) -> pa.Schema:
+    """Widen a PUDL Arrow schema to hold the 64-bit values stored in SQLite.
+
+    :meth:`pudl.metadata.classes.Resource.to_pyarrow` uses compact 32-bit integers and
+    floats, which is fine for the Parquet outputs, but would lose precision relative to
+    the values stored in the SQLite database.
+    """
+    fields = []
+    for field in schema:
+        if pa.types.is_integer(field.type):
+            field = field.with_type(pa.int64())
+        elif pa.types.is_floating(field.type):
+            field = field.with_type(pa.float64())
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _sqlite_values_to_arrow(values: tuple, field: pa.Field) -> pa.Array:
+    """Convert one column of values fetched from SQLite into a typed Arrow array.
+
+    SQLite stores dates and datetimes as ISO-8601 strings and booleans as integers, so
+    those are parsed with vectorized Arrow casts. Categorical (enum) columns are
+    dictionary encoded so repeated strings are only stored once.
+    """
+    if pa.types.is_dictionary(field.type):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    if pa.types.is_temporal(field.type):
+        return pa.array(values, type=pa.string()).cast(field.type)
+    if pa.types.is_boolean(field.type):
+        return pa.array(values, type=pa.int8()).cast(pa.bool_())
+    return pa.array(values, type=field.type)
+
+
+def read_sqlite_table_to_arrow(
+    con: sa.Connection,
+    table_name: str,
+    schema: pa.Schema,
+    columns: list[str] | None = None,
+    filters: list[tuple[str, str, Any]] | None = None,
+    batch_size: int = SQLITE_READ_BATCH_SIZE,
+) -> pa.Table:
+    """Stream a SQLite table into typed Arrow record batches.
+
+    Rows are fetched ``batch_size`` at a time straight from the DBAPI cursor, transposed
+    into columns and converted into Arrow arrays using the types in ``schema``. Only the
+    Arrow batches are retained, so there is never more than one batch of Python objects
+    in memory at a time.
+
+    Args:
+        con: SQLAlchemy connection to a SQLite database.
+        table_name: name of the table (or view) to read.
+        schema: Arrow schema describing the table, e.g. from
+            :meth:`pudl.metadata.classes.Resource.to_pyarrow`. Integers and floats are
+            read as 64-bit values regardless of their width in the schema.
+        columns: if specified, only read these columns, in this order.
+        filters: if specified, only read rows matching all of these
+            ``(column, op, value)`` filters, as returned by
+            :func:`_get_input_filters`.
+        batch_size: number of rows to fetch into each record batch.
+
+    Returns:
+        An Arrow table with one chunk per record batch.
+    """
+    schema = _sqlite_read_schema(schema)
+    if columns is not None:
+        schema = pa.schema(
+            [schema.field(name) for name in columns], metadata=schema.metadata
+        )
+    quote = con.dialect.identifier_preparer.quote
+    select_stmt = (
+        f"SELECT {', '.join(quote(name) for name in schema.names)} "  # noqa: S608
+        f"FROM {quote(table_name)}"
+    )
+    params = []
+    if filters:
+        # SQLite stores dates as ISO-8601 strings, which sort chronologically.
+        select_stmt += " WHERE " + " AND ".join(
+            f"{quote(col)} {'=' if op == '==' else op} ?" for col, op, _ in filters
+        )
+        params = [
+            value.isoformat() if isinstance(value, datetime.date) else value
+            for _, _, value in filters
+        ]
+    cursor = con.connection.driver_connection.cursor()
+    try:
+        cursor.execute(select_stmt, params)
+        batches = []
+        while rows := cursor.fetchmany(batch_size):
+            arrays = [
+                _sqlite_values_to_arrow(values, field)
+                for values, field in zip(zip(*rows, strict=True), schema, strict=True)
+            ]
+            batches.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    finally:
+        cursor.close()
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def _get_input_columns(context: InputContext, res: Resource) -> list[str] | None:
+    """Get the subset of columns an asset input has asked to load, if any.
+
+    Consumers can declare the columns they need in the input metadata, e.g.
+    ``AssetIn(metadata={"columns": ["plant_id_eia", "net_generation_mwh"]})``.
+    """
+    columns = (context.metadata or {}).get("columns")
+    if columns is None:
+        return None
+    unknown_cols = set(columns).difference(res.get_field_names())
+    if unknown_cols:
+        raise ValueError(
+            f"{res.name}: requested columns {unknown_cols} are not in the table schema."
+        )
+    return list(columns)
+
+
+def _get_input_filters(
+    context: InputContext, res: Resource
+) -> list[tuple[str, str, Any]] | None:
+    """Get the row filters an asset input has declared, if any.
+
+    Consumers can restrict the ``report_date`` and ``report_year`` of the rows they
+    load using the input metadata. Each may be a single value, or an inclusive
+    ``(min, max)`` range, e.g. ``AssetIn(metadata={"report_year": (2020, 2022)})``.
+
+    Returns:
+        Filters in the disjunctive normal form accepted by
+        :func:`pyarrow.parquet.read_table` and :func:`read_sqlite_table_to_arrow`.
+    """
+    metadata = context.metadata or {}
+    filters = []
+    for col in PARQUET_SORT_PREFIX_COLUMNS:
+        value = metadata.get(col)
+        if value is None:
+            continue
+        if col not in res.get_field_names():
+            raise ValueError(
+                f"{res.name}: can't filter on {col}, it isn't in the table."
+            )
+        convert = (lambda x: pd.Timestamp(x).date()) if col == "report_date" else int
+        if isinstance(value, list | tuple):
+            start, end = value
+            filters += [(col, ">=", convert(start)), (col, "<=", convert(end))]
+        else:
+            filters.append((col, "==", convert(value)))
+    return filters or None
+
+
+def _enforce_input_schema(
+    res: Resource, df: pd.DataFrame, columns: list[str] | None
+) -> pd.DataFrame:
+    """Enforce a resource's schema on a dataframe that may hold only some columns.
+
+    If the whole table was loaded the full :meth:`Resource.enforce_schema` checks
+    apply. Projected dataframes may not include the whole primary key, so they are only
+    cast to the resource's column dtypes.
+    """
+    if columns is None:
+        return res.enforce_schema(df, copy=False)
+    dtypes = res.to_pandas_dtypes()
+    return df.loc[:, columns].astype({col: dtypes[col] for col in columns})
+
 
 def get_table_name_from_context(context: OutputContext) -> str:
     """Retrieves the table name from the context object."""
@@ -67,7 +403,15 @@ class PudlMixedFormatIOManager(IOManager):
     read_from_parquet: bool
     """If true, data will be read from parquet files instead of sqlite."""
 
-    def __init__(self, write_to_parquet: bool = False, read_from_parquet: bool = False):
+    bulk_load_sqlite: bool
+    """If true, data will be written to sqlite using the bulk load fast path."""
+
+    def __init__(
+        self,
+        write_to_parquet: bool = False,
+        read_from_parquet: bool = False,
+        bulk_load_sqlite: bool = False,
+    ):
         """Creates new instance of mixed format pudl IO manager.
 
         By default, data is written and read from sqlite, but experimental
@@ -82,6 +426,10 @@ class PudlMixedFormatIOManager(IOManager):
                 read from the sqlite database. Reading from parquet provides
                 performance increases as well as better datatype handling, so
                 this option is encouraged.
+            bulk_load_sqlite: if True, tables will be written to sqlite using the
+                bulk load fast path, which relaxes SQLite durability settings while
+                each table is being written. See
+                :meth:`SQLiteIOManager._bulk_load_dataframe`.
         """
         if read_from_parquet and not write_to_parquet:
             raise RuntimeError(
@@ -89,9 +437,11 @@ class PudlMixedFormatIOManager(IOManager):
             )
         self.write_to_parquet = write_to_parquet
         self.read_from_parquet = read_from_parquet
+        self.bulk_load_sqlite = bulk_load_sqlite
         self._sqlite_io_manager = PudlSQLiteIOManager(
             base_dir=PudlPaths().output_dir,
             db_name="pudl",
+            bulk_load=bulk_load_sqlite,
         )
         self._parquet_io_manager = PudlParquetIOManager()
         if self.write_to_parquet or self.read_from_parquet:
@@ -124,6 +474,7 @@ class SQLiteIOManager(IOManager):
         db_name: str,
         md: sa.MetaData | None = None,
         timeout: float = 1_000.0,
+        bulk_load: bool = False,
     ):
         """Init a SQLiteIOmanager.
 
@@ -137,9 +488,13 @@ class SQLiteIOManager(IOManager):
                 an exception, if the database is locked by another connection.
                 If another connection opens a transaction to modify the database,
                 it will be locked until that transaction is committed.
+            bulk_load: if True, write dataframes using the bulk load fast path
+                (see :meth:`_bulk_load_dataframe`), which relaxes SQLite durability
+                settings while each table is being written.
         """
         self.base_dir = Path(base_dir)
         self.db_name = db_name
+        self.bulk_load = bulk_load
 
         bad_sqlite_version = version.parse(sqlite_version) < version.parse(
             MINIMUM_SQLITE_VERSION
@@ -228,6 +583,10 @@ class SQLiteIOManager(IOManager):
                 f"{table_name} dataframe is missing columns: {column_difference}"
             )
 
+        if self.bulk_load:
+            self._bulk_load_dataframe(sa_table, df)
+            return
+
         engine = self.engine
         with engine.begin() as con:
             # Remove old table records before loading to db
@@ -243,6 +602,77 @@ class SQLiteIOManager(IOManager):
                 dtype={c.name: c.type for c in sa_table.columns},
             )
 
+    def _bulk_load_dataframe(self, sa_table: sa.Table, df: pd.DataFrame) -> None:
+        """Replace the contents of a table using the bulk load fast path.
+
+        Instead of :meth:`pandas.DataFrame.to_sql`, which builds a dict per record,
+        the dataframe is converted to Arrow once and written in record batches using
+        ``executemany`` with positional parameters. For the duration of the load the
+        :data:`SQLITE_BULK_LOAD_PRAGMAS` are applied to the connection, and any
+        explicit indexes on the table are dropped and recreated once all the rows
+        have been inserted. The implicit indexes SQLite creates for primary key and
+        unique constraints can't be deferred this way.
+
+        Values are passed through the same SQLAlchemy bind processors that
+        :meth:`pandas.DataFrame.to_sql` would use, so dates and datetimes are stored
+        with identical string representations and all the table's check constraints
+        still apply.
+
+        Args:
+            sa_table: SQLAlchemy table to replace the contents of.
+            df: dataframe to write to the database.
+        """
+        table_name = sa_table.name
+        try:
+            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as err:
+            logger.warning(
+                f"{table_name}: could not convert dataframe to Arrow for bulk "
+                f"loading ({err}). Falling back to DataFrame.to_sql()."
+            )
+            with self.engine.begin() as con:
+                con.execute(sa_table.delete())
+                df.to_sql(
+                    table_name,
+                    con,
+                    if_exists="append",
+                    index=False,
+                    chunksize=SQLITE_BULK_LOAD_BATCH_SIZE,
+                    dtype={c.name: c.type for c in sa_table.columns},
+                )
+            return
+
+        with self.engine.connect() as con:
+            dialect = con.dialect
+            quote = dialect.identifier_preparer.quote
+            column_names = arrow_table.column_names
+            insert_stmt = (
+                f"INSERT INTO {quote(table_name)} "  # noqa: S608
+                f"({', '.join(quote(name) for name in column_names)}) "
+                f"VALUES ({', '.join('?' for _ in column_names)})"
+            )
+            arrow_table, processors = _prepare_arrow_for_sqlite(
+                arrow_table, sa_table, dialect
+            )
+            indexes = list(sa_table.indexes)
+
+            with (
+                sqlite_bulk_load_pragmas(con.connection.driver_connection),
+                con.begin(),
+            ):
+                # Remove old table records before loading to db
+                con.execute(sa_table.delete())
+                for index in indexes:
+                    index.drop(bind=con)
+                for batch in arrow_table.to_batches(
+                    max_chunksize=SQLITE_BULK_LOAD_BATCH_SIZE
+                ):
+                    con.exec_driver_sql(
+                        insert_stmt, _arrow_batch_to_rows(batch, processors)
+                    )
+                for index in indexes:
+                    index.create(bind=con)
+
     # TODO (bendnorman): Create a SQLQuery type so it's clearer what this method expects
     def _handle_str_output(self, context: OutputContext, query: str):
         """Execute a sql query on the database.
@@ -321,7 +751,37 @@ class SQLiteIOManager(IOManager):
 
 
 class PudlParquetIOManager(IOManager):
-    """IOManager that writes pudl tables to pyarrow parquet files."""
+    """IOManager that writes pudl tables to pyarrow parquet files.
+
+    Tables are sorted by report date or year and then by primary key before they are
+    written in size-bounded row groups with column statistics. Asset inputs can declare
+    the ``columns`` they need and ``report_date`` or ``report_year`` filters in their
+    metadata, which are pushed down into the Parquet reader as a column projection and
+    row group predicates.
+    """
+
+    @staticmethod
+    def _get_sort_columns(res: Resource) -> list[str]:
+        """Columns to sort a table by before writing it to Parquet."""
+        field_names = res.get_field_names()
+        sort_cols = [col for col in PARQUET_SORT_PREFIX_COLUMNS if col in field_names]
+        return sort_cols + [
+            col for col in (res.schema.primary_key or []) if col not in sort_cols
+        ]
+
+    @staticmethod
+    def _get_row_group_size(table: pa.Table) -> int:
+        """Number of rows per row group to keep each one near the target size."""
+        if table.num_rows == 0:
+            return PARQUET_MAX_ROW_GROUP_ROWS
+        bytes_per_row = max(1, table.nbytes // table.num_rows)
+        return max(
+            1,
+            min(
+                PARQUET_MAX_ROW_GROUP_ROWS,
+                PARQUET_ROW_GROUP_TARGET_BYTES // bytes_per_row,
+            ),
+        )
 
     def handle_output(self, context: OutputContext, df: Any) -> None:
         """Writes pudl dataframe to parquet file."""
@@ -332,24 +792,32 @@ class PudlParquetIOManager(IOManager):
         res = Resource.from_id(table_name)
 
         df = res.enforce_schema(df)
+        if sort_cols := self._get_sort_columns(res):
+            df = df.sort_values(sort_cols, ignore_index=True)
         schema = res.to_pyarrow()
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
         with pq.ParquetWriter(
             where=parquet_path,
             schema=schema,
             compression="snappy",
             version="2.6",
+            write_statistics=True,
         ) as writer:
-            writer.write_table(
-                pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            )
+            writer.write_table(table, row_group_size=self._get_row_group_size(table))
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Loads pudl table from parquet file."""
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
-        return res.enforce_schema(df)
+        columns = _get_input_columns(context, res)
+        df = pq.read_table(
+            source=parquet_path,
+            schema=res.to_pyarrow(),
+            columns=columns,
+            filters=_get_input_filters(context, res),
+        ).to_pandas()
+        return _enforce_input_schema(res, df, columns)
 
 
 class PudlSQLiteIOManager(SQLiteIOManager):
@@ -365,6 +833,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         db_name: str,
         package: Package | None = None,
         timeout: float = 1_000.0,
+        bulk_load: bool = False,
     ):
         """Initialize PudlSQLiteIOManager.
 
@@ -391,9 +860,11 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 exception, if the database is locked by another connection.  If another
                 connection opens a transaction to modify the database, it will be locked
                 until that transaction is committed.
+            bulk_load: if True, write dataframes using the SQLite bulk load fast
+                path. See :meth:`SQLiteIOManager._bulk_load_dataframe`.
         """
         if package is None:
-            package = PUDL_PACKAGE
+            package = pudl.metadata.PUDL_PACKAGE
         self.package = package
         md = self.package.to_sql()
         sqlite_path = Path(base_dir) / f"{db_name}.sqlite"
@@ -402,7 +873,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 f"{sqlite_path} not initialized! Run `alembic upgrade head`."
             )
 
-        super().__init__(base_dir, db_name, md, timeout)
+        super().__init__(base_dir, db_name, md, timeout, bulk_load)
 
         existing_schema_context = MigrationContext.configure(self.engine.connect())
         metadata_diff = compare_metadata(existing_schema_context, self.md)
@@ -453,6 +924,10 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
+        if self.bulk_load:
+            self._bulk_load_dataframe(sa_table, df)
+            return
+
         with self.engine.begin() as con:
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
@@ -469,6 +944,13 @@ class PudlSQLiteIOManager(SQLiteIOManager):
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Load a dataframe from a sqlite database.
 
+        The table is streamed into typed Arrow record batches (see
+        :func:`read_sqlite_table_to_arrow`) and converted to pandas once, so only one
+        full copy of the table is ever held in pandas. If the input metadata includes
+        a list of ``columns``, only those columns are read from the database, and any
+        ``report_date`` or ``report_year`` filters (see :func:`_get_input_filters`)
+        are applied in the query, like they are when reading from Parquet.
+
         Args:
             context: dagster keyword that provides access output information like asset
                 name.
@@ -486,29 +968,39 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 "the tables that does not get loaded into the PUDL SQLite DB because "
                 "it's a work in progress or is distributed in Apache Parquet format."
             ) from err
+        columns = _get_input_columns(context, res)
+        filters = _get_input_filters(context, res)
 
         with self.engine.begin() as con:
             try:
-                df = pd.concat(
-                    [
-                        res.enforce_schema(chunk_df)
-                        for chunk_df in pd.read_sql_table(
-                            table_name, con, chunksize=100_000
-                        )
-                    ]
+                arrow_table = read_sqlite_table_to_arrow(
+                    con,
+                    table_name,
+                    schema=res.to_pyarrow(),
+                    columns=columns,
+                    filters=filters,
                 )
-            except ValueError as err:
+            except SQLiteOperationalError as err:
+                if "no such table" not in str(err):
+                    raise
                 raise ValueError(
                     f"{table_name} not found. Either the table was dropped "
                     "or it doesn't exist in the pudl.metadata.resources."
                     "Add the table to the metadata and recreate the database."
                 ) from err
-            if df.empty:
-                raise AssertionError(
-                    f"The {table_name} table is empty. Materialize the {table_name} "
-                    "asset so it is available in the database."
-                )
-        return df
+        if arrow_table.num_rows == 0 and filters is None:
+            raise AssertionError(
+                f"The {table_name} table is empty. Materialize the {table_name} "
+                "asset so it is available in the database."
+            )
+        df = arrow_table.to_pandas(
+            date_as_object=False,
+            types_mapper=ARROW_TO_PANDAS_DTYPES.get,
+            split_blocks=True,
+            self_destruct=True,
+        )
+        del arrow_table
+        return _enforce_input_schema(res, df, columns)
 
 
 @io_manager(
@@ -526,6 +1018,14 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 SQLite database.""",
             default_value=True,
         ),
+        "bulk_load_sqlite": Field(
+            bool,
+            description="""If True, tables will be written to the SQLite database
+                using Arrow record batches and relaxed durability PRAGMAs. Faster
+                for large tables, but an interrupted write may leave the database
+                in need of rebuilding.""",
+            default_value=False,
+        ),
     }
 )
 def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager:
@@ -533,6 +1033,7 @@ def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager
     return PudlMixedFormatIOManager(
         write_to_parquet=init_context.resource_config["write_to_parquet"],
         read_from_parquet=init_context.resource_config["read_from_parquet"],
+        bulk_load_sqlite=init_context.resource_config["bulk_load_sqlite"],
     )
 
 
@@ -717,17 +1218,22 @@ class FercXBRLSQLiteIOManager(FercSQLiteIOManager):
             """Take the latest reported non-null value for each group."""
             return duped_groups.last()
 
-        def __best_snapshot(
-            duped_groups: pd.core.groupby.DataFrameGroupBy,
-        ) -> pd.DataFrame:
-            """Take the row that has most non-null values out of each group."""
-            # Ignore errors when dropping the "count" column since empty
-            # groupby won't have this column.
-            return duped_groups.apply(
-                lambda df: df.assign(count=df.count(axis="columns"))
-                .sort_values(by="count", ascending=True)
-                .tail(1)
-            ).drop(columns="count", errors="ignore")
+        def __best_snapshot(duped: pd.DataFrame) -> pd.DataFrame:
+            """Take the row that has most non-null values out of each group.
+
+            Rows are sorted by publication time, so within each group the most recently
+            published of the rows with the most values is taken.
+            """
+            # Reversed, so idxmax() finds the last of the tied rows
+            reversed_duped = duped.iloc[::-1].reset_index(drop=True)
+            best_rows = (
+                reversed_duped.count(axis="columns")
+                .groupby(
+                    [reversed_duped[col] for col in xbrl_context_cols], dropna=True
+                )
+                .idxmax()
+            )
+            return reversed_duped.loc[best_rows]
 
         def __compare_dedupe_methodologies(
             apply_diffs: pd.DataFrame, best_snapshot: pd.DataFrame
@@ -772,12 +1278,11 @@ class FercXBRLSQLiteIOManager(FercSQLiteIOManager):
         xbrl_context_cols = [c for c in primary_key if c not in filing_metadata_cols]
         original = table.sort_values("publication_time")
         dupe_mask = original.duplicated(subset=xbrl_context_cols, keep=False)
-        duped_groups = original.loc[dupe_mask].groupby(
-            xbrl_context_cols, as_index=False, dropna=True
-        )
+        duped = original.loc[dupe_mask]
+        duped_groups = duped.groupby(xbrl_context_cols, as_index=False, dropna=True)
         never_duped = original.loc[~dupe_mask]
         apply_diffs = __apply_diffs(duped_groups)
-        best_snapshot = __best_snapshot(duped_groups)
+        best_snapshot = __best_snapshot(duped)
         __compare_dedupe_methodologies(
             apply_diffs=apply_diffs, best_snapshot=best_snapshot
         )
@@ -804,7 +1309,7 @@ class FercXBRLSQLiteIOManager(FercSQLiteIOManager):
             datetimes = pd.to_datetime(df.loc[:, col])
             if datetimes.isna().any():
                 raise ValueError(f"{col} has null values!")
-            return datetimes.apply(lambda x: x.year)
+            return datetimes.dt.year.astype("int64")
 
         if is_duration:
             start_years = get_year(df, "start_date")
@@ -865,6 +1370,42 @@ class FercXBRLSQLiteIOManager(FercSQLiteIOManager):
         if table_name not in self.md.tables:
             return pd.DataFrame()
 
+        return (
+            self._load_freshest_data(table_name)
+            .pipe(
+                FercXBRLSQLiteIOManager.refine_report_year,
+                xbrl_years=ferc1_settings.xbrl_years,
+            )
+            .drop(columns=["publication_time"])
+        )
+
+    def _load_freshest_data(self, table_name: str) -> pd.DataFrame:
+        """Read a table and keep the freshest data for each XBRL context.
+
+        The deduplicated tables are cached in memory, and reused until the database
+        file is modified or replaced, so that loading the same table again is fast. Up
+        to :data:`FRESHEST_XBRL_CACHE_SIZE` tables are kept. The cached dataframes are
+        shared, so they shouldn't be modified in place.
+
+        Args:
+            table_name: The name of the table to read.
+
+        Returns:
+            The output of :meth:`filter_for_freshest_data` for the table.
+        """
+        db_path = self.base_dir / f"{self.db_name}.sqlite"
+        db_stat = db_path.stat()
+        cache_key = (
+            str(db_path),
+            table_name,
+            db_stat.st_mtime_ns,
+            db_stat.st_size,
+            db_stat.st_ino,
+        )
+        if cache_key in _freshest_xbrl_tables:
+            _freshest_xbrl_tables.move_to_end(cache_key)
+            return _freshest_xbrl_tables[cache_key]
+
         engine = self.engine
 
         sched_table_name = re.sub("_instant|_duration", "", table_name)
@@ -875,18 +1416,13 @@ class FercXBRLSQLiteIOManager(FercSQLiteIOManager):
             ).assign(sched_table_name=sched_table_name)
 
         primary_key = self._get_primary_key(table_name)
-
-        return (
-            df.pipe(
-                FercXBRLSQLiteIOManager.filter_for_freshest_data,
-                primary_key=primary_key,
-            )
-            .pipe(
-                FercXBRLSQLiteIOManager.refine_report_year,
-                xbrl_years=ferc1_settings.xbrl_years,
-            )
-            .drop(columns=["publication_time"])
+        df = FercXBRLSQLiteIOManager.filter_for_freshest_data(
+            df, primary_key=primary_key
         )
+        _freshest_xbrl_tables[cache_key] = df
+        if len(_freshest_xbrl_tables) > FRESHEST_XBRL_CACHE_SIZE:
+            _freshest_xbrl_tables.popitem(last=False)
+        return df
 
 
 @io_manager(required_resource_keys={"dataset_settings"})
@@ -12,4 +12,10 @@ from . import (
     resources,
     sources,
 )
-from .classes import PUDL_PACKAGE
+
+
+def __getattr__(name: str):
+    """Build :data:`PUDL_PACKAGE` on first access, see :mod:`pudl.metadata.classes`."""
+    if name == "PUDL_PACKAGE":
+        return classes.PUDL_PACKAGE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -832,7 +832,16 @@ class Schema(PudlMeta):
         return self
 
     def to_pandera(self: Self) -> pr.DataFrameSchema:
-        """Turn PUDL Schema into Pandera schema, so dagster can understand it."""
+        """Turn PUDL Schema into Pandera schema, so dagster can understand it.
+
+        The pandera schema is built the first time it's requested and reused after
+        that, so the Schema should not be modified once it has been converted.
+        """
+        return self._pandera_schema
+
+    @cached_property
+    def _pandera_schema(self: Self) -> pr.DataFrameSchema:
+        """The Pandera schema returned by :meth:`to_pandera`."""
         # 2024-02-09: pr.Check doesn't have interop with Pydantic type system
         # yet, so we encode as Callable, then cast.
 
@@ -1442,8 +1451,15 @@ class Resource(PudlMeta):
         return obj
 
     @classmethod
+    @lru_cache
     def from_id(cls, x: str) -> "Resource":
-        """Construct from PUDL identifier (`resource.name`)."""
+        """Construct from PUDL identifier (`resource.name`).
+
+        Each Resource is only built once per process, and the same instance is
+        returned on every subsequent call along with its cached pyarrow schema, pandas
+        dtypes and SQL table. The returned Resource is shared, so it must not be
+        modified. Use :meth:`dict_from_id` to build a Resource that can be changed.
+        """
         return cls(**cls.dict_from_id(x))
 
     def get_field(self, name: str) -> Field:
@@ -1463,7 +1479,29 @@ class Resource(PudlMeta):
         check_types: bool = True,
         check_values: bool = True,
     ) -> sa.Table:
-        """Return equivalent SQL Table."""
+        """Return equivalent SQL Table.
+
+        If no ``metadata`` is given and all the checks are requested, the table is
+        only built once and bound to its own :class:`sqlalchemy.MetaData`.
+        """
+        if metadata is None and check_types and check_values:
+            return self._sql_table
+        return self._build_sql_table(
+            metadata=metadata, check_types=check_types, check_values=check_values
+        )
+
+    @cached_property
+    def _sql_table(self) -> sa.Table:
+        """The SQL Table returned by :meth:`to_sql` with the default arguments."""
+        return self._build_sql_table()
+
+    def _build_sql_table(
+        self,
+        metadata: sa.MetaData = None,
+        check_types: bool = True,
+        check_values: bool = True,
+    ) -> sa.Table:
+        """Construct a new SQL Table, see :meth:`to_sql`."""
         if metadata is None:
             metadata = sa.MetaData()
         columns = [
@@ -1481,7 +1519,15 @@ class Resource(PudlMeta):
         return sa.Table(self.name, metadata, *columns, *constraints)
 
     def to_pyarrow(self) -> pa.Schema:
-        """Construct a PyArrow schema for the resource."""
+        """Construct a PyArrow schema for the resource.
+
+        The schema is built the first time it's requested and reused after that.
+        """
+        return self._pyarrow_schema
+
+    @cached_property
+    def _pyarrow_schema(self) -> pa.Schema:
+        """The PyArrow schema returned by :meth:`to_pyarrow`."""
         fields = [field.to_pyarrow() for field in self.schema.fields]
         metadata = {"description": self.description}
         if self.schema.primary_key is not None:
@@ -1491,11 +1537,20 @@ class Resource(PudlMeta):
     def to_pandas_dtypes(self, **kwargs: Any) -> dict[str, str | pd.CategoricalDtype]:
         """Return Pandas data type of each field by field name.
 
+        The default dtypes are only computed once, and a copy is returned each time.
+
         Args:
             kwargs: Arguments to :meth:`Field.to_pandas_dtype`.
         """
+        if not kwargs:
+            return dict(self._pandas_dtypes)
         return {f.name: f.to_pandas_dtype(**kwargs) for f in self.schema.fields}
 
+    @cached_property
+    def _pandas_dtypes(self) -> dict[str, str | pd.CategoricalDtype]:
+        """The Pandas data types returned by :meth:`to_pandas_dtypes` by default."""
+        return {f.name: f.to_pandas_dtype() for f in self.schema.fields}
+
     def match_primary_key(self, names: Iterable[str]) -> dict[str, str] | None:
         """Match primary key fields to input field names.
 
@@ -1570,7 +1625,9 @@ class Resource(PudlMeta):
             matches = {key: key for key in keys if key in names}
         return matches if len(matches) == len(keys) else None
 
-    def format_df(self, df: pd.DataFrame | None = None, **kwargs: Any) -> pd.DataFrame:
+    def format_df(
+        self, df: pd.DataFrame | None = None, copy: bool = True, **kwargs: Any
+    ) -> pd.DataFrame:
         """Format a dataframe according to the resources's table schema.
 
         * DataFrame columns not in the schema are dropped.
@@ -1584,6 +1641,9 @@ class Resource(PudlMeta):
 
         Args:
             df: Dataframe to format.
+            copy: Whether to copy the columns which already have the right dtype. If
+                False, the returned dataframe may share data with `df`, so only use it
+                when `df` won't be used again.
             kwargs: Arguments to :meth:`Field.to_pandas_dtypes`.
 
         Returns:
@@ -1596,35 +1656,19 @@ class Resource(PudlMeta):
         if matches is None:
             # Primary key present but no matches were found
             return self.format_df()
-        df = df.copy()
         # Rename periodic key columns (if any) to the requested period
-        df = df.rename(columns=matches)
-        # Cast integer year fields to datetime
+        source_cols = {matches.get(col, col): col for col in df.columns}
+        columns = {}
         for field in self.schema.fields:
-            if (
-                field.type == "year"
-                and field.name in df
-                and pd.api.types.is_integer_dtype(df[field.name])
-            ):
-                df[field.name] = pd.to_datetime(df[field.name], format="%Y")
-            if isinstance(dtypes[field.name], pd.CategoricalDtype):
-                uncategorized = [
-                    value
-                    for value in df[field.name].dropna().unique()
-                    if value not in dtypes[field.name].categories
-                ]
-                if uncategorized:
-                    logger.warning(
-                        f"Values in {field.name} column are not included in "
-                        "categorical values in field enum constraint "
-                        f"and will be converted to nulls ({uncategorized})."
-                    )
-        df = (
-            # Reorder columns and insert missing columns
-            df.reindex(columns=dtypes.keys(), copy=False)
-            # Coerce columns to correct data type
-            .astype(dtypes, copy=False)
-        )
+            dtype = dtypes[field.name]
+            if field.name not in source_cols:
+                # Insert missing columns
+                columns[field.name] = pd.Series(index=df.index, dtype=dtype)
+                continue
+            columns[field.name] = self._format_column(
+                field, df[source_cols[field.name]], dtype
+            )
+        df = pd.DataFrame(columns, index=df.index, copy=copy)
         # Convert periodic key columns to the requested period
         for df_key, key in matches.items():
             _, period = split_period(key)
@@ -1632,8 +1676,39 @@ class Resource(PudlMeta):
                 df[key] = PERIODS[period](df[key])
         return df
 
-    def enforce_schema(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop columns not in the DB schema and enforce specified types."""
+    @staticmethod
+    def _format_column(
+        field: Field, col: pd.Series, dtype: str | pd.CategoricalDtype
+    ) -> pd.Series:
+        """Cast a column to the field's dtype, if it doesn't have it already."""
+        # Cast integer year fields to datetime
+        if field.type == "year" and pd.api.types.is_integer_dtype(col):
+            col = pd.to_datetime(col, format="%Y")
+        if col.dtype == pd.api.types.pandas_dtype(dtype):
+            return col
+        if isinstance(dtype, pd.CategoricalDtype):
+            uncategorized = col.notna() & ~col.isin(dtype.categories)
+            if uncategorized.any():
+                logger.warning(
+                    f"Values in {field.name} column are not included in "
+                    "categorical values in field enum constraint "
+                    "and will be converted to nulls "
+                    f"({list(col[uncategorized].unique())})."
+                )
+        return col.astype(dtype)
+
+    def enforce_schema(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """Drop columns not in the DB schema and enforce specified types.
+
+        Primary key columns must not contain nulls, and the primary key must be unique.
+        Uniqueness is checked by hashing the primary key of each row, and the rows
+        are only compared directly if some of the hashes collide.
+
+        Args:
+            df: Dataframe to conform to the schema.
+            copy: Whether to copy the columns which already have the right dtype. See
+                :meth:`format_df`.
+        """
         expected_cols = pd.Index(self.get_field_names())
         missing_cols = list(expected_cols.difference(df.columns))
         if missing_cols:
@@ -1642,14 +1717,19 @@ class Resource(PudlMeta):
                 f"schema: {missing_cols}"
             )
 
-        df = self.format_df(df)
+        df = self.format_df(df, copy=copy)
         pk = self.schema.primary_key
-        if pk and not (dupes := df[df.duplicated(subset=pk)]).empty:
+        if not pk:
+            return df
+        if any(df[col].hasnans for col in pk):
+            raise ValueError(f"{self.name} Null values found in primary key columns.")
+        pk_hashes = np.sort(pd.util.hash_pandas_object(df[pk], index=False).to_numpy())
+        if (pk_hashes[1:] == pk_hashes[:-1]).any() and (
+            n_dupes := df.duplicated(subset=pk).sum()
+        ):
             raise ValueError(
-                f"{self.name} {len(dupes)}/{len(df)} duplicate primary keys ({pk=}) when enforcing schema."
+                f"{self.name} {n_dupes}/{len(df)} duplicate primary keys ({pk=}) when enforcing schema."
             )
-        if pk and df.loc[:, pk].isna().any(axis=None):
-            raise ValueError(f"{self.name} Null values found in primary key columns.")
         return df
 
     def aggregate_df(
@@ -1993,8 +2073,15 @@ class Package(PudlMeta):
 
     def get_resource(self, name: str) -> Resource:
         """Return the resource with the given name if it is in the Package."""
-        names = [resource.name for resource in self.resources]
-        return self.resources[names.index(name)]
+        try:
+            return self._resources_by_name[name]
+        except KeyError as err:
+            raise ValueError(f"{name} is not a resource in the Package.") from err
+
+    @cached_property
+    def _resources_by_name(self) -> dict[str, Resource]:
+        """Look up the Package's resources by name."""
+        return {resource.name: resource for resource in self.resources}
 
     def to_rst(self, docs_dir: DirectoryPath, path: str) -> None:
         """Output to an RST file."""
@@ -2095,14 +2182,20 @@ class Package(PudlMeta):
         return encoded_df
 
 
-PUDL_PACKAGE = Package.from_resource_ids()
-"""Define a gobal PUDL package object for use across the entire codebase.
+def __getattr__(name: str) -> Any:
+    """Build the global ``PUDL_PACKAGE`` the first time it's used.
 
-This needs to happen after the definition of the Package class above, and it is used in
-some of the class definitions below, but having it defined in the middle of this module
-is kind of obscure, so it is imported in the __init__.py for this subpackage and then
-imported in other modules from that more prominent location.
-"""
+    ``PUDL_PACKAGE`` is the :class:`Package` containing every PUDL resource, for use
+    across the entire codebase. Building it takes a while, so rather than constructing
+    it when this module is imported, it's created on first access. Every access returns
+    the same object, since :meth:`Package.from_resource_ids` is cached. It's exposed in
+    the __init__.py for this subpackage. Other modules should look it up as
+    ``pudl.metadata.PUDL_PACKAGE`` where it's used, because importing it at the top of
+    a module would build it when that module is imported.
+    """
+    if name == "PUDL_PACKAGE":
+        return Package.from_resource_ids()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CodeMetadata(PudlMeta):
@@ -2147,7 +2240,9 @@ class DatasetteMetadata(PudlMeta):
     """
 
     data_sources: list[DataSource]
-    resources: list[Resource] = PUDL_PACKAGE.resources
+    resources: list[Resource] = pydantic.Field(
+        default_factory=lambda: Package.from_resource_ids().resources
+    )
     xbrl_resources: dict[str, list[Resource]] = {}
     label_columns: dict[str, str] = {
         "core_eia__entity_plants": "plant_name_eia",
@@ -2195,7 +2290,7 @@ class DatasetteMetadata(PudlMeta):
         data_sources = [DataSource.from_id(ds_id) for ds_id in data_source_ids]
 
         # Instantiate all possible resources in a Package:
-        resources = PUDL_PACKAGE.resources
+        resources = Package.from_resource_ids().resources
 
         # Get XBRL based resources
         xbrl_resources = {}
@@ -1,6 +1,8 @@
 """Field metadata."""
 
-from copy import deepcopy
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 import pandas as pd
@@ -5002,14 +5004,51 @@ FIELD_METADATA_BY_RESOURCE: dict[str, dict[str, Any]] = {
 }
 
 
+def _compile_pudl_dtypes(
+    group: str | None,
+    field_meta: dict[str, Any],
+    field_meta_by_group: dict[str, Any],
+    dtype_map: dict[str, Any],
+) -> dict[str, Any]:
+    """Map each field to its data type, applying any group overrides."""
+    group_meta = field_meta_by_group.get(group, {})
+    return {
+        f: dtype_map[group_meta.get(f, {}).get("type", meta["type"])]
+        for f, meta in field_meta.items()
+    }
+
+
+@cache
+def _get_default_pudl_dtypes(group: str | None) -> Mapping[str, Any]:
+    """Read-only pandas dtypes of the default PUDL field metadata for one group.
+
+    The default field metadata is never modified after import, so these are compiled
+    at most once per group and process.
+    """
+    return MappingProxyType(
+        _compile_pudl_dtypes(
+            group, FIELD_METADATA, FIELD_METADATA_BY_GROUP, FIELD_DTYPES_PANDAS
+        )
+    )
+
+
+@cache
+def _get_pandas_dtype(dtype: Any) -> Any:
+    """Look up the pandas dtype object corresponding to a dtype specification."""
+    return pd.api.types.pandas_dtype(dtype)
+
+
 def get_pudl_dtypes(
     group: str | None = None,
     field_meta: dict[str, Any] | None = FIELD_METADATA,
     field_meta_by_group: dict[str, Any] | None = FIELD_METADATA_BY_GROUP,
     dtype_map: dict[str, Any] | None = FIELD_DTYPES_PANDAS,
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Compile a dictionary of field dtypes, applying group overrides.
 
+    When the default field metadata and pandas data types are used, the result is
+    cached and shared by all callers, so it is returned as a read-only mapping.
+
     Args:
         group: The data group (e.g. ferc1, eia) to use for overriding the default
             field types. If None, no overrides are applied and the default types
@@ -5023,14 +5062,13 @@ def get_pudl_dtypes(
     Returns:
         A mapping of PUDL field names to their associated data types.
     """
-    field_meta = deepcopy(field_meta)
-    dtypes = {}
-    for f in field_meta:
-        if f in field_meta_by_group.get(group, []):
-            field_meta[f].update(field_meta_by_group[group][f])
-        dtypes[f] = dtype_map[field_meta[f]["type"]]
-
-    return dtypes
+    if (
+        field_meta is FIELD_METADATA
+        and field_meta_by_group is FIELD_METADATA_BY_GROUP
+        and dtype_map is FIELD_DTYPES_PANDAS
+    ):
+        return _get_default_pudl_dtypes(group)
+    return _compile_pudl_dtypes(group, field_meta, field_meta_by_group, dtype_map)
 
 
 def apply_pudl_dtypes(
@@ -5061,18 +5099,26 @@ def apply_pudl_dtypes(
     Returns:
         The input dataframe, but with standard PUDL types applied.
     """
-    unspecified_fields = sorted(
-        set(df.columns)
-        - set(field_meta.keys())
-        - set(field_meta_by_group.get(group, {}).keys())
-    )
-    if strict and len(unspecified_fields) > 0:
-        raise ValueError(f"Found unspecified fields: {unspecified_fields}")
+    if strict:
+        unspecified_fields = sorted(
+            set(df.columns)
+            - set(field_meta.keys())
+            - set(field_meta_by_group.get(group, {}).keys())
+        )
+        if len(unspecified_fields) > 0:
+            raise ValueError(f"Found unspecified fields: {unspecified_fields}")
     dtypes = get_pudl_dtypes(
         group=group,
         field_meta=field_meta,
         field_meta_by_group=field_meta_by_group,
         dtype_map=FIELD_DTYPES_PANDAS,
     )
-
-    return df.astype({col: dtypes[col] for col in df.columns if col in dtypes})
+    # Only convert the columns that don't already have the right type.
+    changed_dtypes = {
+        col: dtypes[col]
+        for col, dtype in df.dtypes.items()
+        if col in dtypes and dtype != _get_pandas_dtype(dtypes[col])
+    }
+    if not changed_dtypes:
+        return df.copy()
+    return df.astype(changed_dtypes)
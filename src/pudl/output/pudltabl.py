@@ -19,13 +19,15 @@ In the long run, this is a probably a kind of prototype for pre-packaged API out
 data products that we might want to be able to provide to users a la carte.
 """
 
-from collections import defaultdict
+from collections import OrderedDict
 from datetime import date, datetime
 from functools import partial
-from typing import Literal, Self
+from pathlib import Path
+from typing import Any, Literal, Self
 
 # Useful high-level external modules.
 import pandas as pd
+import pyarrow.parquet as pq
 import sqlalchemy as sa
 
 import pudl
@@ -54,6 +56,8 @@ class PudlTabl:
         fill_net_gen: bool = False,
         fill_tech_desc: bool = True,
         unit_ids: bool = False,
+        parquet_dir: Path | None = None,
+        max_cached_tables: int = 16,
     ) -> Self:
         """Initialize the PUDL output object.
 
@@ -88,6 +92,13 @@ class PudlTabl:
                 code.
             unit_ids: If True, use several heuristics to assign
                 individual generators to functional units. EXPERIMENTAL.
+            parquet_dir: Directory containing the PUDL Parquet outputs. Tables that
+                have a Parquet file there are read from it instead of the PUDL DB,
+                only loading the rows between ``start_date`` and ``end_date``. By
+                default, the ``parquet`` directory next to the PUDL DB file is used.
+            max_cached_tables: The maximum number of tables to keep cached in memory.
+                When more tables have been requested, the least recently used ones
+                are discarded. If 0, tables are read every time they're requested.
         """
         logger.warning(
             "PudlTabl is deprecated and will be removed from the pudl package "
@@ -127,8 +138,16 @@ class PudlTabl:
         self.fill_tech_desc = fill_tech_desc  # only for eia860 table.
         self.unit_ids = unit_ids
 
-        # Used to persist the output tables. Returns None if they don't exist.
-        self._dfs = defaultdict(lambda: None)
+        if parquet_dir is None and pudl_engine.url.database not in (None, ":memory:"):
+            parquet_dir = Path(pudl_engine.url.database).parent / "parquet"
+        self.parquet_dir: Path | None = parquet_dir
+
+        # Used to persist the output tables, keyed by table name and date range, with
+        # the least recently used tables first.
+        self.max_cached_tables: int = max_cached_tables
+        self._dfs: OrderedDict[tuple[Any, ...], pd.DataFrame] = OrderedDict()
+        # Tables are only reflected from the PUDL DB as they're needed.
+        self._pudl_metadata = sa.MetaData()
 
         self._register_output_methods()
 
@@ -280,23 +299,21 @@ class PudlTabl:
         allowed_freqs: list[str | None] = [None, "YS", "MS"],
         update: bool = False,
     ) -> pd.DataFrame:
-        """Grab output table from PUDL DB.
+        """Grab output table from PUDL DB, or from its Parquet output if there is one.
+
+        The table is cached, and returned from the cache the next time it's requested
+        with the same date range, unless ``update`` is True.
 
         Args:
             table_name: Name of table to get.
             allowed_freqs: List of allowed aggregation frequencies for table.
-            update: Ignored. Retained for backwards compatibility only.
+            update: If True, read the table again even if it's been cached.
         """
         if self.freq not in allowed_freqs:
             raise ValueError(
                 f"{table_name} needs one of these frequencies {allowed_freqs}, "
                 f"but got {self.freq}"
             )
-        if update:
-            logger.warning(
-                "The update parameter is deprecated and has no effect."
-                "It is retained for backwards compatibility only."
-            )
         table_name = self._agg_table_name(table_name)
         logger.warning(
             "PudlTabl is deprecated and will be removed from the pudl package "
@@ -304,17 +321,41 @@ class PudlTabl:
             "pudl.sqlite. To access the data returned by this method, "
             f"use the {table_name} table in the pudl.sqlite database."
         )
+        key = (table_name, self.start_date, self.end_date)
+        if update:
+            self._dfs.pop(key, None)
+        if key in self._dfs:
+            self._dfs.move_to_end(key)
+            return self._dfs[key].copy()
+
         resource = Resource.from_id(table_name)
-        return pd.concat(
-            [
-                resource.enforce_schema(df)
-                for df in pd.read_sql(
-                    self._select_between_dates(table_name),
-                    self.pudl_engine,
-                    chunksize=100_000,
-                )
-            ]
+        parquet_path = (
+            self.parquet_dir / f"{table_name}.parquet" if self.parquet_dir else None
         )
+        if parquet_path is not None and parquet_path.exists():
+            df = pq.read_table(
+                parquet_path,
+                schema=resource.to_pyarrow(),
+                filters=self._parquet_date_filters(resource),
+            ).to_pandas()
+            df = resource.enforce_schema(df, copy=False)
+        else:
+            df = pd.concat(
+                [
+                    resource.enforce_schema(df, copy=False)
+                    for df in pd.read_sql(
+                        self._select_between_dates(table_name),
+                        self.pudl_engine,
+                        chunksize=100_000,
+                    )
+                ]
+            )
+        if self.max_cached_tables > 0:
+            self._dfs[key] = df
+            while len(self._dfs) > self.max_cached_tables:
+                self._dfs.popitem(last=False)
+            df = df.copy()
+        return df
 
     def _agg_table_name(self: Self, table_name: str) -> str:
         """Substitute appropriate frequency in aggregated table names.
@@ -348,12 +389,12 @@ class PudlTabl:
             ``report_date`` or ``report_year``) to lie between ``self.start_date`` and
             ``self.end_date`` (inclusive).
         """
-        md = sa.MetaData()
-        md.reflect(self.pudl_engine)
-        try:
-            tbl = md.tables[f"{table}"]
-        except KeyError:
-            print(f"{table} not found in the metadata.")
+        if table not in self._pudl_metadata.tables:
+            try:
+                self._pudl_metadata.reflect(self.pudl_engine, only=[table])
+            except sa.exc.InvalidRequestError as err:
+                raise ValueError(f"{table} not found in the PUDL DB.") from err
+        tbl = self._pudl_metadata.tables[table]
         tbl_select = sa.sql.select(tbl)
 
         start_date = pd.to_datetime(self.start_date)
@@ -375,6 +416,29 @@ class PudlTabl:
             tbl_select = tbl_select.where(date_col <= end_date)
         return tbl_select
 
+    def _parquet_date_filters(
+        self: Self, resource: Resource
+    ) -> list[tuple[str, str, Any]] | None:
+        """Filters restricting a Parquet table to rows between the start and end dates.
+
+        Like :meth:`_select_between_dates`, but in the form accepted by
+        :func:`pyarrow.parquet.read_table`, so rows outside the date range are skipped
+        when the Parquet file is read.
+        """
+        field_names = resource.get_field_names()
+        if "report_date" in field_names:
+            date_col, to_value = "report_date", lambda x: pd.to_datetime(x).date()
+        elif "report_year" in field_names:
+            date_col, to_value = "report_year", lambda x: pd.to_datetime(x).year
+        else:
+            return None
+        filters = []
+        if self.start_date:
+            filters.append((date_col, ">=", to_value(self.start_date)))
+        if self.end_date:
+            filters.append((date_col, "<=", to_value(self.end_date)))
+        return filters or None
+
     ###########################################################################
     # Tables requiring special treatment:
     ###########################################################################
@@ -392,7 +456,7 @@ class PudlTabl:
         core_eia923__monthly_generation_fuel table to the generator level.
 
         Args:
-            update: Ignored. Retained for backwards compatibility only.
+            update: If True, read the table again even if it's been cached.
 
         Returns:
             A denormalized generation table for interactive use.
@@ -406,12 +470,12 @@ class PudlTabl:
             table_name = self._agg_table_name(
                 "out_eia923__AGG_generation_fuel_by_generator"
             )
-            gen_df = self._get_table_from_db(table_name)
+            gen_df = self._get_table_from_db(table_name, update=update)
             resource = Resource.from_id(table_name)
             gen_df = gen_df.loc[:, resource.get_field_names()]
         else:
             table_name = self._agg_table_name("out_eia923__AGG_generation")
-            gen_df = self._get_table_from_db(table_name)
+            gen_df = self._get_table_from_db(table_name, update=update)
         return gen_df
 
     ###########################################################################
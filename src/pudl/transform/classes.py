@@ -84,8 +84,8 @@ from pydantic import (
 )
 
 import pudl.logging_helpers
+import pudl.metadata
 import pudl.transform.params.ferc1
-from pudl.metadata import PUDL_PACKAGE
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -1359,6 +1359,6 @@ class AbstractTableTransformer(ABC):
     def enforce_schema(self, df: pd.DataFrame) -> pd.DataFrame:
         """Drop columns not in the DB schema and enforce specified types."""
         logger.info(f"{self.table_id.value}: Enforcing database schema on dataframe.")
-        resource = PUDL_PACKAGE.get_resource(self.table_id.value)
+        resource = pudl.metadata.PUDL_PACKAGE.get_resource(self.table_id.value)
         df = resource.enforce_schema(df)
         return df
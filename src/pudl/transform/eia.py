@@ -18,6 +18,7 @@ found in :func:`pudl.transform.eia._boiler_generator_assn`.
 
 import importlib.resources
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum, auto
 from typing import Literal
 
@@ -36,8 +37,7 @@ from dagster import (
 )
 
 import pudl
-from pudl.helpers import convert_cols_dtypes
-from pudl.metadata import PUDL_PACKAGE
+from pudl.helpers import convert_cols_dtypes, take_rows
 from pudl.metadata.enums import APPROXIMATE_TIMEZONES
 from pudl.metadata.fields import apply_pudl_dtypes, get_pudl_dtypes
 from pudl.metadata.resources import ENTITIES
@@ -447,11 +447,175 @@ def _manage_strictness(col: str, eia860m: bool) -> float:
     return strictness_cols.get(col, strictness_default)
 
 
+def _group_codes(compiled_df: pd.DataFrame, by: list[str]) -> np.ndarray:
+    """Number the groups of records, with -1 for records missing any of the keys."""
+    return (
+        compiled_df.groupby(by, sort=False).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    )
+
+
+def _consistent_value_positions(
+    group_codes: np.ndarray,
+    values: pd.Series,
+    n_groups: int,
+    strictness: float,
+    nan_strings: bool = False,
+) -> tuple[np.ndarray, int]:
+    """Find the record of each group that reports its consistent value.
+
+    This is a vectorized version of :func:`occurrence_consistency` for a single column.
+    It only works for a strictness of at least 0.5, where at most one of the values
+    reported for each group can be consistent, so it doesn't matter which record with
+    that value is chosen.
+
+    Args:
+        group_codes: The group of each record (an entity, or an entity in a given
+            year), numbered from 0 to ``n_groups - 1``, or -1 for records that can't be
+            harvested.
+        values: The value reported by each record.
+        n_groups: The number of groups.
+        strictness: The fraction of a group's records that must report the same value
+            for it to be consistent.
+        nan_strings: If True, treat the string "nan" as a null value.
+
+    Returns:
+        The position of a record reporting the consistent value of each group, or -1 if
+        no value was consistent, and the number of groups with any reported values.
+    """
+    valid = values.notna().to_numpy() & (group_codes >= 0)
+    if nan_strings:
+        valid &= ~(values == "nan").fillna(False).to_numpy(dtype=bool)
+    rows = np.flatnonzero(valid)
+    group_codes = group_codes[rows]
+    value_codes, uniques = pd.factorize(values.iloc[rows])
+    pair_codes, _ = pd.factorize(group_codes * len(uniques) + value_codes)
+    entity_occurences = np.bincount(group_codes, minlength=n_groups)
+    record_occurences = np.bincount(pair_codes)[pair_codes]
+    is_consistent = record_occurences / entity_occurences[group_codes] > strictness
+    positions = np.full(n_groups, -1)
+    positions[group_codes[is_consistent]] = rows[is_consistent]
+    return positions, np.count_nonzero(entity_occurences)
+
+
+def _harvest_column_by_occurrence(
+    compiled_df: pd.DataFrame,
+    col: str,
+    id_df: pd.DataFrame,
+    entity_id_df: pd.DataFrame,
+    id_cols: list[str],
+    cols_to_consit: list[str],
+    strictness: float,
+    special_case: list | None = None,
+) -> tuple[pd.Series, pd.DataFrame]:
+    """Harvest a column using the records compiled by :func:`occurrence_consistency`.
+
+    This is used for columns with special cases, and for low strictness where several
+    values of an entity can be consistent and the value that is kept depends on the
+    order of the records. It is also used for every column when debugging, to get the
+    consistency of each record.
+
+    Args:
+        compiled_df: every record of the entity.
+        col: the column to harvest.
+        id_df: the entity ids (or entity ids and report dates) to harvest values for.
+        entity_id_df: a dataframe with a complete set of possible entity ids.
+        id_cols: the id column(s) of the entity.
+        cols_to_consit: the columns to determine consistency over.
+        strictness: How consistent the column records need to be.
+        special_case: the function used to harvest more values from inconsistent
+            records, and its last argument.
+
+    Returns:
+        The harvested value for each row of ``id_df``, and the output of
+        :func:`occurrence_consistency`.
+    """
+    col_df = occurrence_consistency(
+        id_cols, compiled_df, col, cols_to_consit, strictness=strictness
+    )
+    # pull the correct values out of the df and merge w/ the entity ids
+    col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+        subset=(cols_to_consit + [f"{col}_is_consistent"])
+    )
+    # we need this to be an empty df w/ columns bc we are going to use it
+    if col_correct_df.empty:
+        col_correct_df = pd.DataFrame(columns=col_df.columns)
+    clean_df = id_df.merge(col_correct_df, on=cols_to_consit, how="left")
+    clean_df = clean_df[cols_to_consit + [col]]
+
+    if special_case is not None:
+        if cols_to_consit != id_cols:
+            raise AssertionError(
+                "Method currenty not configured to work with annual values."
+            )
+        # get the still dirty records by using the cleaned ids w/null values
+        # we need the plants that have no 'correct' value so
+        # we can't just use the col_df records when the consistency is not True
+        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+        special_case_func, special_case_arg = special_case
+        clean_df = special_case_func(
+            dirty_df,
+            clean_df,
+            entity_id_df,
+            id_cols,
+            col,
+            cols_to_consit,
+            special_case_arg,
+        )
+        clean_df = id_df.merge(clean_df[id_cols + [col]], on=id_cols)
+    return clean_df[col], col_df
+
+
+def _check_consistency(col: str, total: int, consistent: int, debug: bool) -> dict:
+    """Log the consistency of a harvested column, and check that it's high enough.
+
+    Args:
+        col: the harvested column.
+        total: the number of entities (or entity years) with any reported values.
+        consistent: the number of entities with a consistent value.
+        debug: if True, log when columns are inconsistent, but don't raise an error.
+
+    Returns:
+        The consistent ratio, the number of inconsistent entities ("wrongos") and the
+        total.
+
+    Raises:
+        AssertionError: If less than 90% of the entities have a consistent value (when
+        debug=False)
+    """
+    # if the total is 0, the ratio will error, so assign null values.
+    if total == 0:
+        ratio = np.nan
+        wrongos = np.nan
+        logger.debug(f"       Zero records found for {col}")
+    if total > 0:
+        ratio = consistent / total
+        wrongos = (1 - ratio) * total
+        logger.debug(
+            f"       Ratio: {ratio:.3}  "
+            f"Wrongos: {wrongos:.5}  "
+            f"Total: {total}   {col}"
+        )
+        if ratio < 0.9:
+            if debug:
+                logger.error(f"{col} has low consistency: {ratio:.3}.")
+            else:
+                raise AssertionError(
+                    f"Harvesting of {col} is too inconsistent at {ratio:.3}."
+                )
+    return {
+        "column": col,
+        "consistent_ratio": ratio,
+        "wrongos": wrongos,
+        "total": total,
+    }
+
+
 def harvest_entity_tables(  # noqa: C901
     entity: EiaEntity,
     clean_dfs: dict[str, pd.DataFrame],
     eia_settings: EiaSettings,
     debug: bool = False,
+    workers: int = 1,
 ) -> tuple:
     """Compile consistent records for various entities.
 
@@ -479,12 +643,19 @@ def harvest_entity_tables(  # noqa: C901
     and in part by an understanding of how the entities and columns relate in
     the real world.
 
+    The entities (and entity years) are numbered once, and the consistent value of
+    most columns is found with array operations on those numbers, rather than merging
+    the output of :func:`occurrence_consistency` for each column. Those columns can be
+    harvested in parallel. The harvested columns are then assembled into the entity
+    and annual tables all at once.
+
     Args:
         entity: One of: plants, generators, boilers, or utilties
         clean_dfs: A dictionary of table names (keys) and clean dfs (values).
         eia860m: if True, the etl run is attempting to include year-to-date updated from
             EIA 860M.
         debug: if True, log when columns are inconsistent, but don't raise an error.
+        workers: Number of worker processes used to harvest columns.
 
     Returns:
         entity_df (the harvested entity table), annual_df (the annual entity table),
@@ -500,9 +671,20 @@ def harvest_entity_tables(  # noqa: C901
         * Determine what to do with null records
         * Determine how to treat mostly static records
     """
-    # Do some final cleanup and assign appropriate types:
+    # Do some final cleanup and assign appropriate types, only to the columns that
+    # could be harvested (and plant_id_eia, which identifies plant tables below):
+    harvestable_cols = {"plant_id_eia", "report_date"}.union(
+        *[
+            ENTITIES[entity.value][cols]
+            for cols in ["id_cols", "static_cols", "annual_cols"]
+        ],
+        *(ENTITIES[entity.value].get("mapped_schemas") or []),
+    )
     clean_dfs = {
-        name: convert_cols_dtypes(df, data_source="eia")
+        name: convert_cols_dtypes(
+            df[[col for col in df.columns if col in harvestable_cols]].copy(),
+            data_source="eia",
+        )
         for name, df in clean_dfs.items()
     }
 
@@ -537,121 +719,107 @@ def harvest_entity_tables(  # noqa: C901
         subset=id_cols
     )
 
-    entity_df = entity_id_df.copy()
-    annual_df = annual_id_df.copy()
     special_case_cols = {
         "latitude": [_lat_long, 1],
         "longitude": [_lat_long, 1],
         "generator_operating_date": [_round_operating_date, "Y"],
     }
-    consistency = pd.DataFrame(
-        columns=["column", "consistent_ratio", "wrongos", "total"]
-    )
+    kinds = {
+        col: "static" if col in static_cols else "annual"
+        for col in static_cols + annual_cols
+    }
+    cols_to_consit = {
+        col: id_cols if kind == "static" else id_cols + ["report_date"]
+        for col, kind in kinds.items()
+    }
+    strictness = {
+        col: _manage_strictness(col, eia_settings.eia860.eia860m)
+        for col in cols_to_consit
+    }
+    # Number the entities and entity years once for all of the columns. The ids were
+    # compiled with a fresh index, so their index is the position of their record.
+    group_codes = {
+        "static": _group_codes(compiled_df, id_cols),
+        "annual": _group_codes(compiled_df, id_cols + ["report_date"]),
+    }
+    n_groups = {kind: codes.max() + 1 for kind, codes in group_codes.items()}
+    id_dfs = {
+        "static": entity_id_df.reset_index(drop=True),
+        "annual": annual_id_df.reset_index(drop=True),
+    }
+    id_codes = {
+        "static": group_codes["static"][entity_id_df.index],
+        "annual": group_codes["annual"][annual_id_df.index],
+    }
+    # Records without a report date aren't harvested
+    undated = compiled_df["report_date"].isna().to_numpy()
+    record_codes = {
+        kind: np.where(undated, -1, codes) for kind, codes in group_codes.items()
+    }
+    vectorized_cols = [
+        col
+        for col in static_cols + annual_cols
+        if not debug and col not in special_case_cols and strictness[col] >= 0.5
+    ]
+    args = [
+        [record_codes[kinds[col]] for col in vectorized_cols],
+        [compiled_df[col] for col in vectorized_cols],
+        [n_groups[kinds[col]] for col in vectorized_cols],
+        [strictness[col] for col in vectorized_cols],
+        [get_pudl_dtypes(group="eia")[col] == "string" for col in vectorized_cols],
+    ]
+    if workers > 1 and len(vectorized_cols) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            positions = list(executor.map(_consistent_value_positions, *args))
+    else:
+        positions = list(map(_consistent_value_positions, *args))
+    positions = dict(zip(vectorized_cols, positions, strict=True))
+
+    harvested = {"static": {}, "annual": {}}
+    consistency = []
     col_dfs = {}
-    # determine how many times each of the columns occur
-    for col in static_cols + annual_cols:
-        if col in annual_cols:
-            cols_to_consit = id_cols + ["report_date"]
-        if col in static_cols:
-            cols_to_consit = id_cols
-
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
-        )
-
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
-        )
-
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
-
-        if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
-            entity_df = entity_df.merge(clean_df, on=id_cols)
-
-        if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
-            )
-            clean_df = clean_df[id_cols + ["report_date", col]]
-            annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
-
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
-
-        if col in special_case_cols:
-            clean_df = special_case_cols[col][0](
-                dirty_df,
-                clean_df,
-                entity_id_df,
-                id_cols,
-                col,
-                cols_to_consit,
-                special_case_cols[col][1],
-            )
-            if col in static_cols:
-                clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
+    for col, kind in kinds.items():
+        if col in positions:
+            col_positions, total = positions[col]
+            consistent = np.count_nonzero(col_positions >= 0)
+            if consistent == 0:
+                # Like merging in an empty dataframe of consistent values
+                harvested[kind][col] = np.full(len(id_dfs[kind]), np.nan, dtype=object)
+            else:
+                record_positions = np.where(
+                    id_codes[kind] >= 0, col_positions[id_codes[kind]], -1
                 )
-
-        if debug:
-            col_dfs[col] = col_df
-        # this next section is used to print and test whether the harvested
-        # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
-        # if the total is 0, the ratio will error, so assign null values.
-        if total == 0:
-            ratio = np.nan
-            wrongos = np.nan
-            logger.debug(f"       Zero records found for {col}")
-        if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
+                harvested[kind][col] = take_rows(
+                    compiled_df[col], record_positions, allow_fill=True
                 )
-                / total
+        else:
+            harvested[kind][col], col_df = _harvest_column_by_occurrence(
+                compiled_df,
+                col,
+                id_df=id_dfs[kind],
+                entity_id_df=entity_id_df,
+                id_cols=id_cols,
+                cols_to_consit=cols_to_consit[col],
+                strictness=strictness[col],
+                special_case=special_case_cols.get(col),
             )
-            wrongos = (1 - ratio) * total
-            logger.debug(
-                f"       Ratio: {ratio:.3}  "
-                f"Wrongos: {wrongos:.5}  "
-                f"Total: {total}   {col}"
+            if debug:
+                col_dfs[col] = col_df
+            total = len(col_df.drop_duplicates(subset=cols_to_consit[col]))
+            consistent = len(
+                col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+                    subset=cols_to_consit[col]
+                )
             )
-            if ratio < 0.9:
-                if debug:
-                    logger.error(f"{col} has low consistency: {ratio:.3}.")
-                else:
-                    raise AssertionError(
-                        f"Harvesting of {col} is too inconsistent at {ratio:.3}."
-                    )
-        # add to a small df to be used in order to print out the ratio of
-        # consistent records
-        consistency = pd.concat(
-            [
-                consistency,
-                pd.DataFrame(
-                    {
-                        "column": [col],
-                        "consistent_ratio": [ratio],
-                        "wrongos": [wrongos],
-                        "total": [total],
-                    }
-                ),
-            ],
-            ignore_index=True,
-        )
+        consistency.append(_check_consistency(col, total, consistent, debug))
+
+    entity_df = pd.concat(
+        [id_dfs["static"], pd.DataFrame(harvested["static"])], axis="columns"
+    )
+    annual_df = pd.concat(
+        [id_dfs["annual"], pd.DataFrame(harvested["annual"])], axis="columns"
+    )
+    consistency = pd.DataFrame(consistency)
     mcs = consistency["consistent_ratio"].mean()
     logger.info(f"Average consistency of static {entity.value} values is {mcs:.2%}")
 
@@ -729,7 +897,7 @@ def core_eia860__assn_boiler_generator(context, **clean_dfs) -> pd.DataFrame:
         table_name: (
             convert_cols_dtypes(df, data_source="eia")
             .pipe(_restrict_years, eia_settings)
-            .pipe(PUDL_PACKAGE.encode)
+            .pipe(pudl.metadata.PUDL_PACKAGE.encode)
         )
         for table_name, df in clean_dfs.items()
     }
@@ -1259,6 +1427,11 @@ def harvested_entity_asset_factory(
                     "produce additional debugging output."
                 ),
             ),
+            "workers": Field(
+                int,
+                default_value=1,
+                description="Number of worker processes used to harvest columns.",
+            ),
         },
         required_resource_keys={"dataset_settings"},
         name=f"harvested_{entity.value}_eia",
@@ -1269,11 +1442,16 @@ def harvested_entity_asset_factory(
         eia_settings = context.resources.dataset_settings.eia
         debug = context.op_config["debug"]
         clean_dfs = {
-            df_name: PUDL_PACKAGE.encode(clean_dfs[df_name]) for df_name in clean_dfs
+            df_name: pudl.metadata.PUDL_PACKAGE.encode(clean_dfs[df_name])
+            for df_name in clean_dfs
         }
 
         entity_df, annual_df, _col_dfs = harvest_entity_tables(
-            entity, clean_dfs, debug=debug, eia_settings=eia_settings
+            entity,
+            clean_dfs,
+            debug=debug,
+            eia_settings=eia_settings,
+            workers=context.op_config["workers"],
         )
 
         return (
@@ -1311,9 +1489,9 @@ def finished_eia_asset_factory(
     )
     def finished_eia_asset(**kwargs) -> pd.DataFrame:
         """Enforce PUDL DB schema on a cleaned EIA dataframe."""
-        res = PUDL_PACKAGE.get_resource(table_name)
+        res = pudl.metadata.PUDL_PACKAGE.get_resource(table_name)
         return (
-            PUDL_PACKAGE.encode(kwargs[_core_table_name])
+            pudl.metadata.PUDL_PACKAGE.encode(kwargs[_core_table_name])
             .pipe(convert_cols_dtypes, data_source="eia")
             .pipe(res.enforce_schema)
         )
@@ -5,7 +5,6 @@ import pandas as pd
 from dagster import AssetCheckResult, asset, asset_check
 
 import pudl
-from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.classes import DataSource
 from pudl.metadata.codes import CODE_METADATA
 from pudl.metadata.dfs import POLITICAL_SUBDIVISIONS
@@ -151,7 +150,7 @@ def _core_eia860__ownership(raw_eia860__ownership: pd.DataFrame) -> pd.DataFrame
         own_df.operator_utility_id_eia == own_df.owner_utility_id_eia
     ) & (own_df.fraction_owned == 1.0)
     own_df.loc[single_owner_operator, "operator_utility_id_eia"] = pd.NA
-    own_df = PUDL_PACKAGE.encode(own_df)
+    own_df = pudl.metadata.PUDL_PACKAGE.encode(own_df)
     # CN is an invalid political subdivision code used by a few respondents to indicate
     # that the owner is in Canada. At least we can recover the country:
     state_to_country = {
@@ -315,7 +314,7 @@ def _core_eia860__generators(
         (gens_df.state == "UT") & (gens_df.balancing_authority_code_eia == "PA"),
         "balancing_authority_code_eia",
     ] = "PACE"
-    gens_df = PUDL_PACKAGE.encode(gens_df)
+    gens_df = pudl.metadata.PUDL_PACKAGE.encode(gens_df)
 
     gens_df["fuel_type_code_pudl"] = gens_df.energy_source_code_1.str.upper().map(
         pudl.helpers.label_map(
@@ -374,7 +373,7 @@ def _core_eia860__generators_solar(
         .pipe(pudl.helpers.fix_boolean_columns, boolean_columns_to_fix)
         .pipe(pudl.helpers.month_year_to_date)
         .pipe(pudl.helpers.convert_to_date)
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
     solar_df["operational_status"] = solar_df.operational_status_code.str.upper().map(
@@ -409,7 +408,7 @@ def _core_eia860__generators_energy_storage(
             pudl.helpers.fix_boolean_columns,
             boolean_columns_to_fix=boolean_columns_to_fix,
         )
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
     storage_df["operational_status"] = (
@@ -463,7 +462,7 @@ def _core_eia860__generators_wind(
             columns=["predominant_turbine_manufacturer"],
         )
         .convert_dtypes()  # converting here before the wind encoding bc int's are codes
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
     wind_df["operational_status"] = wind_df.operational_status_code.str.upper().map(
@@ -1208,7 +1207,9 @@ def _core_eia860__cooling_equipment(
     ce_df.columns = ce_df.columns.str.replace("_thousand_dollars", "")
 
     # Encoding is required here because this table is not yet getting harvested.
-    return apply_pudl_dtypes(ce_df, group="eia", strict=True).pipe(PUDL_PACKAGE.encode)
+    return apply_pudl_dtypes(ce_df, group="eia", strict=True).pipe(
+        pudl.metadata.PUDL_PACKAGE.encode
+    )
 
 
 @asset_check(asset=_core_eia860__cooling_equipment, blocking=True)
@@ -1356,7 +1357,9 @@ def _core_eia860__fgd_equipment(
     )
 
     # Encoding required because this isn't fed into harvesting yet.
-    return PUDL_PACKAGE.encode(fgd_df).pipe(apply_pudl_dtypes, strict=False)
+    return pudl.metadata.PUDL_PACKAGE.encode(fgd_df).pipe(
+        apply_pudl_dtypes, strict=False
+    )
 
 
 @asset_check(asset=_core_eia860__fgd_equipment, blocking=True)
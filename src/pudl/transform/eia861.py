@@ -15,7 +15,6 @@ from pudl.helpers import (
     convert_to_date,
     fix_eia_na,
 )
-from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.enums import (
     CUSTOMER_CLASSES,
     FUEL_CLASSES,
@@ -1062,7 +1061,7 @@ def core_eia861__yearly_service_territory(
     df.loc[st_thomas, "county_id_fips"] = "78030"
     df.loc[df.state == "GU", "county_id_fips"] = "66010"
 
-    pk = PUDL_PACKAGE.get_resource(
+    pk = pudl.metadata.PUDL_PACKAGE.get_resource(
         "core_eia861__yearly_service_territory"
     ).schema.primary_key
     # We've fixed all we can fix! ~99.84% FIPS coverage.
@@ -2259,7 +2258,7 @@ def core_eia861__yearly_reliability(
         # Drop duplicate entries for utilities 13027, 3408 and 9697
         .pipe(_drop_dupes, df_name="Reliability", subset=idx_cols)
         .pipe(_post_process)
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
     return transformed_r
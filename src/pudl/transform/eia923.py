@@ -13,7 +13,6 @@ from dagster import (
 
 import pudl
 from pudl.helpers import convert_col_to_bool
-from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.codes import CODE_METADATA
 from pudl.metadata.fields import apply_pudl_dtypes
 from pudl.transform.classes import InvalidRows, drop_invalid_rows
@@ -491,7 +490,7 @@ def _coalmine_cleanup(cmi_df: pd.DataFrame) -> pd.DataFrame:
     )
     # join state and partial county FIPS into five digit county FIPS
     cmi_df["county_id_fips"] = cmi_df["state_id_fips"] + cmi_df["county_id_fips"]
-    cmi_df = PUDL_PACKAGE.encode(cmi_df)
+    cmi_df = pudl.metadata.PUDL_PACKAGE.encode(cmi_df)
     return cmi_df
 
 
@@ -669,7 +668,7 @@ def _core_eia923__pre_generation_fuel(raw_eia923__generation_fuel: pd.DataFrame)
     )
 
     gen_fuel = _clean_gen_fuel_energy_sources(gen_fuel)
-    gen_fuel = PUDL_PACKAGE.encode(gen_fuel)
+    gen_fuel = pudl.metadata.PUDL_PACKAGE.encode(gen_fuel)
     gen_fuel["fuel_type_code_pudl"] = gen_fuel.energy_source_code.map(
         pudl.helpers.label_map(
             CODE_METADATA["core_eia__codes_energy_sources"]["df"],
@@ -867,7 +866,7 @@ def _core_eia923__boiler_fuel(raw_eia923__boiler_fuel: pd.DataFrame) -> pd.DataF
 
     bf_df = remove_duplicate_pks_boiler_fuel_eia923(bf_df)
 
-    bf_df = PUDL_PACKAGE.encode(bf_df)
+    bf_df = pudl.metadata.PUDL_PACKAGE.encode(bf_df)
 
     # Add a simplified PUDL fuel type
     bf_df["fuel_type_code_pudl"] = bf_df.energy_source_code.map(
@@ -899,7 +898,7 @@ def remove_duplicate_pks_boiler_fuel_eia923(bf: pd.DataFrame) -> pd.DataFrame:
     See `comment <https://github.com/catalyst-cooperative/pudl/pull/2362#issuecomment-1470012538>`_
     for more details.
     """
-    pk = PUDL_PACKAGE.get_resource(
+    pk = pudl.metadata.PUDL_PACKAGE.get_resource(
         "core_eia923__monthly_boiler_fuel"
     ).schema.primary_key
 
@@ -1184,7 +1183,7 @@ def _core_eia923__fuel_receipts_costs(
             unmapped=pd.NA,
         )
     )
-    frc_df = PUDL_PACKAGE.encode(frc_df)
+    frc_df = pudl.metadata.PUDL_PACKAGE.encode(frc_df)
     frc_df["fuel_type_code_pudl"] = frc_df.energy_source_code.map(
         pudl.helpers.label_map(
             CODE_METADATA["core_eia__codes_energy_sources"]["df"],
@@ -1269,7 +1268,7 @@ def _core_eia923__cooling_system_information(
     return (
         pudl.helpers.dedupe_and_drop_nas(csi_df, primary_key_cols=primary_key)
         .pipe(apply_pudl_dtypes, group="eia", strict=False)
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
 
@@ -1526,7 +1525,7 @@ def _core_eia923__energy_storage(
         .pipe(_yearly_to_monthly_records)
         .pipe(pudl.helpers.convert_to_date)
         # Do encoding here because subsequent steps require good energy_source_code
-        .pipe(PUDL_PACKAGE.encode)
+        .pipe(pudl.metadata.PUDL_PACKAGE.encode)
     )
 
     # Spot fix for a single plant burning "other biomass gas" and reporting the amount
@@ -1,7 +1,9 @@
 """Module to perform data cleaning functions on EPA CEMS data tables."""
 
 import datetime
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -17,9 +19,130 @@ logger = pudl.logging_helpers.get_logger(__name__)
 # DATATABLE TRANSFORM FUNCTIONS
 ###############################################################################
 ###############################################################################
+@dataclass(frozen=True)
+class EpaCemsLookups:
+    """Plant ID and UTC offset lookups used to transform every batch of EPA CEMS data.
+
+    These are built once per ETL run by :func:`build_lookups` and shared by all of the
+    workers transforming CEMS data, so that each batch only has to do integer array
+    lookups rather than validating the crosswalk and merging it with the hourly data.
+    """
+
+    emissions_unit_ids: pd.Index
+    """All of the ``emissions_unit_id_epa`` values found in the crosswalk."""
+    crosswalk_keys: np.ndarray
+    """Sorted ``plant_id_epa * len(emissions_unit_ids) + unit position`` keys."""
+    crosswalk_plant_id_eia: np.ndarray
+    """The ``plant_id_eia`` associated with each of the ``crosswalk_keys``."""
+    utc_offsets: np.ndarray
+    """UTC offset of each plant, indexed by ``plant_id_eia``. NaT if unknown."""
+
+    def get_crosswalk_positions(self, df: pd.DataFrame) -> np.ndarray:
+        """Find the crosswalk position of each CEMS record's plant and unit.
+
+        Args:
+            df: A CEMS dataframe with ``plant_id_epa`` and ``emissions_unit_id_epa``.
+
+        Returns:
+            The index into :attr:`crosswalk_plant_id_eia` for each row in ``df``, or -1
+            for rows whose plant and unit don't appear in the crosswalk.
+        """
+        if len(self.crosswalk_keys) == 0:
+            return np.full(len(df), -1)
+        # Only look up each distinct unit ID once, not each row. Null unit IDs have a
+        # code of -1, which picks out the -1 appended to the end of the positions.
+        unit_codes, units = pd.factorize(df["emissions_unit_id_epa"])
+        unit_pos = np.append(self.emissions_unit_ids.get_indexer(units), -1)[unit_codes]
+        plant_id_epa = df["plant_id_epa"].to_numpy(dtype="int64", na_value=-1)
+        keys = plant_id_epa * len(self.emissions_unit_ids) + unit_pos
+
+        positions = np.searchsorted(self.crosswalk_keys, keys)
+        positions[positions == len(self.crosswalk_keys)] = 0
+        found = (
+            (unit_pos >= 0)
+            & (plant_id_epa >= 0)
+            & (self.crosswalk_keys[positions] == keys)
+        )
+        return np.where(found, positions, -1)
+
+
+def _get_utc_offsets(core_eia__entity_plants: pd.DataFrame) -> np.ndarray:
+    """Get the UTC offset of each EIA plant, indexed by plant_id_eia.
+
+    CEMS times don't change for DST, so we get the UTC offset by using the
+    offset for the plants' timezones in January.
+
+    Args:
+        core_eia__entity_plants: The EIA plant entities, with their timezones.
+
+    Returns:
+        An array of UTC offsets whose position corresponds to the plant_id_eia, with NaT
+        where the plant or its timezone is unknown.
+    """
+    timezones = core_eia__entity_plants[["plant_id_eia", "timezone"]].dropna()
+    jan1 = datetime.datetime(2011, 1, 1)  # year doesn't matter
+    # There are only a few dozen timezones, so look each of them up just once.
+    tz_offsets = {
+        tz: pytz.timezone(tz).localize(jan1).utcoffset()
+        for tz in timezones["timezone"].unique()
+    }
+    plant_ids = timezones["plant_id_eia"].to_numpy(dtype="int64")
+    utc_offsets = np.full(
+        plant_ids.max(initial=-1) + 1, np.timedelta64("NaT"), dtype="timedelta64[ns]"
+    )
+    utc_offsets[plant_ids] = pd.to_timedelta(
+        timezones["timezone"].map(tz_offsets)
+    ).to_numpy()
+    return utc_offsets
+
+
+def build_lookups(
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> EpaCemsLookups:
+    """Validate the EPA-EIA crosswalk and precompute the CEMS transform lookups.
+
+    Args:
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing the
+            ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+
+    Returns:
+        Lookups which can be used to transform any batch of CEMS data.
+    """
+    # Make sure the crosswalk does not have multiple plant_id_eia values for each
+    # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
+    crosswalk_df = (
+        core_epa__assn_eia_epacamd[
+            ["plant_id_eia", "plant_id_epa", "emissions_unit_id_epa"]
+        ]
+        .dropna()
+        .drop_duplicates()
+    )
+    if crosswalk_df.duplicated(subset=["plant_id_epa", "emissions_unit_id_epa"]).any():
+        raise AssertionError(
+            "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
+            "plant_id_epa and emissions_unit_id_epa group"
+        )
+
+    emissions_unit_ids = pd.Index(crosswalk_df["emissions_unit_id_epa"].unique())
+    keys = crosswalk_df["plant_id_epa"].to_numpy(dtype="int64") * len(
+        emissions_unit_ids
+    ) + emissions_unit_ids.get_indexer(crosswalk_df["emissions_unit_id_epa"])
+    order = np.argsort(keys)
+    return EpaCemsLookups(
+        emissions_unit_ids=emissions_unit_ids,
+        crosswalk_keys=keys[order],
+        crosswalk_plant_id_eia=crosswalk_df["plant_id_eia"].to_numpy(dtype="int64")[
+            order
+        ],
+        utc_offsets=_get_utc_offsets(core_eia__entity_plants),
+    )
+
+
 def harmonize_eia_epa_orispl(
     df: pd.DataFrame,
-    crosswalk_df: pd.DataFrame,
+    lookups: EpaCemsLookups,
 ) -> pd.DataFrame:
     """Harmonize the ORISPL code to match the EIA data.
 
@@ -27,11 +150,11 @@ def harmonize_eia_epa_orispl(
     compiled a crosswalk that maps one set of IDs to the other. The crosswalk is
     integrated into the PUDL db.
 
-    This function merges the crosswalk with the cems data thus adding the official
-    plant_id_eia column to CEMS. In cases where there is no plant_id_eia value for a
-    given plant_id_epa (i.e., this plant isn't in the crosswalk yet), we use
-    fillna() to add the plant_id_epa value to the plant_id_eia column. Because the
-    plant_id_epa is almost always correct this is reasonable.
+    This function looks up the official plant_id_eia for each CEMS record in the
+    crosswalk. In cases where there is no plant_id_eia value for a given plant_id_epa
+    (i.e., this plant isn't in the crosswalk yet), we use the plant_id_epa value in
+    the plant_id_eia column instead. Because the plant_id_epa is almost always correct
+    this is reasonable.
 
     EIA IDs are more correct so use the crosswalk to fix any erronious EPA IDs and get
     rid of that column to avoid confusion.
@@ -43,40 +166,22 @@ def harmonize_eia_epa_orispl(
 
     Args:
         df: A CEMS hourly dataframe for one year-month-state.
-        crosswalk_df: The core_epa__assn_eia_epacamd dataframe from the database.
+        lookups: Lookups built from the core_epa__assn_eia_epacamd crosswalk.
 
     Returns:
         The same data, with the ORISPL plant codes corrected to match the EIA plant IDs.
     """
-    # Make sure the crosswalk does not have multiple plant_id_eia values for each
-    # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
-    one_to_many = crosswalk_df.groupby(
-        ["plant_id_epa", "emissions_unit_id_epa"]
-    ).filter(
-        lambda x: x.plant_id_eia.nunique() > 1  # noqa: PD101
-    )
-    if not one_to_many.empty:
-        raise AssertionError(
-            "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
-            "plant_id_epa and emissions_unit_id_epa group"
-        )
-    crosswalk_df = crosswalk_df[
-        ["plant_id_eia", "plant_id_epa", "emissions_unit_id_epa"]
-    ].drop_duplicates()
-
-    # Merge CEMS with Crosswalk to get correct EIA ORISPL code and fill in all unmapped
-    # values with old plant_id_epa value.
-    df_merged = pd.merge(
-        df,
-        crosswalk_df,
-        on=["plant_id_epa", "emissions_unit_id_epa"],
-        how="left",
-    ).assign(plant_id_eia=lambda x: x.plant_id_eia.fillna(x.plant_id_epa))
-
-    return df_merged
+    positions = lookups.get_crosswalk_positions(df)
+    matched = positions >= 0
+    plant_id_eia = df["plant_id_epa"].astype("Int64").array
+    plant_id_eia[matched] = lookups.crosswalk_plant_id_eia[positions[matched]]
+    # A shallow copy lets us add a column without copying or modifying the input.
+    df = df.copy(deep=False)
+    df["plant_id_eia"] = plant_id_eia
+    return df
 
 
-def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataFrame:
+def convert_to_utc(df: pd.DataFrame, lookups: EpaCemsLookups) -> pd.DataFrame:
     """Convert CEMS datetime data to UTC timezones.
 
     Transformations include:
@@ -85,31 +190,29 @@ def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataF
 
     Args:
         df: A CEMS hourly dataframe for one year-state.
-        plant_utc_offset: A dataframe association with timezones.
+        lookups: Lookups containing the UTC offset of each plant.
 
     Returns:
         The same data, with an op_datetime_utc column added and the op_date and op_hour
         columns removed.
     """
-    df = df.assign(
-        # Convert op_date and op_hour from string and integer to datetime:
-        # Note that doing this conversion, rather than reading the CSV with
-        # `parse_dates=True`, is >10x faster.
-        # Read the date as a datetime, so all the dates are midnight
-        op_datetime_naive=lambda x: pd.to_datetime(
-            x.op_date, format=r"%Y-%m-%d", exact=True, cache=True
-        )
-        + pd.to_timedelta(x.op_hour, unit="h")  # Add the hour
-    ).merge(
-        plant_utc_offset,
-        how="left",
-        on="plant_id_eia",
-    )
+    # Convert op_date and op_hour from string and integer to datetime:
+    # Note that doing this conversion, rather than reading the CSV with
+    # `parse_dates=True`, is >10x faster.
+    # Read the date as a datetime, so all the dates are midnight
+    op_datetime_naive = pd.to_datetime(
+        df["op_date"], format=r"%Y-%m-%d", exact=True, cache=True
+    ) + pd.to_timedelta(df["op_hour"], unit="h")  # Add the hour
+
+    plant_id_eia = df["plant_id_eia"].to_numpy(dtype="int64", na_value=-1)
+    known = (plant_id_eia >= 0) & (plant_id_eia < len(lookups.utc_offsets))
+    utc_offset = np.full(len(df), np.timedelta64("NaT"), dtype="timedelta64[ns]")
+    utc_offset[known] = lookups.utc_offsets[plant_id_eia[known]]
 
     # Some of the timezones in the core_eia__entity_plants table may be missing,
     # but none of the CEMS plants should be.
-    if df["utc_offset"].isna().any():
-        missing_plants = df.loc[df["utc_offset"].isna(), "plant_id_eia"].unique()
+    if (missing := np.isnat(utc_offset)).any():
+        missing_plants = df.loc[missing, "plant_id_eia"].unique()
         raise ValueError(
             f"utc_offset should never be missing for CEMS plants, but was "
             f"missing for these: {list(missing_plants)!s}"
@@ -119,38 +222,12 @@ def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataF
     # contains values in UTC. Storing timezone info in Numpy datetime64 objects is
     # deprecated, but the PyArrow schema stores this data as UTC. See:
     # https://numpy.org/devdocs/reference/arrays.datetime.html#basic-datetimes
-    df["operating_datetime_utc"] = df["op_datetime_naive"] - df["utc_offset"]
-    del (
-        df["op_date"],
-        df["op_hour"],
-        df["op_datetime_naive"],
-        df["utc_offset"],
-    )
+    df = df.copy(deep=False)
+    del df["op_date"], df["op_hour"]
+    df["operating_datetime_utc"] = op_datetime_naive - utc_offset
     return df
 
 
-def _load_plant_utc_offset(core_eia__entity_plants: pd.DataFrame) -> pd.DataFrame:
-    """Load the UTC offset each EIA plant.
-
-    CEMS times don't change for DST, so we get the UTC offset by using the
-    offset for the plants' timezones in January.
-
-    Args:
-        pudl_engine: A database connection engine for
-            an existing PUDL DB.
-
-    Returns:
-        Dataframe of applicable timezones taken from the core_eia__entity_plants table.
-    """
-    timezones = core_eia__entity_plants[["plant_id_eia", "timezone"]].copy().dropna()
-    jan1 = datetime.datetime(2011, 1, 1)  # year doesn't matter
-    timezones["utc_offset"] = timezones["timezone"].apply(
-        lambda tz: pytz.timezone(tz).localize(jan1).utcoffset()
-    )
-    del timezones["timezone"]
-    return timezones
-
-
 def correct_gross_load_mw(df: pd.DataFrame) -> pd.DataFrame:
     """Fix values of gross load that are wrong by orders of magnitude.
 
@@ -172,30 +249,21 @@ def correct_gross_load_mw(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform(
-    raw_df: pd.DataFrame,
-    core_epa__assn_eia_epacamd: pd.DataFrame,
-    core_eia__entity_plants: pd.DataFrame,
-) -> pd.DataFrame:
+def transform(raw_df: pd.DataFrame, lookups: EpaCemsLookups) -> pd.DataFrame:
     """Transform EPA CEMS hourly data and ready it for export to Parquet.
 
     Args:
         raw_df: An extracted by not yet transformed year_quarter of EPA CEMS data.
-        pudl_engine: SQLAlchemy connection engine for connecting to an existing PUDL DB.
+        lookups: The crosswalk and UTC offset lookups from :func:`build_lookups`.
 
     Returns:
         A single year_quarter of EPA CEMS data
     """
-    # Create all the table inputs used for the subtransform functions below
-
     return (
         raw_df.pipe(apply_pudl_dtypes, group="epacems")
         .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
-        .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
-        .pipe(
-            convert_to_utc,
-            plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
-        )
+        .pipe(harmonize_eia_epa_orispl, lookups)
+        .pipe(convert_to_utc, lookups)
         .pipe(correct_gross_load_mw)
         .pipe(apply_pudl_dtypes, group="epacems")
     )
@@ -6,9 +6,11 @@ import json
 import pathlib
 import re
 import sys
+import tempfile
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Annotated, Any, Self
 from urllib.parse import ParseResult, urlparse
@@ -37,6 +39,12 @@ ZenodoDoi = Annotated[
 ]
 
 
+DOWNLOAD_CHUNK_SIZE = 8 * 2**20
+"""Size in bytes of the chunks that resources are streamed to disk in."""
+PREFETCH_MAX_WORKERS = 4
+"""Default number of resources to download concurrently."""
+
+
 class ChecksumMismatchError(ValueError):
     """Resource checksum (md5) does not match."""
 
@@ -91,13 +99,21 @@ class DatapackageDescriptor:
 
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_md5(name, m.hexdigest())
+
+    def get_checksum(self, name: str) -> str:
+        """Returns the md5 checksum of the named resource."""
+        return self._get_resource_metadata(name)["hash"]
+
+    def validate_md5(self, name: str, md5_hexdigest: str) -> None:
+        """Raises ChecksumMismatchError if md5 digest doesn't match named resource."""
+        expected_checksum = self.get_checksum(name)
+        if md5_hexdigest != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {md5_hexdigest}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -301,6 +317,41 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def download_resource(
+        self: Self,
+        res: PudlResourceKey,
+        path: Path,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> None:
+        """Stream contents of the resource from zenodo into a local file.
+
+        The response is written to disk in chunks as it arrives, and its checksum is
+        computed incrementally, so the whole file is never held in memory. If the
+        download fails or the checksum doesn't match, the file is removed.
+
+        Args:
+            res: the resource to download.
+            path: the local file to write the resource contents to.
+            chunk_size: number of bytes to read from the response at a time.
+        """
+        desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        logger.info(f"Retrieving {url} from zenodo")
+        m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+        try:
+            with self.http.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != requests.codes.ok:
+                    raise ValueError(f"Could not download {url}: {response.text}")
+                with path.open("wb") as file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        file.write(chunk)
+                        m.update(chunk)
+            desc.validate_md5(res.name, m.hexdigest())
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Successfully downloaded {url}")
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -325,6 +376,7 @@ class Datastore:
         """
         self._cache = resource_cache.LayeredCache()
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
+        self._local_cache_path = local_cache_path
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
@@ -389,18 +441,98 @@ class Datastore:
             if self._cache.is_optimally_cached(res) and skip_optimally_cached:
                 logger.info(f"{res} is already optimally cached.")
                 continue
-            if self._cache.contains(res):
-                contents = self._cache.get(res)
-                logger.info(f"Retrieved {res} from cache.")
-                if not self._cache.is_optimally_cached(res):
+            if self._cache.contains(res) or not cached_only:
+                yield (res, self._get_resource_content(res))
+
+    def _get_resource_content(self, res: PudlResourceKey) -> bytes:
+        """Returns content of a resource, making sure it ends up optimally cached."""
+        if self._cache.contains(res):
+            contents = self._cache.get(res)
+            logger.info(f"Retrieved {res} from cache.")
+            if not self._cache.is_optimally_cached(res):
+                logger.info(f"{res} was not optimally cached yet, adding.")
+                self._add_verified(res, contents)
+            return contents
+        logger.info(f"Retrieved {res} from zenodo.")
+        # ZenodoFetcher verifies the checksum of everything it downloads.
+        contents = self._zenodo_fetcher.get_resource(res)
+        self._cache.add(res, contents)
+        return contents
+
+    def _add_verified(self, res: PudlResourceKey, contents: bytes) -> None:
+        """Verify the checksum of a resource before adding it to the cache.
+
+        Checksums are only verified when resources are added to the cache, so that
+        cached resources can be opened without reading all of their contents.
+        """
+        desc = self.get_datapackage_descriptor(res.dataset)
+        desc.validate_checksum(res.name, contents)
+        self._cache.add(res, contents)
+
+    def prefetch(
+        self,
+        datasets: list[str],
+        max_workers: int = PREFETCH_MAX_WORKERS,
+        **filters: Any,
+    ) -> list[PudlResourceKey]:
+        """Make sure all of the matching resources are optimally cached.
+
+        Resources that are already in the closest writable cache layer are skipped,
+        and resources found in another cache layer are copied into it. All of the
+        others are downloaded from Zenodo concurrently, with up to ``max_workers``
+        downloads at a time. Each download is streamed to a temporary file and then
+        added to the cache, so resources are never held in memory.
+
+        Args:
+            datasets: names of the datasets to prefetch.
+            max_workers: maximum number of resources to download at once.
+            filters (key=val): only prefetch resources that match the key-value
+                mapping in their metadata["parts"].
+
+        Returns:
+            The resources that were added to the cache.
+        """
+        fetched: list[PudlResourceKey] = []
+        to_download: list[PudlResourceKey] = []
+        for dataset in datasets:
+            desc = self.get_datapackage_descriptor(dataset)
+            for res in desc.get_resources(**filters):
+                if self._cache.is_optimally_cached(res):
+                    logger.info(f"{res} is already optimally cached.")
+                elif self._cache.contains(res):
                     logger.info(f"{res} was not optimally cached yet, adding.")
-                    self._cache.add(res, contents)
-                yield (res, contents)
-            elif not cached_only:
-                logger.info(f"Retrieved {res} from zenodo.")
-                contents = self._zenodo_fetcher.get_resource(res)
-                self._cache.add(res, contents)
-                yield (res, contents)
+                    self._add_verified(res, self._cache.get(res))
+                    fetched.append(res)
+                else:
+                    to_download.append(res)
+        if not to_download:
+            return fetched
+
+        # Load each descriptor up front, rather than concurrently in every worker.
+        for dataset in {res.dataset for res in to_download}:
+            self._zenodo_fetcher.get_descriptor(dataset)
+        # Stage downloads alongside the local cache so they can be moved into place.
+        if self._local_cache_path:
+            self._local_cache_path.mkdir(parents=True, exist_ok=True)
+        with (
+            tempfile.TemporaryDirectory(dir=self._local_cache_path) as staging_dir,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            futures = {
+                executor.submit(self._download_to_cache, res, Path(staging_dir)): res
+                for res in to_download
+            }
+            for future in as_completed(futures):
+                future.result()
+                logger.info(f"Retrieved {futures[future]} from zenodo.")
+                fetched.append(futures[future])
+        return fetched
+
+    def _download_to_cache(self, res: PudlResourceKey, staging_dir: Path) -> None:
+        """Stream a resource from Zenodo to a staging file and add it to the cache."""
+        path = staging_dir / f"{res.dataset}-{res.name}"
+        self._zenodo_fetcher.download_resource(res, path)
+        self._cache.add_file(res, path)
 
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
@@ -408,34 +540,54 @@ class Datastore:
 
     def get_unique_resource(self, dataset: str, **filters: Any) -> bytes:
         """Returns content of a resource assuming there is exactly one that matches."""
-        res = self.get_resources(dataset, **filters)
-        try:
-            _, content = next(res)
-        except StopIteration as err:
-            raise KeyError(f"No resources found for {dataset}: {filters}") from err
-        try:
-            next(res)
-        except StopIteration:
-            return content
-        raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        return self._get_resource_content(
+            self._get_unique_resource_key(dataset, **filters)
+        )
+
+    def get_unique_resource_checksum(self, dataset: str, **filters: Any) -> str:
+        """Returns md5 checksum of a resource assuming there is exactly one that matches."""
+        res = self._get_unique_resource_key(dataset, **filters)
+        return self.get_datapackage_descriptor(dataset).get_checksum(res.name)
+
+    def _get_unique_resource_key(self, dataset: str, **filters: Any) -> PudlResourceKey:
+        """Returns the key of the one resource that matches the filters."""
+        desc = self.get_datapackage_descriptor(dataset)
+        resources = list(desc.get_resources(**filters))
+        if not resources:
+            raise KeyError(f"No resources found for {dataset}: {filters}")
+        if len(resources) > 1:
+            raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        return resources[0]
+
+    def _open_zipfile(self, res: PudlResourceKey) -> zipfile.ZipFile:
+        """Opens a resource as a ZipFile, reading it from disk if possible.
+
+        If the resource is available as a file in a local cache layer, the ZipFile is
+        opened from that file, and the members are only read when they are used.
+        Otherwise the whole archive is retrieved and held in memory.
+        """
+        path = self._cache.get_path(res)
+        if path is None:
+            # Retrieving the content also adds it to the closest cache layer.
+            content = self._get_resource_content(res)
+            path = self._cache.get_path(res)
+            if path is None:
+                logger.info(f"Opening {res} from {len(content)} bytes in memory.")
+                return zipfile.ZipFile(io.BytesIO(content))
+        logger.info(f"Opening {res} from {path}")
+        return zipfile.ZipFile(path)
 
     def get_zipfile_resource(self, dataset: str, **filters: Any) -> zipfile.ZipFile:
         """Retrieves unique resource and opens it as a ZipFile."""
-        resource_bytes = self.get_unique_resource(dataset, **filters)
-        resource = io.BytesIO(resource_bytes)
-        md5sum = hashlib.file_digest(resource, "md5").hexdigest()
-        logger.info(
-            f"Got resource {dataset=}, {filters=}, {md5sum=}, "
-            f"{len(resource_bytes)} bytes; turning into ZipFile"
-        )
-        return zipfile.ZipFile(resource)
+        return self._open_zipfile(self._get_unique_resource_key(dataset, **filters))
 
     def get_zipfile_resources(
         self, dataset: str, **filters: Any
     ) -> Iterator[tuple[PudlResourceKey, zipfile.ZipFile]]:
         """Iterates over resources that match filters and opens each as ZipFile."""
-        for resource_key, content in self.get_resources(dataset, **filters):
-            yield resource_key, zipfile.ZipFile(io.BytesIO(content))
+        desc = self.get_datapackage_descriptor(dataset)
+        for resource_key in desc.get_resources(**filters):
+            yield resource_key, self._open_zipfile(resource_key)
 
     def get_zipfile_file_names(self, zip_file: zipfile.ZipFile):
         """Given a zipfile, return a list of the file names in it."""
@@ -492,19 +644,11 @@ def fetch_resources(
     dstore: Datastore,
     datasets: list[str],
     partition: dict[str, int | str],
-    gcs_cache_path: str,
-    bypass_local_cache: bool,
+    max_workers: int = PREFETCH_MAX_WORKERS,
 ) -> None:
     """Retrieve all matching resources and store them in the cache."""
-    for single_ds in datasets:
-        for res, contents in dstore.get_resources(
-            single_ds, skip_optimally_cached=True, **partition
-        ):
-            logger.info(f"Retrieved {res}.")
-            # If the gcs_cache_path is specified and we don't want
-            # to bypass the local cache, populate the local cache.
-            if gcs_cache_path and not bypass_local_cache:
-                dstore._cache.add(res, contents)
+    fetched = dstore.prefetch(datasets, max_workers=max_workers, **partition)
+    logger.info(f"Retrieved {len(fetched)} resources.")
 
 
 def _parse_key_values(
@@ -591,6 +735,14 @@ def _parse_key_values(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=PREFETCH_MAX_WORKERS,
+    show_default=True,
+    help="Maximum number of resources to download from Zenodo concurrently.",
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -614,6 +766,7 @@ def pudl_datastore(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    workers: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -631,6 +784,10 @@ def pudl_datastore(
 
     pudl_datastore --dataset ferc2 --partition year=2021 --bypass-local-cache
 
+    Download all the raw EPA CEMS data, 8 files at a time:
+
+    pudl_datastore --dataset epacems --workers 8
+
     Validate all California EPA CEMS data in the local datastore:
 
     pudl_datastore --dataset epacems --validate --partition state=ca
@@ -662,8 +819,7 @@ def pudl_datastore(
             dstore=dstore,
             datasets=dataset,
             partition=partition,
-            gcs_cache_path=gcs_cache_path,
-            bypass_local_cache=bypass_local_cache,
+            max_workers=workers,
         )
 
     return 0
@@ -1,8 +1,11 @@
 """Implementations of datastore resource caches."""
 
+import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, NamedTuple
+from uuid import uuid4
 from urllib.parse import urlparse
 
 import google.auth
@@ -72,6 +75,20 @@ class AbstractCache(ABC):
     def add(self, resource: PudlResourceKey, content: bytes) -> None:
         """Adds resource to the cache and sets the content."""
 
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns path to a local file holding the resource, if there is one.
+
+        Caches that don't store resources on the local filesystem return None.
+        """
+        return None
+
+    def add_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Adds resource to the cache with the contents of a local file.
+
+        The file may be moved into the cache, so it should not be used afterwards.
+        """
+        self.add(resource, path.read_bytes())
+
     @abstractmethod
     def delete(self, resource: PudlResourceKey) -> None:
         """Removes the resource from cache."""
@@ -98,6 +115,11 @@ class LocalFileCache(AbstractCache):
             logger.debug(f"Getting {resource} from local file cache.")
             return res.read()
 
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns path to the file holding the resource, or None if it's missing."""
+        path = self._resource_path(resource)
+        return path if path.exists() else None
+
     def add(self, resource: PudlResourceKey, content: bytes):
         """Adds (or updates) resource to the cache with given value."""
         logger.debug(f"Adding {resource} to {self._resource_path}")
@@ -106,8 +128,30 @@ class LocalFileCache(AbstractCache):
             return
         path = self._resource_path(resource)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as file:
-            file.write(content)
+        # Write to a temporary file next to the resource and move it into place, so
+        # that concurrent readers never see a partially written resource.
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("xb") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Moves a local file into the cache as the content of the given resource."""
+        logger.debug(f"Adding {resource} to {self._resource_path} from {path}")
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        target = self._resource_path(resource)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # The file may be on another filesystem, in which case shutil.move copies it,
+        # so move it next to the target first and then atomically into place.
+        tmp_target = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+        shutil.move(path, tmp_target)
+        os.replace(tmp_target, target)
 
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
@@ -136,13 +180,30 @@ class GoogleCloudStorageCache(AbstractCache):
         if parsed_url.scheme != "gs":
             raise ValueError(f"gsc_path should start with gs:// (found: {gcs_path})")
         self._path_prefix = Path(parsed_url.path)
+        self._bucket_name = parsed_url.netloc
+        self._bucket = self._get_bucket(self._bucket_name)
+
+    @staticmethod
+    def _get_bucket(bucket_name: str) -> storage.Bucket:
+        """Connect to the given bucket with the default GCP credentials."""
         # Get GCP credentials and billing project id
         # A billing project is now required because zenodo-cache is requester pays.
         credentials, project_id = google.auth.default()
-        self._bucket = storage.Client(credentials=credentials).bucket(
-            parsed_url.netloc, user_project=project_id
+        return storage.Client(credentials=credentials).bucket(
+            bucket_name, user_project=project_id
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the cache without its GCS client, e.g. to send to another process."""
+        state = self.__dict__.copy()
+        del state["_bucket"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Reconnect to the GCS bucket when the cache is unpickled."""
+        self.__dict__.update(state)
+        self._bucket = self._get_bucket(self._bucket_name)
+
     def _blob(self, resource: PudlResourceKey) -> Blob:
         """Retrieve Blob object associated with given resource."""
         p = (self._path_prefix / resource.get_local_path()).as_posix().lstrip("/")
@@ -158,6 +219,11 @@ class GoogleCloudStorageCache(AbstractCache):
         logger.debug(f"Adding {resource} to {self._blob.__name__}")
         return self._blob(resource).upload_from_string(value)
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Uploads a local file as the content of the given resource."""
+        logger.debug(f"Adding {resource} to {self._blob.__name__} from {path}")
+        return self._blob(resource).upload_from_filename(str(path))
+
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
         self._blob(resource).delete()
@@ -210,6 +276,17 @@ class LayeredCache(AbstractCache):
         logger.debug(f"get:{resource} not found in the layered cache.")
         raise KeyError(f"{resource} not found in the layered cache")
 
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns local path of the resource from the first layer containing it.
+
+        Returns None if the resource is missing, or if the first layer containing it
+        doesn't keep it in a local file.
+        """
+        for cache in self._caches:
+            if cache.contains(resource):
+                return cache.get_path(resource)
+        return None
+
     def add(self, resource: PudlResourceKey, value):
         """Adds (or replaces) resource into the cache with given value."""
         if self.is_read_only():
@@ -225,6 +302,18 @@ class LayeredCache(AbstractCache):
             )
             break
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Adds (or replaces) resource into the cache with the contents of a file."""
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        for cache_layer in self._caches:
+            if cache_layer.is_read_only():
+                continue
+            logger.debug(f"Adding {resource} to cache {cache_layer.__class__.__name__}")
+            cache_layer.add_file(resource, path)
+            break
+
     def delete(self, resource: PudlResourceKey):
         """Removes resource from the cache if the cache is not in the read_only mode."""
         if self.is_read_only():
@@ -210,7 +210,7 @@ def ferc1_dbf_extract(
                     "datastore": {
                         "config": pudl_datastore_config,
                     },
-                    "runtime_settings": {"config": {"xbrl_num_workers": 2}},
+                    "runtime_settings": {"config": {"dbf_num_workers": 2}},
                 },
             },
         )
@@ -0,0 +1,69 @@
+"""Test computing distances between FERC plant records from different years."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy
+from sklearn.metrics import pairwise_distances
+
+from pudl.analysis.record_linkage.link_cross_year import (
+    DistanceMatrix,
+    PenalizeReportYearDistanceConfig,
+)
+
+
+@pytest.fixture()
+def records() -> tuple[np.ndarray, pd.DataFrame]:
+    """Features and report years of records near a few points."""
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 2, (10, 3))
+    features = centers[rng.integers(0, 10, 200)] + rng.normal(0, 0.1, (200, 3))
+    return features, pd.DataFrame({"report_year": rng.integers(2000, 2010, 200)})
+
+
+def dense_distances(features, df, config) -> np.ndarray:
+    """Distances between all pairs of records, with the same-year penalty."""
+    years = df.report_year.to_numpy()
+    distances = pairwise_distances(features, metric=config.metric)
+    distances[years[:, None] == years[None, :]] = config.distance_penalty
+    np.fill_diagonal(distances, 0)
+    return distances
+
+
+@pytest.mark.parametrize("distance_penalty", [0.2, 10000.0])
+@pytest.mark.parametrize("metric", ["euclidean", "cosine"])
+def test_distance_matrix_matches_dense(records, metric, distance_penalty):
+    """Distances computed as they're needed match a dense distance matrix."""
+    features, df = records
+    config = PenalizeReportYearDistanceConfig(
+        metric=metric, distance_penalty=distance_penalty
+    )
+    expected = dense_distances(features, df, config)
+    distance_matrix = DistanceMatrix(features, df, config)
+
+    cluster_inds = np.array([5, 1, 7, 100])
+    np.testing.assert_allclose(
+        distance_matrix.distances(cluster_inds),
+        expected[np.ix_(cluster_inds, cluster_inds)],
+        rtol=1e-6,
+    )
+
+    graph = distance_matrix.radius_neighbors_graph(0.5)
+    assert isinstance(graph, scipy.sparse.csr_matrix)
+    neighbors = (expected <= 0.5) & ~np.eye(len(df), dtype=bool)
+    np.testing.assert_array_equal(graph.toarray() > 0, neighbors)
+    np.testing.assert_allclose(
+        graph.toarray(), np.where(neighbors, expected, 0), atol=1e-6
+    )
+
+    clusters = np.array_split(np.random.default_rng(1).permutation(len(df)), 30)
+    sizes = np.array([len(inds) for inds in clusters])
+    expected_average = np.array(
+        [[expected[np.ix_(i, j)].sum() for j in clusters] for i in clusters]
+    ) / (sizes[:, None] + sizes[None, :])
+    np.fill_diagonal(expected_average, 0)
+    np.testing.assert_allclose(
+        distance_matrix.average_cluster_distances(clusters, block_size=1000),
+        expected_average,
+        rtol=1e-6,
+    )
@@ -0,0 +1,54 @@
+"""Test cleaning company and plant names for record linkage."""
+
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage import name_cleaner
+from pudl.analysis.record_linkage.name_cleaner import (
+    CompanyNameCleaner,
+    LegalTermLocation,
+)
+
+NAMES = pd.Series(
+    [
+        "The Fox Lake Power Co.",
+        "Eagle Mountain (Retired) #2",
+        None,
+        "Northern States Power Co - Minnesota",
+        "Fox Lake Power Company, Inc",
+        "The Fox Lake Power Co.",
+        "duke energy llc",
+        "Ambit Texas, L.L.C.",
+        pd.NA,
+        "unit-3_d&c",
+    ],
+    name="utility_name",
+)
+
+
+@pytest.mark.parametrize("legal_term_location", list(LegalTermLocation))
+def test_apply_name_cleaning_matches_get_clean_data(legal_term_location):
+    """Cleaning a column of names cleans each name the same way."""
+    cleaner = CompanyNameCleaner(legal_term_location=legal_term_location)
+    expected = NAMES.apply(cleaner.get_clean_data)
+    pd.testing.assert_series_equal(cleaner.apply_name_cleaning(NAMES), expected)
+    pd.testing.assert_frame_equal(
+        cleaner.apply_name_cleaning(NAMES.to_frame(), return_as_dframe=True),
+        expected.to_frame(),
+    )
+    assert cleaner.get_clean_data("Fox Lake Power Co.") == "fox lake power company"
+
+
+def test_apply_to_unique_is_memoized(mocker):
+    """Functions are applied once to each unique value, and results are memoized."""
+    func = mocker.Mock(side_effect=str.upper)
+    result = name_cleaner.apply_to_unique(NAMES, func, key="upper")
+    assert func.call_count == NAMES.nunique()
+    assert result.tolist() == [None if pd.isna(n) else n.upper() for n in NAMES]
+    name_cleaner.apply_to_unique(NAMES.iloc[::-1], func, key="upper")
+    name_cleaner.apply_to_unique(NAMES, func, key="something else")
+    assert func.call_count == 3 * NAMES.nunique()
+    pd.testing.assert_series_equal(
+        name_cleaner.apply_to_unique(NAMES, func, key="upper"), result
+    )
+    assert func.call_count == 3 * NAMES.nunique()
@@ -0,0 +1,45 @@
+"""Tests for rolling window statistics of multivariate timeseries."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis import rolling_window
+
+
+@pytest.fixture(scope="module")
+def x() -> np.ndarray:
+    """Random series with scattered nulls, an all-null run and repeated values."""
+    rng = np.random.default_rng(seed=0)
+    x = rng.normal(size=(500, 4))
+    x[rng.random(x.shape) < 0.2] = np.nan
+    x[100:200, 1] = np.nan
+    x[:, 2] = np.round(x[:, 2])
+    return x
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 48, 1000])
+def test_rolling_median_matches_pandas(x, window):
+    """Rolling medians are the same as centered pandas rolling medians."""
+    expected = (
+        pd.DataFrame(x).rolling(window, min_periods=1, center=True).median().to_numpy()
+    )
+    np.testing.assert_array_equal(rolling_window.rolling_median(x, window), expected)
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 48, 1000])
+def test_rolling_iqr_matches_pandas(x, window):
+    """Rolling IQRs are the same as the difference of centered pandas quantiles."""
+    rolling = pd.DataFrame(x).rolling(window, min_periods=1, center=True)
+    expected = (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+    np.testing.assert_array_equal(rolling_window.rolling_iqr(x, window), expected)
+
+
+@pytest.mark.parametrize("shifts", [[0], range(-240, 241, 24), [-3, 5, 1000]])
+def test_shifted_nanmedian_matches_numpy(x, shifts):
+    """The median of shifted values is the same as the median of shifted copies."""
+    shifted = np.stack([pd.DataFrame(x).shift(shift).to_numpy() for shift in shifts])
+    with np.testing.suppress_warnings() as sup:
+        sup.filter(RuntimeWarning, "All-NaN slice encountered")
+        expected = np.nanmedian(shifted, axis=0)
+    np.testing.assert_array_equal(rolling_window.shifted_nanmedian(x, shifts), expected)
@@ -0,0 +1,113 @@
+"""Tests for compiling utility and balancing authority service territories."""
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import shapely
+
+from pudl.analysis import service_territory
+from pudl.analysis.service_territory import CountyGeometryCache, add_geometries
+
+
+@pytest.fixture()
+def census_gdf() -> gpd.GeoDataFrame:
+    """A row of four square counties."""
+    return gpd.GeoDataFrame(
+        {
+            "geoid10": ["01001", "01003", "01005", "01007"],
+            "namelsad10": ["A County", "B County", "C County", "D County"],
+            "dp0010001": [10, 20, 30, 40],
+        },
+        geometry=[shapely.box(i, 0, i + 1, 1) for i in range(4)],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture()
+def territory_df() -> pd.DataFrame:
+    """Utilities serving the same counties in most years."""
+    counties = {
+        (2020, 1): ["01001", "01003"],
+        (2021, 1): ["01003", "01001", "01001"],
+        (2020, 2): ["01005", "01007"],
+        (2021, 2): ["01005"],
+        (2021, 3): ["01001", "01003"],
+        (2022, 3): ["99999"],
+        (2022, 4): [None],
+    }
+    return pd.DataFrame(
+        [
+            {
+                "report_date": pd.Timestamp(f"{year}-01-01"),
+                "utility_id_eia": utility_id,
+                "state": "AL",
+                "county": "County",
+                "state_id_fips": "01",
+                "county_id_fips": county_id_fips,
+            }
+            for (year, utility_id), fips in counties.items()
+            for county_id_fips in fips
+        ]
+    )
+
+
+def test_dissolve_reuses_county_unions(mocker, tmp_path, census_gdf, territory_df):
+    """Each distinct set of counties is dissolved once, and can be saved for reuse."""
+    # What GeoDataFrame.dissolve() does for each group
+    expected = (
+        census_gdf.rename(columns={"geoid10": "county_id_fips"})
+        .merge(territory_df.drop_duplicates(), how="right")
+        .dissolve(by=["report_date", "utility_id_eia"])
+        .reset_index()
+    )
+    union_all = mocker.spy(service_territory.shapely, "union_all")
+    cache = CountyGeometryCache(path=tmp_path / "counties.parquet")
+    dissolved = add_geometries(
+        territory_df,
+        census_gdf,
+        dissolve=True,
+        dissolve_by=["report_date", "utility_id_eia"],
+        geometry_cache=cache,
+    )
+    assert union_all.call_count == len(cache) == 5
+
+    assert dissolved.columns.tolist() == [
+        "report_date",
+        "utility_id_eia",
+        "geometry",
+        "population",
+        "area_km2",
+    ]
+    pd.testing.assert_frame_equal(
+        dissolved[["report_date", "utility_id_eia"]],
+        expected[["report_date", "utility_id_eia"]],
+    )
+    assert dissolved.geometry.geom_equals(expected.geometry).all()
+    assert dissolved.population.tolist() == [30, 70, 30, 30, 30, 0, 0]
+    assert dissolved.crs == census_gdf.crs
+
+    # Unions saved by one cache are reused by the next, even for other entities.
+    ba_df = territory_df.rename(
+        columns={"utility_id_eia": "balancing_authority_id_eia"}
+    )
+    ba_dissolved = add_geometries(
+        ba_df,
+        census_gdf,
+        dissolve=True,
+        dissolve_by=["report_date", "balancing_authority_id_eia"],
+        geometry_cache=CountyGeometryCache(path=cache.path),
+    )
+    assert union_all.call_count == 5
+    assert ba_dissolved.geometry.geom_equals(dissolved.geometry).all()
+
+    # Cached unions aren't reused if the county geometries change, and are dropped.
+    census_gdf["geometry"] = census_gdf.geometry.translate(xoff=1)
+    add_geometries(
+        territory_df,
+        census_gdf,
+        dissolve=True,
+        dissolve_by=["report_date", "utility_id_eia"],
+        geometry_cache=cache,
+    )
+    assert union_all.call_count == 10
+    assert len(cache) == len(CountyGeometryCache(path=cache.path)) == 5
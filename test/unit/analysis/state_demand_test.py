@@ -4,7 +4,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pudl.analysis.state_demand import lookup_state
+from pudl.analysis.state_demand import (
+    impute_ferc714_hourly_demand_matrix,
+    lookup_state,
+)
 
 AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 
@@ -34,3 +37,39 @@ AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 def test_lookup_state(state: str | int, expected: dict[str, str | int]) -> None:
     """Check that various kinds of state lookups work."""
     assert lookup_state(state) == expected
+
+
+def test_impute_ferc714_early_stopping_drift() -> None:
+    """Stopping early changes the imputed demand by less than the noise in it.
+
+    The bounds pin how far an opt-in ``min_delta`` moves the imputed values away from
+    those imputed with the default stopping criterion.
+    """
+    rng = np.random.default_rng(seed=16662093832)
+    hours = pd.date_range("2020-01-01", periods=24 * 60, freq="h")
+    t = np.arange(len(hours)) * (2 * np.pi / 24)
+    demand = np.column_stack(
+        [
+            1e4 * (offset + amplitude * np.sin(t + shift))
+            for offset, amplitude, shift in zip(
+                rng.uniform(5, 10, 20),
+                rng.uniform(1, 3, 20),
+                rng.uniform(0, 3, 20),
+                strict=True,
+            )
+        ]
+    )
+    # 0.5% noise
+    demand *= rng.normal(loc=1, scale=0.005, size=demand.shape)
+    nulls = rng.random(demand.shape) < 0.1
+    df = pd.DataFrame(np.where(nulls, np.nan, demand), index=hours)
+
+    imputed = impute_ferc714_hourly_demand_matrix(df, min_delta=1e-3).to_numpy()[nulls]
+    converged = impute_ferc714_hourly_demand_matrix(df).to_numpy()[nulls]
+    drift = imputed / converged - 1
+    assert np.abs(drift).max() < 0.03
+    assert np.sqrt(np.mean(drift**2)) < 0.005
+    # Stopping early doesn't move the imputed values away from the original demand
+    error = np.sqrt(np.mean((imputed / demand[nulls] - 1) ** 2))
+    converged_error = np.sqrt(np.mean((converged / demand[nulls] - 1) ** 2))
+    assert error < 1.1 * converged_error
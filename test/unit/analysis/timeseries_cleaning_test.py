@@ -107,3 +107,87 @@ def test_flags_and_imputes_anomalies(series_seed, anomalies_seed) -> None:
         fit = s.summarize_imputed(imputed, mask)
         # Mean MAPE (mean absolute percent error) is converging
         assert fit["mape"].mean() < fit0["mape"].mean()
+
+
+def test_svt_tnn_warm_start_matches_full_svd() -> None:
+    """Thresholding with a warm start basis matches thresholding with a full SVD."""
+    rng = np.random.default_rng(seed=0)
+    matrix = rng.random((60, 5)) @ rng.random((5, 200))
+    matrix += 0.01 * rng.standard_normal(matrix.shape)
+    expected, basis = pudl.analysis.timeseries_cleaning._svt_tnn(matrix, 1, theta=2)
+    assert basis.shape == (60, 13)
+    result, _ = pudl.analysis.timeseries_cleaning._svt_tnn(
+        matrix, 1, theta=2, basis=basis
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-10)
+    # A random basis converges to the same result, just less precisely
+    random_basis = np.linalg.qr(rng.standard_normal((60, 13)))[0]
+    result, _ = pudl.analysis.timeseries_cleaning._svt_tnn(
+        matrix, 1, theta=2, basis=random_basis
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-2)
+
+
+def test_impute_blocks_in_parallel() -> None:
+    """Imputing blocks in worker processes gives the same result as in series."""
+    x = simulate_series(seed=16662093832)
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    mask = s.simulate_nulls()
+    kwargs = {"mask": mask, "blocks": 2, "method": "tnn", "rho0": 1, "maxiter": 5}
+    np.testing.assert_allclose(
+        s.impute(workers=2, **kwargs), s.impute(workers=1, **kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    "imputer",
+    [
+        pudl.analysis.timeseries_cleaning.impute_latc_tnn,
+        pudl.analysis.timeseries_cleaning.impute_latc_tubal,
+    ],
+)
+def test_impute_stops_when_imputed_values_stall(imputer) -> None:
+    """With a large enough `min_delta`, imputation stops after `patience` iterations."""
+    x = simulate_series(seed=7088438834)
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    tensor = s.fold_tensor(np.where(s.simulate_nulls(), np.nan, x))
+    expected = imputer(tensor, rho0=1, maxiter=3)
+    result = imputer(tensor, rho0=1, maxiter=100, min_delta=np.inf, patience=3)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    "imputer",
+    [
+        pudl.analysis.timeseries_cleaning.impute_latc_tnn,
+        pudl.analysis.timeseries_cleaning.impute_latc_tubal,
+    ],
+)
+def test_warm_started_imputation_is_reproducible(imputer, mocker) -> None:
+    """Imputation is seeded, including when the singular vectors are warm started."""
+    x = simulate_series(n=60, periods=60, seed=5150844305)
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    tensor = s.fold_tensor(np.where(s.simulate_nulls(), np.nan, x))
+    left_singular = mocker.spy(pudl.analysis.timeseries_cleaning, "_left_singular")
+    # Without a convergence criterion, every iteration after the first is warm started
+    expected = imputer(tensor, rho0=1, epsilon=0, maxiter=5)
+    assert any(call.kwargs["basis"] is not None for call in left_singular.mock_calls)
+    np.testing.assert_array_equal(
+        imputer(tensor, rho0=1, epsilon=0, maxiter=5), expected
+    )
+
+
+def test_rolling_statistics_are_cached_until_flagged(mocker) -> None:
+    """Rolling statistics are cached on each instance and cleared by new flags."""
+    rolling_median = mocker.spy(
+        pudl.analysis.timeseries_cleaning.rolling_window, "rolling_median"
+    )
+    s = pudl.analysis.timeseries_cleaning.Timeseries(simulate_series(seed=0))
+    other = pudl.analysis.timeseries_cleaning.Timeseries(simulate_series(seed=1))
+    assert s.rolling_median(window=48) is s.rolling_median(window=48)
+    other.rolling_median(window=48)
+    s.rolling_median(window=48)
+    assert rolling_median.call_count == 2
+    s.flag(s.x > 2.5, "HIGH")
+    s.rolling_median(window=48)
+    assert rolling_median.call_count == 3
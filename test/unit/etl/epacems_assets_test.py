@@ -0,0 +1,67 @@
+"""Unit tests for pudl.etl.epacems_assets module."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pudl.etl.epacems_assets import write_year_state_row_groups
+
+SCHEMA = pa.schema(
+    [
+        ("state", pa.dictionary(pa.int32(), pa.string())),
+        ("plant_id_eia", pa.int32()),
+    ]
+)
+
+
+@pytest.fixture
+def quarterly_partitions(tmp_path):
+    """Two quarters with states interleaved across several row groups."""
+    paths = []
+    for quarter, states in enumerate([["CO", "AL", "CO", "TX"], ["TX", "AL", "AL"]]):
+        path = tmp_path / f"epacems-2022q{quarter + 1}.parquet"
+        table = pa.table(
+            {
+                "state": pa.array(states).dictionary_encode(),
+                "plant_id_eia": pa.array(
+                    [10 * quarter + i for i in range(len(states))], pa.int32()
+                ),
+            },
+            schema=SCHEMA,
+        )
+        pq.write_table(table, path, row_group_size=2)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_buffer_bytes", [2**30, 0])
+def test_write_year_state_row_groups(tmp_path, quarterly_partitions, max_buffer_bytes):
+    """Each state's rows end up in their own row group, in partition order.
+
+    The states are written in alphabetical order.
+    """
+    output_path = tmp_path / "monolithic.parquet"
+    with pq.ParquetWriter(output_path, SCHEMA) as writer:
+        write_year_state_row_groups(
+            writer,
+            quarterly_partitions,
+            SCHEMA,
+            max_buffer_bytes=max_buffer_bytes,
+            spill_dir=tmp_path,
+        )
+
+    parquet_file = pq.ParquetFile(output_path)
+    row_groups = {}
+    for i in range(parquet_file.num_row_groups):
+        row_group = parquet_file.read_row_group(i).to_pydict()
+        if row_group["state"]:
+            assert len(set(row_group["state"])) == 1
+            row_groups[row_group["state"][0]] = row_group["plant_id_eia"]
+    assert row_groups == {"AL": [1, 11, 12], "CO": [0, 2], "TX": [3, 10]}
+    assert list(row_groups) == ["AL", "CO", "TX"]
+    # Spill files are cleaned up once the year has been written.
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "epacems-2022q1.parquet",
+        "epacems-2022q2.parquet",
+        "monolithic.parquet",
+    ]
@@ -0,0 +1,251 @@
+"""Unit tests for the pudl.extract.dbf module."""
+
+import datetime
+import io
+import struct
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from dbfread import DBF
+
+from pudl.extract.dbf import (
+    FercDbfExtractor,
+    FercFieldParser,
+    PartitionedDataFrame,
+    SQLiteTableWriter,
+    dbf_to_dataframe,
+    deduplicate_by_year,
+)
+
+# name, type, length, decimal count, nullable
+FIELDS = [
+    ("RESPONDENT", "N", 5, 0, False),
+    ("NAME", "C", 12, 0, False),
+    ("AMOUNT", "N", 12, 2, True),
+    ("REPORT_DT", "D", 8, 0, True),
+    ("IS_FINAL", "L", 1, 0, False),
+    ("ROW_NUMBER", "I", 4, 0, False),
+    ("_NullFlags", "0", 1, 0, False),
+]
+
+
+def _encode_record(record: dict, deleted: bool = False) -> bytes:
+    """Encode a record of raw field values, setting null flags for None values."""
+    null_flags = 0
+    nullable = [name for name, *_, is_nullable in FIELDS if is_nullable]
+    data = b"*" if deleted else b" "
+    for name, field_type, length, _, _ in FIELDS:
+        value = record.get(name)
+        if name == "_NullFlags":
+            data += bytes([null_flags])
+        elif field_type == "I":
+            data += struct.pack("<i", value)
+        elif value is None:
+            null_flags |= 1 << nullable.index(name)
+            data += b" " * length
+        else:
+            data += value.rjust(length) if field_type == "N" else value.ljust(length)
+    return data
+
+
+def _make_dbf(records: list[bytes], trailer: bytes = b"\x1a") -> DBF:
+    """Build an in memory Visual FoxPro table like those in the FERC archives."""
+    record_length = 1 + sum(length for _, _, length, _, _ in FIELDS)
+    header_length = 32 + 32 * len(FIELDS) + 1 + 263
+    header = struct.pack(
+        "<BBBBLHH20x", 0x30, 124, 1, 1, len(records), header_length, record_length
+    )
+    for name, field_type, length, decimal_count, nullable in FIELDS:
+        header += struct.pack(
+            "<11scLBBH12x",
+            name.encode(),
+            field_type.encode(),
+            0,
+            length,
+            decimal_count,
+            0x02 if nullable else 0x00,
+        )
+    header += b"\r" + b"\x00" * 263
+    return DBF(
+        "test.dbf",
+        encoding="latin1",
+        parserclass=FercFieldParser,
+        ignore_missing_memofile=True,
+        filedata=io.BytesIO(header + b"".join(records) + trailer),
+    )
+
+
+RECORDS = [
+    {
+        "RESPONDENT": b"1",
+        "NAME": b"Utility A",
+        "AMOUNT": b"1234.56",
+        "REPORT_DT": b"20200131",
+        "IS_FINAL": b"T",
+        "ROW_NUMBER": 1,
+    },
+    {
+        "RESPONDENT": b"0002",
+        "NAME": b"Utility B\x00\x00",
+        "AMOUNT": b".",
+        "REPORT_DT": b"20201231",
+        "IS_FINAL": b"F",
+        "ROW_NUMBER": -2,
+    },
+    {
+        "RESPONDENT": b"1",
+        "NAME": b"Utility A",
+        "AMOUNT": b"-7.50*",
+        "REPORT_DT": b"        ",
+        "IS_FINAL": b"?",
+        "ROW_NUMBER": 3,
+    },
+]
+
+
+def test_dbf_to_dataframe_matches_dbfread():
+    """Decoding columns gives the same values and dtypes as dbfread's records."""
+    dbf = _make_dbf([_encode_record(r) for r in RECORDS])
+    pd.testing.assert_frame_equal(dbf_to_dataframe(dbf), pd.DataFrame(iter(dbf)))
+
+
+@pytest.mark.parametrize("trailer", [b"\x1a", b"", b"\x1a garbage"])
+def test_dbf_to_dataframe_skips_deleted_records(trailer):
+    """Deleted records and anything after the end of file marker are skipped."""
+    dbf = _make_dbf(
+        [_encode_record(RECORDS[0]), _encode_record(RECORDS[1], deleted=True)],
+        trailer=trailer,
+    )
+    df = dbf_to_dataframe(dbf)
+    pd.testing.assert_frame_equal(df, pd.DataFrame(iter(dbf)))
+    assert df.ROW_NUMBER.tolist() == [1]
+
+
+def test_dbf_to_dataframe_null_flags():
+    """Fields flagged as null in _NullFlags are decoded as nulls."""
+    dbf = _make_dbf(
+        [
+            _encode_record(RECORDS[0] | {"AMOUNT": None}),
+            _encode_record(RECORDS[1] | {"REPORT_DT": None}),
+        ]
+    )
+    df = dbf_to_dataframe(dbf)
+    assert df.AMOUNT.isna().tolist() == [True, False]
+    assert df.REPORT_DT.tolist() == [datetime.date(2020, 1, 31), None]
+    assert df.NAME.tolist() == ["Utility A", "Utility B"]
+
+
+def test_dbf_to_dataframe_empty_table():
+    """A table with no active records gives an empty dataframe."""
+    dbf = _make_dbf([_encode_record(RECORDS[0], deleted=True)])
+    assert dbf_to_dataframe(dbf).empty
+
+
+class FakeDbfReader:
+    """A picklable DBF reader with one table, read from a zip archive for each year.
+
+    Like :class:`pudl.extract.dbf.FercDbfReader`, it caches the archives it opens.
+    """
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = archive_dir
+
+    def get_dataset(self) -> str:
+        return "ferc1"
+
+    def get_table_names(self) -> list[str]:
+        return ["f1_respondent_id", "f1_empty"]
+
+    @lru_cache  # noqa: B019
+    def get_archive(self, year: int, **filters) -> zipfile.ZipFile:
+        return zipfile.ZipFile(self.archive_dir / f"{year}.zip")
+
+    def load_table_dfs(self, table_name, partitions) -> list[PartitionedDataFrame]:
+        if table_name == "f1_empty":
+            return []
+        return [
+            PartitionedDataFrame(
+                pd.read_csv(self.get_archive(**p).open(f"{table_name}.csv")), p
+            )
+            for p in partitions
+        ]
+
+
+class FakeDbfExtractor(FercDbfExtractor):
+    DATABASE_NAME = "ferc1_dbf.sqlite"
+    DATASET = "ferc1"
+
+    def get_settings(self, global_settings):
+        return global_settings
+
+    def get_dbf_reader(self, datastore):
+        return FakeDbfReader(archive_dir=datastore.archive_dir)
+
+    def aggregate_table_frames(self, table_name, dfs):
+        if table_name == "f1_respondent_id":
+            return deduplicate_by_year(dfs, "respondent_id")
+        return super().aggregate_table_frames(table_name, dfs)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_table_data(tmp_path, workers):
+    """Tables are loaded from all partitions and deduplicated before being written."""
+    for year in [2019, 2020, 2021]:
+        with zipfile.ZipFile(tmp_path / f"{year}.zip", "w") as archive:
+            archive.writestr(
+                "f1_respondent_id.csv", f"respondent_id,name\n1,a{year}\n2,b"
+            )
+    datastore = MagicMock(archive_dir=tmp_path)
+    descriptor = datastore.get_datapackage_descriptor.return_value
+    descriptor.get_partition_filters.return_value = [
+        {"year": 2019},
+        {"year": 2020},
+        {"year": 2021},
+    ]
+    extractor = FakeDbfExtractor(
+        datastore=datastore,
+        settings=SimpleNamespace(years=[2019, 2020]),
+        output_path=tmp_path,
+        workers=workers,
+    )
+    sa.Table(
+        "f1_respondent_id",
+        extractor.sqlite_meta,
+        sa.Column("respondent_id", sa.Integer),
+        sa.Column("name", sa.String),
+    )
+    extractor.sqlite_meta.create_all(extractor.sqlite_engine)
+    # Like create_sqlite_tables, open one of the archives in this process first.
+    extractor.dbf_reader.get_archive(year=2020).namelist()
+    extractor.load_table_data()
+
+    df = pd.read_sql_table("f1_respondent_id", extractor.sqlite_engine)
+    assert df.sort_values("respondent_id").name.tolist() == ["a2020", "b"]
+    # The workers must not download archives concurrently, so they're cached first.
+    if workers > 1:
+        assert datastore.prefetch.call_args_list == [
+            call(["ferc1"], year="2019"),
+            call(["ferc1"], year="2020"),
+        ]
+
+
+def test_sqlite_table_writer(tmp_path):
+    """Tables are appended in the writer thread, and write errors are re-raised."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.sqlite'}")
+    with SQLiteTableWriter(engine) as writer:
+        writer.write("test", pd.DataFrame({"a": [1, 2]}), dtype={})
+        writer.write("test", pd.DataFrame({"a": [3]}), dtype={})
+    assert pd.read_sql_table("test", engine).a.tolist() == [1, 2, 3]
+
+    with (
+        pytest.raises(sa.exc.OperationalError, match="no column named b"),
+        SQLiteTableWriter(engine) as writer,
+    ):
+        writer.write("test", pd.DataFrame({"b": [4]}), dtype={})
+    assert pd.read_sql_table("test", engine).a.tolist() == [1, 2, 3]
@@ -114,3 +114,31 @@ def test__extract(test_file_bytes):
     pd.testing.assert_index_equal(
         actual_timeseries.columns, expected_timeseries_columns
     )
+
+
+def test__parse_data_column_date_formats():
+    """Monthly, quarterly and annual dates are parsed in the same dataframe."""
+    input_ = pd.DataFrame(
+        {
+            "series_id": ["ELEC.COST_BTU.M", "ELEC.COST_BTU.Q", "ELEC.COST_BTU.A"],
+            "data": [
+                [["202112", 1.0], ["202001", 2.0]],
+                [["2021Q4", 3.0], ["2020Q1", None]],
+                [["2021", 5.0]],
+            ],
+        }
+    )
+    actual = bulk._parse_data_column(input_)
+    assert actual.series_id.tolist() == ["ELEC.COST_BTU.M"] * 2 + [
+        "ELEC.COST_BTU.Q"
+    ] * 2 + ["ELEC.COST_BTU.A"]
+    pd.testing.assert_series_equal(
+        actual.date,
+        pd.Series(
+            pd.to_datetime(
+                ["2021-12-01", "2020-01-01", "2021-10-01", "2020-01-01", "2021-01-01"]
+            ),
+            name="date",
+        ),
+    )
+    assert actual.value.isna().tolist() == [False, False, False, True, False]
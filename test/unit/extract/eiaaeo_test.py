@@ -0,0 +1,128 @@
+"""Tests for extracting tables from the EIA AEO taxonomy."""
+
+import json
+from io import BytesIO
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from pudl.extract.eiaaeo import (
+    AEO_TAXONOMY_CACHE_VERSION,
+    AEOTaxonomy,
+    load_taxonomy,
+)
+
+
+def _category(category_id, parent_category_id, name, childseries=()):
+    return {
+        "category_id": category_id,
+        "parent_category_id": parent_category_id,
+        "name": name,
+        "notes": "",
+        "childseries": list(childseries),
+    }
+
+
+def _series(series_id, data):
+    return {
+        "series_id": series_id,
+        "name": f"Electricity : {series_id}",
+        "last_updated": "2023-03-16T13:23:49-04:00",
+        "units": "billion kWh",
+        "data": data,
+    }
+
+
+@pytest.fixture()
+def aeo_records() -> list[str]:
+    """Two cases, with tables repeated under each subject of the reference case."""
+    table_54 = "Table 54.  Electric Power Projections, Region A"
+    records = [
+        _category(1, 0, "Reference case"),
+        _category(2, 0, "High Oil Price"),
+        _category(11, 1, "Energy Prices"),
+        _category(12, 1, "Electricity"),
+        _category(21, 2, "Electricity"),
+        _category(111, 11, table_54, ["REF.54"]),
+        _category(121, 12, table_54, ["REF.54"]),
+        _category(122, 12, "Table 13.  Natural Gas", ["REF.13", "REF.54"]),
+        _category(211, 21, table_54, ["HOP.54"]),
+        _series("REF.54", [["2050", 1.5], ["2049", "NA"]]),
+        _series("REF.13", [["2050", 2.0]]),
+        _series("HOP.54", [["2050", 3.0]]),
+    ]
+    return [json.dumps(record) for record in records]
+
+
+def test_get_table(aeo_records):
+    """Series are found by table number, with the names of their cases and tables."""
+    taxonomy = AEOTaxonomy(aeo_records)
+    actual = (
+        taxonomy.get_table(54)
+        .sort_values(["series_name", "projection_year"])
+        .reset_index(drop=True)
+    )
+    expected = pd.DataFrame(
+        {
+            "projection_year": [2050, 2049, 2050],
+            "value": ["3.0", "NA", "1.5"],
+            "units": "billion kWh",
+            "series_name": [
+                "Electricity : HOP.54",
+                "Electricity : REF.54",
+                "Electricity : REF.54",
+            ],
+            "category_name": "Table 54.  Electric Power Projections, Region A",
+            "model_case_eiaaeo": ["High Oil Price", "Reference case", "Reference case"],
+        }
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+    table_13 = taxonomy.get_table(13)
+    assert set(table_13.series_name) == {"Electricity : REF.13", "Electricity : REF.54"}
+    assert set(table_13.category_name) == {"Table 13.  Natural Gas"}
+    assert table_13.shape == (3, 6)
+
+
+def test_load_taxonomy_is_cached_by_checksum(mocker, tmp_path, aeo_records):
+    """The parsed taxonomy is reused until the AEO archive changes."""
+    archive = BytesIO()
+    with ZipFile(archive, mode="w") as zf:
+        zf.writestr("AEO2023.txt", "\n".join(aeo_records))
+    datastore_mock = mocker.MagicMock()
+    datastore_mock.get_zipfile_resource.side_effect = lambda *args, **kwargs: ZipFile(
+        archive
+    )
+    datastore_mock.get_unique_resource_checksum.return_value = "abc"
+
+    parsed = load_taxonomy(datastore_mock, 2023, cache_dir=tmp_path)
+    cached = load_taxonomy(datastore_mock, 2023, cache_dir=tmp_path)
+    assert datastore_mock.get_zipfile_resource.call_count == 1
+    datastore_mock.get_unique_resource_checksum.assert_called_with("eiaaeo", year=2023)
+    pd.testing.assert_frame_equal(cached.get_table(54), parsed.get_table(54))
+
+    datastore_mock.get_unique_resource_checksum.return_value = "def"
+    load_taxonomy(datastore_mock, 2023, cache_dir=tmp_path)
+    assert datastore_mock.get_zipfile_resource.call_count == 2
+    load_taxonomy(datastore_mock, 2023)
+    assert datastore_mock.get_zipfile_resource.call_count == 3
+
+
+def test_load_taxonomy_reparses_broken_cache(mocker, tmp_path, aeo_records):
+    """A cached taxonomy that can't be loaded is parsed again and overwritten."""
+    archive = BytesIO()
+    with ZipFile(archive, mode="w") as zf:
+        zf.writestr("AEO2023.txt", "\n".join(aeo_records))
+    datastore_mock = mocker.MagicMock()
+    datastore_mock.get_zipfile_resource.side_effect = lambda *args, **kwargs: ZipFile(
+        archive
+    )
+    datastore_mock.get_unique_resource_checksum.return_value = "abc"
+    cache_path = tmp_path / f"aeo2023_taxonomy_v{AEO_TAXONOMY_CACHE_VERSION}_abc.pkl"
+    cache_path.write_bytes(b"not a pickle")
+
+    parsed = load_taxonomy(datastore_mock, 2023, cache_dir=tmp_path)
+    cached = load_taxonomy(datastore_mock, 2023, cache_dir=tmp_path)
+    assert datastore_mock.get_zipfile_resource.call_count == 1
+    assert [p.name for p in tmp_path.iterdir()] == [cache_path.name]
+    pd.testing.assert_frame_equal(cached.get_table(54), parsed.get_table(54))
@@ -0,0 +1,83 @@
+"""Unit tests for pudl.extract.epacems module."""
+
+import io
+import zipfile
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pudl.extract.epacems import _concat_batches, extract_batches
+
+CSV = """State,Facility Name,Facility ID,Unit ID,Associated Stacks,Date,Hour,Gross Load (MW),SO2 Mass Measure Indicator,Program Code
+AL,Barry,3,1,,2022-01-01,0,100.5,Measured,ARP
+AL,Barry,3,1,,2022-01-01,1,,Calculated,ARP
+AL,Barry,3,01A,CS001,2022-01-01,2,98.0,,ARP
+"""
+
+
+def _fake_datastore() -> MagicMock:
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.writestr("epacems-2022q1.csv", CSV)
+    ds = MagicMock()
+    ds.get_zipfile_resource.side_effect = lambda *args, **kwargs: zipfile.ZipFile(
+        zip_buffer
+    )
+    return ds
+
+
+def test_extract_batches():
+    """Batches are renamed, typed, and stripped of ignored columns as they're parsed."""
+    df = pd.concat(
+        extract_batches(year_quarter="2022q1", ds=_fake_datastore()),
+        ignore_index=True,
+    )
+    assert list(df.columns) == [
+        "state",
+        "plant_id_epa",
+        "emissions_unit_id_epa",
+        "associated_stacks",
+        "op_date",
+        "op_hour",
+        "gross_load_mw",
+        "so2_mass_measurement_code",
+        "year",
+    ]
+    assert df.plant_id_epa.dtype == pd.Int32Dtype()
+    assert df.gross_load_mw.dtype == pd.Float32Dtype()
+    assert df.emissions_unit_id_epa.tolist() == ["1", "1", "01A"]
+    assert df.op_date.tolist() == ["2022-01-01"] * 3
+    assert df.gross_load_mw.isna().tolist() == [False, True, False]
+    assert df.so2_mass_measurement_code.isna().tolist() == [False, False, True]
+    assert (df.year == 2022).all()
+
+
+def test_extract_batches_missing_quarter():
+    """No batches are yielded if the quarter isn't in the archive."""
+    ds = _fake_datastore()
+    ds.get_zipfile_resource.side_effect = KeyError("epacems-2022q1.csv")
+    assert list(extract_batches(year_quarter="2022q1", ds=ds)) == []
+
+
+def test_concat_batches_combines_categories():
+    """Categorical columns stay categorical when batches have different categories."""
+    df = _concat_batches(
+        [
+            pd.DataFrame({"state": pd.Categorical(["AL"]), "hour": [0]}),
+            pd.DataFrame({"state": pd.Categorical(["WY", None]), "hour": [1, 2]}),
+        ]
+    )
+    assert df.state.dtype == pd.CategoricalDtype(["AL", "WY"])
+    assert df.state[:2].tolist() == ["AL", "WY"]
+    assert df.state.isna().tolist() == [False, False, True]
+
+
+def test_extract_batches_errors_after_lookup_are_raised(mocker):
+    """Only a missing archive is treated as a missing quarter."""
+    mocker.patch(
+        "pudl.extract.epacems.EpaCemsDatastore._csv_to_dataframes",
+        side_effect=KeyError("not a missing quarter"),
+    )
+    with pytest.raises(KeyError, match="not a missing quarter"):
+        list(extract_batches(year_quarter="2022q1", ds=_fake_datastore()))
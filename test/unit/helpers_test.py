@@ -281,6 +281,28 @@ def test_same_temporal_gran():
     assert_frame_equal(out, out_expected)
 
 
+def test_date_on_order():
+    """Outer merges are sorted by date, whatever the order of ``date_on``."""
+    out = date_merge(
+        left=MONTHLY_GEN_FUEL.copy(),
+        right=MONTHLY_OTHER.copy(),
+        on=["plant_id_eia"],
+        date_on=["month", "year"],
+        how="outer",
+    )
+    assert out.report_date.is_monotonic_increasing
+    assert_frame_equal(
+        out,
+        date_merge(
+            left=MONTHLY_GEN_FUEL.copy(),
+            right=MONTHLY_OTHER.copy(),
+            on=["plant_id_eia"],
+            date_on=["year", "month"],
+            how="outer",
+        ),
+    )
+
+
 def test_end_of_report_period():
     """Test merging tables repeated at the end of the report period."""
     eoy_plants_util = ANNUAL_PLANTS_UTIL.copy()
@@ -351,6 +373,46 @@ def test_less_granular_merge():
     assert_frame_equal(out, out_expected)
 
 
+@pytest.mark.filterwarnings("error::FutureWarning")
+@pytest.mark.parametrize("how", ["inner", "outer", "left", "right"])
+def test_date_merge_matches_merge_on_date_parts(how):
+    """Merging on period codes is the same as merging on the parts of the dates."""
+    monthly = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(
+                ["2019-02-01", "2019-03-01", "2020-10-01", None, "2021-01-01"]
+            ),
+            "plant_id_eia": pd.array([1, 1, 1, 2, 3], dtype="Int64"),
+            "capacity_mw": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "operational_status": ["a", "b", "c", "d", "e"],
+        }
+    )
+    annual = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(
+                ["2019-01-01", "2020-01-01", None, "2018-01-01"]
+            ),
+            "plant_id_eia": pd.array([1, 1, 2, 3], dtype="Int64"),
+            "capacity_mw": [10.0, 20.0, 30.0, 40.0],
+            "retired": [True, False, True, False],
+        }
+    )
+    expected = pd.merge(
+        monthly.assign(year=monthly.report_date.dt.year),
+        annual.assign(year=annual.report_date.dt.year),
+        on=["year", "plant_id_eia"],
+        how=how,
+        indicator=True,
+    )
+    expected.insert(
+        0, "report_date", expected[["report_date_x", "report_date_y"]].max(axis=1)
+    )
+    expected = expected.drop(columns=["report_date_x", "report_date_y", "year"])
+
+    out = date_merge(monthly, annual, on=["plant_id_eia"], how=how, indicator=True)
+    assert_frame_equal(out, expected)
+
+
 def test_timeseries_fillin(test_dir):
     """Test filling in tables to a full timeseries."""
     input_df = pd.DataFrame(
@@ -0,0 +1,63 @@
+"""Check that importing PUDL stays fast by not importing things it doesn't need."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Geopandas isn't included because pandera imports it when it's installed.
+HEAVY_MODULES = ["dagster", "mlflow", "sklearn", "splink"]
+
+
+def import_times(statement: str) -> dict[str, float]:
+    """Cumulative import time in seconds of every module imported by ``statement``.
+
+    Runs the statement in a fresh interpreter with ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", statement],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative_us) / 1e6
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement,lazy_modules",
+    [
+        ("import pudl", ["pudl.analysis", "pudl.etl", "pudl.metadata"]),
+        ("import pudl.metadata", ["pudl.analysis", "pudl.etl", "pudl.transform"]),
+        ("import pudl.analysis.timeseries_cleaning", ["pudl.analysis.mcoe"]),
+    ],
+)
+def test_import_is_lazy(statement: str, lazy_modules: list[str]):
+    """Importing a module doesn't import unrelated subpackages or heavy dependencies."""
+    imported = import_times(statement)
+    assert not [
+        module
+        for module in imported
+        if module.split(".")[0] in HEAVY_MODULES or module in lazy_modules
+    ]
+
+
+def test_pudl_package_built_on_first_use():
+    """PUDL_PACKAGE isn't built at import time, and is the same object once built."""
+    statement = (
+        "import pudl.etl\n"
+        "import pudl.metadata.classes as classes\n"
+        "assert classes.Package.from_resource_ids.cache_info().currsize == 0\n"
+        "from pudl.metadata import PUDL_PACKAGE\n"
+        "assert PUDL_PACKAGE is classes.PUDL_PACKAGE\n"
+        "assert classes.Package.from_resource_ids.cache_info().currsize == 1\n"
+    )
+    subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", statement],  # noqa: S603
+        check=True,
+    )
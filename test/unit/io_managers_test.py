@@ -2,6 +2,9 @@
 
 import datetime
 import json
+import os
+import shutil
+import sqlite3
 from pathlib import Path
 
 import alembic.config
@@ -20,6 +23,7 @@ from pudl.etl.check_foreign_keys import (
 )
 from pudl.io_managers import (
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
 )
@@ -228,6 +232,65 @@ def test_missing_schema_error(sqlite_io_manager_fixture):
         manager.handle_output(output_context, venue)
 
 
+@pytest.fixture
+def bulk_sqlite_io_manager_fixture(tmp_path, test_pkg):
+    """Create a SQLiteIOManager fixture that uses the bulk load fast path."""
+    md = test_pkg.to_sql()
+    return SQLiteIOManager(base_dir=tmp_path, db_name="bulk", md=md, bulk_load=True)
+
+
+def test_bulk_load_matches_to_sql(
+    sqlite_io_manager_fixture, bulk_sqlite_io_manager_fixture
+):
+    """Bulk loading should write exactly the same records as DataFrame.to_sql()."""
+    track = pd.DataFrame(
+        {
+            "trackid": pd.array([1, 2, 3], dtype="Int64"),
+            "trackname": ["FERC Ya!", "Cxtxlyst", "Co-op Mop"],
+            "trackartist": pd.array([1, pd.NA, 2], dtype="Int64"),
+        }
+    )
+    output_context = build_output_context(asset_key=AssetKey("track"))
+    input_context = build_input_context(asset_key=AssetKey("track"))
+    sqlite_io_manager_fixture.handle_output(output_context, track)
+    bulk_sqlite_io_manager_fixture.handle_output(output_context, track)
+    # Writing twice should replace the records, not append to them.
+    bulk_sqlite_io_manager_fixture.handle_output(output_context, track)
+
+    pd.testing.assert_frame_equal(
+        sqlite_io_manager_fixture.load_input(input_context),
+        bulk_sqlite_io_manager_fixture.load_input(input_context),
+    )
+
+
+def test_bulk_load_restores_pragmas(bulk_sqlite_io_manager_fixture):
+    """Durability settings are restored after a bulk load, even if it fails."""
+    manager = bulk_sqlite_io_manager_fixture
+    with manager.engine.connect() as con:
+        before = {
+            pragma: con.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            for pragma in ["journal_mode", "synchronous"]
+        }
+    output_context = build_output_context(asset_key=AssetKey("artist"))
+    manager.handle_output(
+        output_context, pd.DataFrame({"artistid": [1], "artistname": ["Co-op Mop"]})
+    )
+    with pytest.raises(IntegrityError):
+        manager.handle_output(
+            output_context,
+            pd.DataFrame({"artistid": [1, 1], "artistname": ["Co-op Mop", "Cxtxlyst"]}),
+        )
+    with manager.engine.connect() as con:
+        after = {
+            pragma: con.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+            for pragma in before
+        }
+    assert before == after
+    # The failed load was rolled back, leaving the original record in place.
+    returned_df = manager.load_input(build_input_context(asset_key=AssetKey("artist")))
+    assert returned_df.artistname.tolist() == ["Co-op Mop"]
+
+
 @pytest.fixture
 def fake_pudl_sqlite_io_manager_fixture(tmp_path, test_pkg, monkeypatch):
     """Create a SQLiteIOManager fixture with a fake database schema."""
@@ -306,6 +369,24 @@ def test_empty_read_fails(fake_pudl_sqlite_io_manager_fixture):
         fake_pudl_sqlite_io_manager_fixture.load_input(context)
 
 
+def test_missing_table_read_fails(fake_pudl_sqlite_io_manager_fixture):
+    """Reading a table that is in the metadata but not the database fails."""
+    context = build_input_context(asset_key=AssetKey("artist_view"))
+    with pytest.raises(ValueError, match="artist_view not found"):
+        fake_pudl_sqlite_io_manager_fixture.load_input(context)
+
+
+def test_other_sqlite_errors_are_raised(fake_pudl_sqlite_io_manager_fixture, mocker):
+    """SQLite errors other than a missing table are not reported as missing tables."""
+    mocker.patch(
+        "pudl.io_managers.read_sqlite_table_to_arrow",
+        side_effect=sqlite3.OperationalError("database is locked"),
+    )
+    context = build_input_context(asset_key=AssetKey("artist"))
+    with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+        fake_pudl_sqlite_io_manager_fixture.load_input(context)
+
+
 def test_replace_on_insert(fake_pudl_sqlite_io_manager_fixture):
     """Tests that two runs of the same asset overwrite existing contents."""
     artist_df = pd.DataFrame({"artistid": [1], "artistname": ["Co-op Mop"]})
@@ -326,6 +407,119 @@ def test_replace_on_insert(fake_pudl_sqlite_io_manager_fixture):
     pd.testing.assert_frame_equal(new_artist_df, read_df, check_dtype=False)
 
 
+def test_pudl_sqlite_io_manager_column_projection(fake_pudl_sqlite_io_manager_fixture):
+    """Inputs can ask for a subset of columns via their metadata."""
+    manager = fake_pudl_sqlite_io_manager_fixture
+    track_df = pd.DataFrame(
+        {
+            "trackid": [1, 2],
+            "trackname": ["FERC Ya!", "Cxtxlyst"],
+            "trackartist": [1, 1],
+        }
+    )
+    manager.handle_output(build_output_context(asset_key=AssetKey("track")), track_df)
+
+    input_context = build_input_context(
+        asset_key=AssetKey("track"), metadata={"columns": ["trackname", "trackid"]}
+    )
+    read_df = manager.load_input(input_context).sort_values("trackid")
+    assert list(read_df.columns) == ["trackname", "trackid"]
+    assert read_df.trackid.dtype == "Int64"
+    assert read_df.trackname.tolist() == ["FERC Ya!", "Cxtxlyst"]
+
+    input_context = build_input_context(
+        asset_key=AssetKey("track"), metadata={"columns": ["trackvenue"]}
+    )
+    with pytest.raises(ValueError):
+        manager.load_input(input_context)
+
+
+def test_pudl_sqlite_io_manager_filters(tmp_path):
+    """Inputs can select report dates and years when reading from SQLite too."""
+    fields = [
+        {"name": "plant_id", "type": "integer", "description": "plant_id"},
+        {"name": "report_date", "type": "date", "description": "report_date"},
+        {"name": "capacity_mw", "type": "number", "description": "capacity_mw"},
+    ]
+    schema = {"fields": fields, "primary_key": ["plant_id", "report_date"]}
+    plants = Resource(name="test_sqlite_plants", schema=schema, description="Plants")
+    package = Package(name="plants", resources=[plants])
+    package.to_sql().create_all(
+        sa.create_engine(f"sqlite:///{tmp_path / 'fake.sqlite'}")
+    )
+    manager = PudlSQLiteIOManager(base_dir=tmp_path, db_name="fake", package=package)
+    df = pd.DataFrame(
+        {
+            "plant_id": [1, 1, 1, 2],
+            "report_date": pd.to_datetime(
+                ["2020-01-01", "2021-01-01", "2022-01-01", "2021-01-01"]
+            ),
+            "capacity_mw": [10.0, 11.0, 12.0, 20.0],
+        }
+    )
+    manager.handle_output(build_output_context(asset_key=AssetKey(plants.name)), df)
+
+    input_context = build_input_context(
+        asset_key=AssetKey(plants.name),
+        metadata={"report_date": ("2021-01-01", "2022-06-30")},
+    )
+    read_df = manager.load_input(input_context).sort_values("capacity_mw")
+    assert read_df.capacity_mw.tolist() == [11.0, 12.0, 20.0]
+
+    input_context = build_input_context(
+        asset_key=AssetKey(plants.name),
+        metadata={"columns": ["capacity_mw"], "report_date": "2021-01-01"},
+    )
+    read_df = manager.load_input(input_context).sort_values("capacity_mw")
+    assert read_df.capacity_mw.tolist() == [11.0, 20.0]
+
+    # Filters that match no rows give an empty dataframe, like the Parquet reads do.
+    input_context = build_input_context(
+        asset_key=AssetKey(plants.name), metadata={"report_date": "2019-01-01"}
+    )
+    assert manager.load_input(input_context).empty
+
+
+def test_parquet_io_manager_pushdown(mocker):
+    """Parquet outputs are sorted, and inputs can select columns and report years."""
+    fields = [
+        {"name": "plant_id", "type": "integer", "description": "plant_id"},
+        {"name": "report_year", "type": "integer", "description": "report_year"},
+        {"name": "capacity_mw", "type": "number", "description": "capacity_mw"},
+    ]
+    schema = {"fields": fields, "primary_key": ["plant_id", "report_year"]}
+    plants = Resource(name="test_parquet_plants", schema=schema, description="Plants")
+    mocker.patch("pudl.io_managers.Resource.from_id", return_value=plants)
+
+    df = pd.DataFrame(
+        {
+            "plant_id": [2, 1, 2, 1, 3],
+            "report_year": [2021, 2021, 2020, 2020, 2022],
+            "capacity_mw": [20.0, 10.0, 21.0, 11.0, 30.0],
+        }
+    )
+    manager = PudlParquetIOManager()
+    manager.handle_output(build_output_context(asset_key=AssetKey(plants.name)), df)
+
+    full_df = manager.load_input(build_input_context(asset_key=AssetKey(plants.name)))
+    assert full_df.report_year.tolist() == [2020, 2020, 2021, 2021, 2022]
+    assert full_df.plant_id.tolist() == [1, 2, 1, 2, 3]
+
+    input_context = build_input_context(
+        asset_key=AssetKey(plants.name),
+        metadata={"columns": ["plant_id", "capacity_mw"], "report_year": (2021, 2022)},
+    )
+    filtered_df = manager.load_input(input_context)
+    assert list(filtered_df.columns) == ["plant_id", "capacity_mw"]
+    assert filtered_df.capacity_mw.tolist() == [10.0, 20.0, 30.0]
+
+    input_context = build_input_context(
+        asset_key=AssetKey(plants.name), metadata={"report_date": "2021-01-01"}
+    )
+    with pytest.raises(ValueError):
+        manager.load_input(input_context)
+
+
 @pytest.mark.skip(reason="SQLAlchemy is not finding the view. Debug or remove.")
 def test_handling_view_with_metadata(fake_pudl_sqlite_io_manager_fixture):
     """Make sure an users can create and load views when it has metadata."""
@@ -458,6 +652,26 @@ def test_ferc_xbrl_sqlite_io_manager_dedupes(mocker, tmp_path):
     assert len(observed_table) == 1
     assert observed_table.str_factoid.to_numpy().item() == "updated 2021 EOY value"
 
+    # The deduplicated table is reused until the database changes
+    filter_for_freshest_data = mocker.spy(
+        FercXBRLSQLiteIOManager, "filter_for_freshest_data"
+    )
+    pd.testing.assert_frame_equal(io_manager.load_input(input_context), observed_table)
+    assert filter_for_freshest_data.call_count == 0
+    df.iloc[1:].to_sql("test_table_instant", conn, if_exists="replace")
+    observed_table = io_manager.load_input(input_context)
+    assert filter_for_freshest_data.call_count == 1
+    assert observed_table.str_factoid.to_numpy().item() == "updated 2021 EOY value"
+
+    # ... or is replaced by another file, even with the same modification time
+    mtime_ns = db_path.stat().st_mtime_ns
+    replacement_path = tmp_path / "replacement.sqlite"
+    shutil.copy(db_path, replacement_path)
+    os.utime(replacement_path, ns=(mtime_ns, mtime_ns))
+    replacement_path.replace(db_path)
+    io_manager.load_input(input_context)
+    assert filter_for_freshest_data.call_count == 2
+
 
 example_schema = pandera.DataFrameSchema(
     {
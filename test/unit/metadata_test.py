@@ -1,5 +1,6 @@
 """Tests for metadata not covered elsewhere."""
 
+import numpy as np
 import pandas as pd
 import pandera as pr
 import pytest
@@ -13,7 +14,13 @@ from pudl.metadata.classes import (
     Resource,
     SnakeCase,
 )
-from pudl.metadata.fields import FIELD_METADATA, apply_pudl_dtypes
+from pudl.metadata.constants import FIELD_DTYPES_PANDAS
+from pudl.metadata.fields import (
+    FIELD_METADATA,
+    FIELD_METADATA_BY_GROUP,
+    apply_pudl_dtypes,
+    get_pudl_dtypes,
+)
 from pudl.metadata.helpers import format_errors
 from pudl.metadata.resources import RESOURCE_METADATA
 from pudl.metadata.sources import SOURCES
@@ -62,6 +69,35 @@ def test_pyarrow_schemas(resource_name: str):
     _ = PUDL_RESOURCES[resource_name].to_pyarrow()
 
 
+@pytest.mark.parametrize(
+    "resource_name", ["core_epacems__hourly_emissions", "core_eia__entity_plants"]
+)
+def test_resource_from_id_cached(resource_name: str):
+    """Resources and their derived schemas are only built once per process."""
+    resource = Resource.from_id(resource_name)
+    assert Resource.from_id(resource_name) is resource
+    assert resource.to_pyarrow() is resource.to_pyarrow()
+    assert resource.to_sql() is resource.to_sql()
+    assert resource.schema.to_pandera() is resource.schema.to_pandera()
+    dtypes = resource.to_pandas_dtypes()
+    dtypes.clear()
+    assert resource.to_pandas_dtypes() != dtypes
+
+    uncached = Resource(**Resource.dict_from_id(resource_name))
+    assert resource.to_pyarrow().equals(uncached.to_pyarrow(), check_metadata=True)
+    assert resource.to_pandas_dtypes() == uncached.to_pandas_dtypes()
+    assert resource.to_sql().compare(uncached.to_sql())
+    assert resource.to_sql(check_values=False) is not resource.to_sql()
+
+
+def test_package_get_resource():
+    """Resources can be looked up by name, and unknown names raise a ValueError."""
+    resource = PUDL_PACKAGE.get_resource("core_eia__entity_plants")
+    assert resource is PUDL_RESOURCES["core_eia__entity_plants"]
+    with pytest.raises(ValueError):
+        PUDL_PACKAGE.get_resource("not_a_resource")
+
+
 @pytest.mark.parametrize("encoder_name", sorted(PUDL_ENCODERS.keys()))
 def test_encoders(encoder_name: SnakeCase):
     """Verify that Encoders work on the kinds of values they're supposed to."""
@@ -187,3 +223,110 @@ def test_resource_descriptors_can_encode_schemas(dummy_pandera_schema):
 def test_resource_descriptor_schema_failures(error_msg, data, dummy_pandera_schema):
     with pytest.raises(pr.errors.SchemaError, match=error_msg):
         dummy_pandera_schema.validate(data)
+
+
+@pytest.mark.parametrize("group", [None, "eia", "ferc1", "epacems"])
+def test_get_pudl_dtypes_cached(group):
+    """Cached dtypes match those compiled from copies of the field metadata."""
+    dtypes = get_pudl_dtypes(group=group)
+    assert get_pudl_dtypes(group=group) is dtypes
+    with pytest.raises(TypeError):
+        dtypes["plant_id_eia"] = "string"
+    assert dtypes == get_pudl_dtypes(
+        group=group,
+        field_meta=dict(FIELD_METADATA),
+        field_meta_by_group=dict(FIELD_METADATA_BY_GROUP),
+        dtype_map=dict(FIELD_DTYPES_PANDAS),
+    )
+
+
+def test_apply_pudl_dtypes_only_converts_changed_columns(mocker):
+    """Columns that already have the right type are copied, not converted."""
+    df = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array([1, 2], dtype="Int64"),
+            "state": ["CO", "IL"],
+            "not_a_pudl_field": [1.5, 2.5],
+        }
+    )
+    astype = mocker.spy(pd.DataFrame, "astype")
+    typed = apply_pudl_dtypes(df)
+    assert astype.call_args.args[1] == {"state": "string"}
+    assert typed.dtypes.to_dict() == {
+        "plant_id_eia": pd.Int64Dtype(),
+        "state": pd.StringDtype(),
+        "not_a_pudl_field": "float64",
+    }
+
+    unchanged = apply_pudl_dtypes(typed)
+    assert unchanged is not typed
+    pd.testing.assert_frame_equal(unchanged, typed)
+
+
+@pytest.fixture()
+def generators_resource() -> Resource:
+    fields = [
+        {"name": "plant_id", "type": "integer", "description": "plant_id"},
+        {"name": "generator_id", "type": "string", "description": "generator_id"},
+        {
+            "name": "status",
+            "type": "string",
+            "description": "status",
+            "constraints": {"enum": ["existing", "retired"]},
+        },
+        {"name": "capacity_mw", "type": "number", "description": "capacity_mw"},
+    ]
+    schema = {"fields": fields, "primary_key": ["plant_id", "generator_id"]}
+    return Resource(name="test_generators", schema=schema, description="Generators")
+
+
+def test_format_df_only_converts_changed_columns(generators_resource):
+    """Columns are reordered, added, dropped and cast, and only copied if asked."""
+    df = pd.DataFrame(
+        {
+            "not_a_field": [0, 1, 2],
+            "status": ["existing", "proposed", None],
+            "generator_id": pd.array(["1", "2", "1"], dtype="string"),
+            "plant_id": [1, 1, 2],
+        }
+    )
+    formatted = generators_resource.format_df(df)
+    assert formatted.dtypes.to_dict() == generators_resource.to_pandas_dtypes()
+    assert formatted.status.isna().tolist() == [False, True, True]
+    assert formatted.capacity_mw.isna().all()
+    assert not np.shares_memory(
+        formatted.generator_id.array._ndarray, df.generator_id.array._ndarray
+    )
+    formatted.loc[0, "generator_id"] = "3"
+    assert df.generator_id.tolist() == ["1", "2", "1"]
+
+    formatted = generators_resource.format_df(df, copy=False)
+    assert np.shares_memory(
+        formatted.generator_id.array._ndarray, df.generator_id.array._ndarray
+    )
+    pd.testing.assert_frame_equal(formatted, generators_resource.format_df(formatted))
+
+
+@pytest.mark.parametrize(
+    "plant_id,generator_id,error",
+    [
+        pytest.param([1, 1, 2], ["1", "2", "1"], None, id="unique"),
+        pytest.param([1, 1, 1], ["1", "2", "1"], "1/3 duplicate", id="duplicate"),
+        pytest.param([1, None, 2], ["1", "2", "1"], "Null values", id="null"),
+    ],
+)
+def test_enforce_schema_primary_key(generators_resource, plant_id, generator_id, error):
+    """Primary keys must be unique and non-null."""
+    df = pd.DataFrame(
+        {
+            "plant_id": pd.array(plant_id, dtype="Int64"),
+            "generator_id": generator_id,
+            "status": "existing",
+            "capacity_mw": 1.0,
+        }
+    )
+    if error is None:
+        assert len(generators_resource.enforce_schema(df)) == 3
+    else:
+        with pytest.raises(ValueError, match=error):
+            generators_resource.enforce_schema(df)
@@ -0,0 +1,79 @@
+"""Unit tests for reading and caching tables with PudlTabl."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy as sa
+
+from pudl.metadata.classes import Resource
+from pudl.output.pudltabl import PudlTabl
+
+TABLE_NAME = "core_eia860__assn_boiler_generator"
+
+
+@pytest.fixture()
+def bga_df() -> pd.DataFrame:
+    """Boiler generator associations spanning several years."""
+    return Resource.from_id(TABLE_NAME).format_df(
+        pd.DataFrame(
+            {
+                "plant_id_eia": [1, 1, 2, 2],
+                "report_date": pd.to_datetime(
+                    ["2019-01-01", "2020-01-01", "2021-01-01", "2022-01-01"]
+                ),
+                "generator_id": ["1", "1", "A", "A"],
+                "boiler_id": ["B1", "B1", "B2", "B2"],
+            }
+        )
+    )
+
+
+@pytest.fixture()
+def pudl_engine(tmp_path, bga_df) -> sa.Engine:
+    """A PUDL DB with just the boiler generator association table."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'pudl.sqlite'}")
+    bga_df.to_sql(TABLE_NAME, engine, index=False)
+    return engine
+
+
+def test_parquet_matches_db(tmp_path, pudl_engine, bga_df):
+    """Tables are read from Parquet if they're available, filtered by date."""
+    parquet_dir = tmp_path / "parquet"
+    parquet_dir.mkdir()
+    res = Resource.from_id(TABLE_NAME)
+    pq.write_table(
+        pa.Table.from_pandas(bga_df, schema=res.to_pyarrow(), preserve_index=False),
+        parquet_dir / f"{TABLE_NAME}.parquet",
+    )
+    kwargs = {"start_date": "2020-01-01", "end_date": "2021-12-31"}
+    from_db = PudlTabl(pudl_engine, parquet_dir=tmp_path, **kwargs).bga_eia860()
+    from_parquet = PudlTabl(pudl_engine, **kwargs).bga_eia860()
+    assert from_parquet.report_date.dt.year.tolist() == [2020, 2021]
+    pd.testing.assert_frame_equal(from_db, from_parquet)
+
+
+def test_tables_are_cached(mocker, pudl_engine):
+    """Tables are only read again if the dates change or they were evicted."""
+    read_sql = mocker.spy(pd, "read_sql")
+    pudl_out = PudlTabl(pudl_engine, max_cached_tables=1)
+    df = pudl_out.bga_eia860()
+    assert len(df) == 4
+    df.loc[:, "boiler_id"] = "modified"
+    pd.testing.assert_frame_equal(pudl_out.bga_eia860(), pudl_out.bga_eia860())
+    assert (pudl_out.bga_eia860().boiler_id != "modified").all()
+    assert read_sql.call_count == 1
+
+    pudl_out.bga_eia860(update=True)
+    assert read_sql.call_count == 2
+
+    pudl_out.start_date = pd.Timestamp("2021-01-01")
+    assert len(pudl_out.bga_eia860()) == 2
+    assert read_sql.call_count == 3
+    assert len(pudl_out._dfs) == 1
+
+    pudl_out = PudlTabl(pudl_engine, max_cached_tables=0)
+    pudl_out.bga_eia860()
+    pudl_out.bga_eia860()
+    assert read_sql.call_count == 5
+    assert not pudl_out._dfs
@@ -0,0 +1,53 @@
+"""Tests for harvesting the EIA entity tables."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.transform.eia import (
+    _consistent_value_positions,
+    _group_codes,
+    occurrence_consistency,
+)
+
+
+@pytest.mark.parametrize("strictness", [0.5, 0.7, 0.9])
+@pytest.mark.parametrize(
+    "cols_to_consit", [["plant_id_eia"], ["plant_id_eia", "report_date"]]
+)
+def test_consistent_value_positions_matches_occurrence_consistency(
+    strictness, cols_to_consit
+):
+    """The vectorized harvest finds the same consistent values."""
+    rng = np.random.default_rng(0)
+    compiled_df = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array(rng.integers(1, 50, 2000), dtype="Int64"),
+            "report_date": pd.to_datetime(rng.choice(["2020", "2021", None], 2000)),
+            "state": pd.array(
+                rng.choice(["CO", "CO", "CO", "UT", "nan", None], 2000), dtype="string"
+            ),
+        }
+    )
+    col_df = occurrence_consistency(
+        ["plant_id_eia"], compiled_df, "state", cols_to_consit, strictness=strictness
+    )
+    expected = (
+        col_df[col_df["state_is_consistent"]]
+        .drop_duplicates(subset=cols_to_consit)
+        .set_index(cols_to_consit)["state"]
+        .sort_index()
+    )
+
+    group_codes = _group_codes(compiled_df, cols_to_consit)
+    n_groups = group_codes.max() + 1
+    # Records without a report date aren't harvested
+    group_codes[compiled_df.report_date.isna()] = -1
+    positions, total = _consistent_value_positions(
+        group_codes, compiled_df["state"], n_groups, strictness, nan_strings=True
+    )
+    harvested = compiled_df.iloc[positions[positions >= 0]]
+    pd.testing.assert_series_equal(
+        harvested.set_index(cols_to_consit)["state"].sort_index(), expected
+    )
+    assert total == len(col_df.drop_duplicates(subset=cols_to_consit))
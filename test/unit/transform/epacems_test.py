@@ -1,6 +1,7 @@
 """Unit tests for the pudl.transform.epacems module."""
 
 import pandas as pd
+import pytest
 
 import pudl.transform.epacems as epacems
 
@@ -36,5 +37,59 @@ def test_harmonize_eia_epa_orispl():
             "plant_id_eia": [58697, 3, 10, 1111],
         }
     )
-    actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
+    lookups = epacems.build_lookups(
+        crosswalk_test_df, pd.DataFrame({"plant_id_eia": [], "timezone": []})
+    )
+    actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, lookups)
     pd.testing.assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+
+def test_build_lookups_one_to_many_crosswalk():
+    """The crosswalk may only map each EPA plant and unit to a single EIA plant."""
+    crosswalk_test_df = pd.DataFrame(
+        {
+            "plant_id_epa": [3, 3],
+            "plant_id_eia": [3, 4],
+            "emissions_unit_id_epa": ["1", "1"],
+        }
+    )
+    with pytest.raises(AssertionError, match="more than one plant_id_eia"):
+        epacems.build_lookups(
+            crosswalk_test_df, pd.DataFrame({"plant_id_eia": [], "timezone": []})
+        )
+
+
+def test_convert_to_utc():
+    """Local standard times are shifted by each plant's January UTC offset."""
+    plants_test_df = pd.DataFrame(
+        {
+            "plant_id_eia": [3, 10, 11],
+            "timezone": ["America/Chicago", "America/Los_Angeles", None],
+        }
+    )
+    lookups = epacems.build_lookups(
+        pd.DataFrame(
+            {"plant_id_epa": [], "plant_id_eia": [], "emissions_unit_id_epa": []}
+        ),
+        plants_test_df,
+    )
+    cems_test_df = pd.DataFrame(
+        {
+            "plant_id_eia": [3, 10, 3],
+            "op_date": ["2022-01-01", "2022-07-01", "2022-12-31"],
+            "op_hour": [0, 5, 23],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "plant_id_eia": [3, 10, 3],
+            "operating_datetime_utc": pd.to_datetime(
+                ["2022-01-01 06:00", "2022-07-01 13:00", "2023-01-01 05:00"]
+            ),
+        }
+    )
+    actual_df = epacems.convert_to_utc(cems_test_df, lookups)
+    pd.testing.assert_frame_equal(expected_df, actual_df)
+
+    with pytest.raises(ValueError, match=r"missing for these: \[11\]"):
+        epacems.convert_to_utc(cems_test_df.assign(plant_id_eia=11), lookups)
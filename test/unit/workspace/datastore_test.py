@@ -1,14 +1,22 @@
 """Unit tests for Datastore module."""
 
+import hashlib
+import http.server
+import io
 import json
 import re
+import threading
 import unittest
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
+import pytest
 import responses
 
 from pudl.workspace import datastore
-from pudl.workspace.resource_cache import PudlResourceKey
+from pudl.workspace.resource_cache import LocalFileCache, PudlResourceKey
 
 
 def _make_resource(name: str, **partitions) -> dict[str, Any]:
@@ -335,4 +343,161 @@ class TestZenodoFetcher(unittest.TestCase):
         self.assertRaises(KeyError, self.fetcher.get_resource, res)
 
 
+@pytest.fixture
+def zenodo_stand_in() -> Iterator[tuple[str, dict[str, bytes]]]:
+    """Serve files from a local HTTP server standing in for Zenodo.
+
+    Yields the base URL of the server and a dictionary mapping file names to the
+    content that should be served for them.
+    """
+    files: dict[str, bytes] = {}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            content = files.get(self.path.lstrip("/"))
+            if content is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", files
+    server.shutdown()
+    server.server_close()
+
+
+def _stand_in_datastore(
+    tmp_path: Path, base_url: str, contents: dict[str, bytes], **hashes: str
+) -> datastore.Datastore:
+    """Build a Datastore whose epacems resources are served from base_url."""
+    doi = datastore.ZenodoDoiSettings().epacems
+    descriptor = datastore.DatapackageDescriptor(
+        {
+            "resources": [
+                {
+                    "name": name,
+                    "path": f"{base_url}/{name}",
+                    "hash": hashes.get(name, hashlib.md5(content).hexdigest()),  # noqa: S324
+                    "parts": {"year": year},
+                }
+                for year, (name, content) in enumerate(contents.items(), start=2020)
+            ]
+        },
+        dataset="epacems",
+        doi=doi,
+    )
+    dstore = datastore.Datastore(local_cache_path=tmp_path / "cache")
+    dstore._zenodo_fetcher = MockableZenodoFetcher(descriptors={doi: descriptor})
+    return dstore
+
+
+def test_prefetch_downloads_concurrently(tmp_path, zenodo_stand_in):
+    """Matching resources are streamed into the local cache, and only fetched once."""
+    base_url, files = zenodo_stand_in
+    files |= {
+        "first.zip": b"first" * 100_000,
+        "second.zip": b"second" * 100_000,
+        "third.zip": b"third",
+    }
+    dstore = _stand_in_datastore(tmp_path, base_url, files)
+
+    fetched = dstore.prefetch(["epacems"], max_workers=2)
+    assert sorted(res.name for res in fetched) == sorted(files)
+    for res in fetched:
+        assert dstore._cache.get(res) == files[res.name]
+    # No staging files are left behind next to the cache.
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == ["epacems"]
+
+    files.clear()
+    assert dstore.prefetch(["epacems"]) == []
+
+
+def test_prefetch_with_filters(tmp_path, zenodo_stand_in):
+    """Only the resources matching the partition filters are prefetched."""
+    base_url, files = zenodo_stand_in
+    files |= {"first.zip": b"first", "second.zip": b"second"}
+    dstore = _stand_in_datastore(tmp_path, base_url, files)
+
+    fetched = dstore.prefetch(["epacems"], year=2021)
+    assert [res.name for res in fetched] == ["second.zip"]
+
+
+def test_prefetch_checksum_mismatch(tmp_path, zenodo_stand_in):
+    """Resources with bad checksums are not added to the cache."""
+    base_url, files = zenodo_stand_in
+    files |= {"first.zip": b"first", "second.zip": b"second"}
+    dstore = _stand_in_datastore(
+        tmp_path, base_url, files, **{"second.zip": "not-the-right-md5"}
+    )
+
+    with pytest.raises(datastore.ChecksumMismatchError):
+        dstore.prefetch(["epacems"])
+    desc = dstore.get_datapackage_descriptor("epacems")
+    assert [dstore._cache.contains(res) for res in desc.get_resources()] == [
+        True,
+        False,
+    ]
+
+
+def test_download_resource_streams_in_chunks(tmp_path, zenodo_stand_in):
+    """Resources are downloaded to a file, with the checksum computed on the fly."""
+    base_url, files = zenodo_stand_in
+    files["first.zip"] = bytes(range(256)) * 1000
+    dstore = _stand_in_datastore(tmp_path, base_url, files)
+    res = next(dstore.get_datapackage_descriptor("epacems").get_resources())
+
+    path = tmp_path / "first.zip"
+    dstore._zenodo_fetcher.download_resource(res, path, chunk_size=1000)
+    assert path.read_bytes() == files["first.zip"]
+
+
+def _zip_bytes(**members: str) -> bytes:
+    """Returns the bytes of a zip archive containing the given members."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_get_zipfile_resource_opens_cached_file(tmp_path, zenodo_stand_in):
+    """Zip archives in the local cache are opened from disk, not read into memory."""
+    base_url, files = zenodo_stand_in
+    files |= {"first.zip": _zip_bytes(a="first"), "second.zip": _zip_bytes(b="second")}
+    dstore = _stand_in_datastore(tmp_path, base_url, files)
+
+    # The first access downloads the archive into the cache and opens it from there.
+    with dstore.get_zipfile_resource("epacems", year=2020) as zf:
+        assert zf.read("a") == b"first"
+        assert Path(zf.filename).parent.parent == tmp_path / "cache" / "epacems"
+    files.clear()
+    with dstore.get_zipfile_resource("epacems", year=2020) as zf:
+        assert zf.read("a") == b"first"
+    with pytest.raises(KeyError, match="Multiple resources"):
+        dstore.get_zipfile_resource("epacems")
+
+
+def test_checksum_verified_when_copied_between_layers(tmp_path, zenodo_stand_in):
+    """Resources copied from another cache layer are verified before being added."""
+    base_url, files = zenodo_stand_in
+    files |= {"first.zip": _zip_bytes(a="first")}
+    dstore = _stand_in_datastore(tmp_path, base_url, files)
+    res = next(dstore.get_datapackage_descriptor("epacems").get_resources())
+    remote_cache = LocalFileCache(tmp_path / "remote")
+    remote_cache.add(res, b"corrupted")
+    dstore._cache.add_cache_layer(remote_cache)
+
+    with pytest.raises(datastore.ChecksumMismatchError):
+        dstore.get_unique_resource("epacems", year=2020)
+    assert not (tmp_path / "cache" / res.get_local_path()).exists()
+
+
 # TODO(rousik): add unit tests for Datasource class as well
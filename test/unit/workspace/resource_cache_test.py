@@ -1,9 +1,11 @@
 """Unit tests for resource_cache."""
 
+import pickle
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import requests.exceptions as requests_exceptions
 from google.api_core.exceptions import BadRequest
@@ -28,6 +30,16 @@ class TestGoogleCloudStorageCache(unittest.TestCase):
         self.assertTrue(bad_request_predicate(requests_exceptions.Timeout()))
         self.assertTrue(bad_request_predicate(BadRequest(message="Bad request!")))
 
+    @mock.patch.object(resource_cache.GoogleCloudStorageCache, "_get_bucket")
+    def test_pickle_reconnects_to_bucket(self, get_bucket):
+        """Pickled caches connect to the bucket again instead of copying the client."""
+        get_bucket.side_effect = lambda name: f"connection to {name}"
+        cache = resource_cache.GoogleCloudStorageCache("gs://bucket/prefix")
+        unpickled = pickle.loads(pickle.dumps(cache))  # noqa: S301
+        self.assertEqual(unpickled._path_prefix, Path("/prefix"))
+        self.assertEqual(unpickled._bucket, "connection to bucket")
+        self.assertEqual(get_bucket.call_count, 2)
+
 
 class TestLocalFileCache(unittest.TestCase):
     """Unit tests for the LocalFileCache class."""
@@ -49,6 +61,15 @@ class TestLocalFileCache(unittest.TestCase):
         self.assertTrue(self.cache.contains(res))
         self.assertEqual(b"blah", self.cache.get(res))
 
+    def test_add_file(self):
+        """Adding a resource from a file moves that file into the cache."""
+        res = PudlResourceKey("ds", "doi", "file.txt")
+        path = Path(self.test_dir) / "download.tmp"
+        path.write_bytes(b"blah")
+        self.cache.add_file(res, path)
+        self.assertFalse(path.exists())
+        self.assertEqual(b"blah", self.cache.get(res))
+
     def test_that_two_cache_objects_share_storage(self):
         """Two LocalFileCache instances with the same path share the object storage."""
         second_cache = resource_cache.LocalFileCache(Path(self.test_dir))
@@ -123,6 +144,20 @@ class TestLayeredCache(unittest.TestCase):
         self.assertTrue(self.cache_1.contains(res))
         self.assertFalse(self.cache_2.contains(res))
 
+    def test_get_path_uses_innermost_layer(self):
+        """Local path is returned from the leftmost layer that contains the resource."""
+        res = PudlResourceKey("a", "b", "x.txt")
+        self.layered_cache.add_cache_layer(self.cache_1)
+        self.layered_cache.add_cache_layer(self.cache_2)
+        self.assertIsNone(self.layered_cache.get_path(res))
+        self.cache_2.add(res, b"secondLayer")
+        self.assertEqual(
+            Path(self.test_dir_2) / "a" / "b" / "x.txt",
+            self.layered_cache.get_path(res),
+        )
+        self.cache_1.add(res, b"firstLayer")
+        self.assertEqual(b"firstLayer", self.layered_cache.get_path(res).read_bytes())
+
     def test_get_uses_innermost_layer(self):
         """Resource is retrieved from the leftmost layer that contains it."""
         res = PudlResourceKey("a", "b", "x.txt")